@@ -1,5 +1,14 @@
 """Inspire CLI - Command-line interface for the Inspire training platform."""
 
-from inspire.cli.main import main
-
 __all__ = ["main"]
+
+
+def __getattr__(name: str):
+    # Resolve ``main`` on first access so importing a submodule such as
+    # ``inspire.cli.utils.config`` does not load every command module.
+    if name == "main":
+        from inspire.cli.main import main
+
+        globals()["main"] = main
+        return main
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -149,7 +149,7 @@ def create(
 
             # Use accurate browser API for resource selection
             best = find_best_compute_group_accurate(
-                gpu_type=requested_gpu_type.value,
+                gpu_type=requested_gpu_type,
                 min_gpus=requested_gpu_count,
                 include_preemptible=True,  # Count low-priority GPUs as available
                 instance_count=nodes,
@@ -159,7 +159,8 @@ def create(
                 _handle_error(
                     ctx,
                     "InsufficientResources",
-                    f"No {requested_gpu_type.value} compute group has at least {requested_gpu_count} available GPUs",
+                    f"No {requested_gpu_type} compute group has at least "
+                    f"{requested_gpu_count} available GPUs",
                     EXIT_VALIDATION_ERROR,
                 )
                 return
@@ -22,7 +22,11 @@ from inspire.cli.utils.resources import (
 )
 from inspire.cli.utils.web_session import SessionExpiredError, get_web_session
 from inspire.cli.formatters import json_formatter, human_formatter
-from inspire.compute_groups import load_compute_groups_from_config, compute_group_name_map
+from inspire.compute_groups import (
+    compute_group_name_map,
+    load_compute_groups_from_config,
+    resolve_group_name,
+)
 from inspire.cli.utils.config import Config
 
 
@@ -148,7 +152,11 @@ def list_nodes(ctx: Context, group: str):
         filtered: list[dict] = []
         group_lower = (group or "").lower()
         for c in counts:
-            name = c.group_name or KNOWN_COMPUTE_GROUPS.get(c.group_id, c.group_id[-12:])
+            name = (
+                c.group_name
+                or resolve_group_name(c.group_id, KNOWN_COMPUTE_GROUPS)
+                or c.group_id[-12:]
+            )
             if group_lower and group_lower not in name.lower():
                 continue
             # Use accurate available GPUs if available, otherwise fall back to computed
@@ -242,7 +250,7 @@ def _list_accurate_resources(ctx: Context, show_all: bool) -> None:
             availability = [a for a in availability if a.group_id in known_groups]
             for entry in availability:
                 if not entry.group_name:
-                    entry.group_name = known_groups.get(entry.group_id, entry.group_name)
+                    entry.group_name = resolve_group_name(entry.group_id, known_groups)
 
         if not availability:
             if ctx.json_output:
@@ -533,7 +541,7 @@ def _watch_resources(
                         availability = [a for a in availability if a.group_id in known_groups]
                         for entry in availability:
                             if not entry.group_name:
-                                entry.group_name = known_groups.get(entry.group_id, entry.group_name)
+                                entry.group_name = resolve_group_name(entry.group_id, known_groups)
             except (SessionExpiredError, ValueError) as e:
                 api_logger.setLevel(original_level)
                 click.echo(human_formatter.format_error(str(e)), err=True)
@@ -23,6 +23,7 @@ from inspire.cli.utils.tunnel import (
     save_tunnel_config,
     get_tunnel_status,
     is_tunnel_available,
+    close_ssh_master,
 )
 
 
@@ -56,16 +57,18 @@ def tunnel() -> None:
 
 @tunnel.command("status")
 @click.option("--bridge", "-b", help="Check specific bridge (shows all if not specified)")
+@click.option("--all", "check_all", is_flag=True, help="Test SSH connectivity of every bridge")
 @pass_context
-def tunnel_status(ctx: Context, bridge: str) -> None:
+def tunnel_status(ctx: Context, bridge: str, check_all: bool) -> None:
     """Check tunnel configuration and SSH connectivity.
 
     \b
     Examples:
         inspire tunnel status          # Show all bridges
         inspire tunnel status -b mybridge
+        inspire tunnel status --all    # Test every bridge in parallel
     """
-    status = get_tunnel_status(bridge_name=bridge)
+    status = get_tunnel_status(bridge_name=bridge, check_all=check_all)
 
     if ctx.json_output:
         click.echo(json_formatter.format_json(status))
@@ -85,6 +88,14 @@ def tunnel_status(ctx: Context, bridge: str) -> None:
     click.echo(f"rtunnel: {status['rtunnel_path'] or '(not installed)'}")
     click.echo("")
 
+    if check_all and status.get("bridge_status"):
+        for name, ssh_works in status["bridge_status"].items():
+            if ssh_works:
+                click.echo(f"  {name}: " + human_formatter.format_success("Connected"))
+            else:
+                click.echo(f"  {name}: " + human_formatter.format_warning("Not responding"))
+        click.echo("")
+
     if bridge or status["bridge_name"]:
         # Single bridge status
         bridge_name = bridge or status["bridge_name"]
@@ -123,7 +134,7 @@ def tunnel_status(ctx: Context, bridge: str) -> None:
             click.echo("  inspire tunnel status -b <name>")
             click.echo("")
             # Quick test of default bridge
-            if status["default_bridge"]:
+            if status["default_bridge"] and not check_all:
                 default_status = get_tunnel_status(bridge_name=status["default_bridge"])
                 if default_status["ssh_works"]:
                     click.echo(f"Default bridge ({status['default_bridge']}): " +
@@ -242,6 +253,7 @@ def tunnel_remove(ctx: Context, name: str) -> None:
         sys.exit(EXIT_CONFIG_ERROR)
 
     was_default = (name == config.default_bridge)
+    close_ssh_master(bridge_name=name, config=config)
     config.remove_bridge(name)
     save_tunnel_config(config)
 
@@ -21,6 +21,8 @@ import time
 from dataclasses import dataclass
 from typing import Any, Optional
 
+from inspire.compute_groups import save_group_meta
+
 from .web_session import (
     get_web_session,
     WebSession,
@@ -440,6 +442,9 @@ def get_accurate_gpu_availability(
             )
         )
 
+    save_group_meta(
+        {r.group_id: {"group_name": r.group_name, "gpu_type": r.gpu_type} for r in results}
+    )
     return results
 
 
@@ -608,6 +613,7 @@ def get_full_free_node_counts(
         session = get_web_session()
 
     results: list[FullFreeNodeCount] = []
+    group_meta: dict[str, dict[str, str]] = {}
 
     try:
         for gid in group_ids:
@@ -636,10 +642,13 @@ def get_full_free_node_counts(
             ready_nodes = 0
             full_free_nodes = 0
             group_name = ""
+            gpu_type = ""
 
             for n in nodes:
                 if not group_name:
                     group_name = n.get("logic_compute_group_name", "") or ""
+                if not gpu_type:
+                    gpu_type = (n.get("gpu_info") or {}).get("gpu_type_display", "") or ""
 
                 status = (n.get("status") or "").upper()
                 if status == "READY":
@@ -660,6 +669,7 @@ def get_full_free_node_counts(
                     full_free_nodes=full_free_nodes,
                 )
             )
+            group_meta[gid] = {"group_name": group_name, "gpu_type": gpu_type}
 
     except SessionExpiredError:
         if _retry:
@@ -672,6 +682,7 @@ def get_full_free_node_counts(
             )
         raise
 
+    save_group_meta(group_meta)
     results.sort(key=lambda r: r.full_free_nodes, reverse=True)
     return results
 
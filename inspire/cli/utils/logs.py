@@ -3,8 +3,10 @@
 Handles reading logs from the shared filesystem.
 """
 
+import fnmatch
 import glob
 import os
+import re
 import time
 from pathlib import Path
 from typing import Callable, Iterator, List, Optional
@@ -15,6 +17,26 @@ class LogNotFoundError(Exception):
     pass
 
 
+def _compile_name_matcher(pattern: str) -> Callable[[str], bool]:
+    """Build a filename matcher for a glob pattern.
+
+    Patterns of the form ``prefix*suffix`` (like the default
+    ``training_master_*.log``) are matched with plain string checks;
+    anything else falls back to a compiled fnmatch regex.
+    """
+    if pattern.count("*") == 1 and not any(c in pattern for c in "?[/"):
+        prefix, suffix = pattern.split("*")
+        min_len = len(prefix) + len(suffix)
+
+        def match(name: str) -> bool:
+            return len(name) >= min_len and name.startswith(prefix) and name.endswith(suffix)
+
+        return match
+
+    regex = re.compile(fnmatch.translate(pattern))
+    return lambda name: regex.match(name) is not None
+
+
 class LogReader:
     """Read and stream log files from the shared filesystem."""
 
@@ -27,6 +49,29 @@ class LogReader:
         """
         self.target_dir = Path(target_dir)
         self.pattern = pattern
+        self._match = _compile_name_matcher(pattern)
+
+    def _iter_matches(self) -> Iterator[str]:
+        """Walk target_dir and yield file paths whose name matches the pattern.
+
+        Mirrors ``glob("**/<pattern>", recursive=True)``: hidden directories
+        are skipped and hidden files only match dot-prefixed patterns.
+        Directory symlinks are followed, but each directory is walked once so
+        a symlink loop cannot recurse forever.
+        """
+        match = self._match
+        include_hidden = self.pattern.startswith(".")
+        visited = set()
+        for dirpath, dirnames, filenames in os.walk(self.target_dir, followlinks=True):
+            st = os.stat(dirpath)
+            if (st.st_dev, st.st_ino) in visited:
+                dirnames[:] = []
+                continue
+            visited.add((st.st_dev, st.st_ino))
+            dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+            for name in filenames:
+                if match(name) and (include_hidden or not name.startswith(".")):
+                    yield os.path.join(dirpath, name)
 
     def find_logs(self, job_id: Optional[str] = None) -> List[Path]:
         """Find log files matching pattern.
@@ -38,8 +83,11 @@ class LogReader:
             List of matching log file paths, sorted by mtime (newest first)
         """
         # Search for logs in target directory
-        search_pattern = str(self.target_dir / "**" / self.pattern)
-        matches = glob.glob(search_pattern, recursive=True)
+        if "/" in self.pattern:
+            search_pattern = str(self.target_dir / "**" / self.pattern)
+            matches = glob.glob(search_pattern, recursive=True)
+        else:
+            matches = list(self._iter_matches())
 
         # Convert to Path objects
         paths = [Path(m) for m in matches]
@@ -101,6 +149,8 @@ class LogReader:
         """
         if not log_path.exists():
             raise LogNotFoundError(f"Log file not found: {log_path}")
+        if lines <= 0:
+            return []
 
         # Read from end efficiently
         with open(log_path, "rb") as f:
@@ -125,13 +175,14 @@ class LogReader:
                 f.seek(pos)
                 blocks.append(f.read(read_size))
 
-            # Combine and decode
+            # Cut the last N newline-terminated lines as bytes so only that tail
+            # is decoded; splitlines() then also breaks on bare "\r" (progress
+            # bars) and the other separators.
             content = b"".join(reversed(blocks))
-            text = content.decode("utf-8", errors="replace")
-
-            # Split and return last N lines
-            all_lines = text.splitlines()
-            return all_lines[-lines:]
+            if content.endswith(b"\n"):
+                content = content[:-1]
+            tail = b"\n".join(content.rsplit(b"\n", lines)[-lines:])
+            return tail.decode("utf-8", errors="replace").splitlines()[-lines:]
 
     def follow(
         self,
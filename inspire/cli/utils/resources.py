@@ -9,12 +9,17 @@ from __future__ import annotations
 import os
 import time
 from dataclasses import dataclass
-from typing import Callable, Optional
+from typing import Callable, Mapping, Optional
 from enum import Enum
 
 from inspire.cli.utils.config import Config
 from inspire.cli.utils.web_session import get_web_session, fetch_workspace_availability
-from inspire.compute_groups import compute_group_name_map, load_compute_groups_from_config
+from inspire.compute_groups import (
+    compute_group_name_map,
+    load_compute_groups_from_config,
+    resolve_group_name,
+    save_group_meta,
+)
 
 
 class GPUType(Enum):
@@ -42,7 +47,7 @@ class ComputeGroupAvailability:
 # Known compute groups for smart allocation
 # Only these groups will be used for auto-selection
 # Will be initialized on first use from config
-KNOWN_COMPUTE_GROUPS: dict[str, str] = {}
+KNOWN_COMPUTE_GROUPS: Mapping[str, str] = {}
 
 
 # Cache for availability data
@@ -87,7 +92,7 @@ def fetch_resource_availability(
     global _availability_cache, _cache_time, KNOWN_COMPUTE_GROUPS
 
     # Load known compute groups from config
-    known_groups_map: dict[str, str] = {}
+    known_groups_map: Mapping[str, str] = {}
     if config is not None and hasattr(config, "compute_groups"):
         compute_groups_tuples = load_compute_groups_from_config(config.compute_groups)
         known_groups_map = compute_group_name_map(compute_groups_tuples)
@@ -110,6 +115,7 @@ def fetch_resource_availability(
     nodes = fetch_workspace_availability(session, base_url=base_url)
 
     groups: dict[str, dict] = {}
+    group_meta: dict[str, dict[str, str]] = {}
     total = len(nodes)
 
     for idx, node in enumerate(nodes):
@@ -134,8 +140,9 @@ def fetch_resource_availability(
             gpu_type = _normalize_gpu_type(gpu_display)
 
             group_name = node.get("logic_compute_group_name", "")
+            group_meta[group_id] = {"group_name": group_name, "gpu_type": gpu_display}
             if not group_name and group_id in known_groups_map:
-                group_name = known_groups_map[group_id]
+                group_name = resolve_group_name(group_id, known_groups_map)
             if not group_name:
                 group_name = "Unknown"
 
@@ -170,6 +177,8 @@ def fetch_resource_availability(
             if not task_list or len(task_list) == 0:
                 groups[group_id]["free_nodes"] += 1
 
+    save_group_meta(group_meta)
+
     # Convert to ComputeGroupAvailability objects
     availability_list = []
     for group_data in groups.values():
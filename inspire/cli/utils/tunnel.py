@@ -6,14 +6,38 @@ Provides functions to:
 - Manage tunnel configuration with multiple bridge profiles
 """
 
+import functools
+import hashlib
 import json
 import os
+import re
+import shlex
+import stat
 import subprocess
+import tempfile
 import time
-from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Optional
 
+try:
+    import orjson
+
+    def _json_loads(data: bytes):
+        return orjson.loads(data)
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+except ImportError:  # orjson is optional
+
+    def _json_loads(data: bytes):
+        return json.loads(data)
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
 
 class TunnelError(Exception):
     """Base exception for tunnel-related errors."""
@@ -30,6 +54,21 @@ class BridgeNotFoundError(TunnelError):
 # Default configuration
 DEFAULT_SSH_USER = "root"
 DEFAULT_SSH_PORT = 22222
+# How long an idle multiplexed SSH master connection is kept alive
+SSH_CONTROL_PERSIST = "60s"
+# ssh options that are identical for every bridge connection
+_SSH_STATIC_OPTS = (
+    "-o", "StrictHostKeyChecking=no",
+    "-o", "UserKnownHostsFile=/dev/null",
+    "-o", "LogLevel=ERROR",
+)
+_SSH_CONTROL_OPTS = (
+    "-o", "ControlMaster=auto",
+    "-o", f"ControlPersist={SSH_CONTROL_PERSIST}",
+)
+# Seconds a successful is_tunnel_available() check is trusted
+# (override with INSPIRE_TUNNEL_HEALTH_TTL)
+DEFAULT_TUNNEL_HEALTH_TTL = 15.0
 # nightly release includes stdio:// mode for SSH ProxyCommand support
 DEFAULT_RTUNNEL_DOWNLOAD_URL = "https://github.com/Sarfflow/rtunnel/releases/download/nightly/rtunnel-linux-amd64.tar.gz"
 
@@ -61,7 +100,7 @@ def _get_rtunnel_download_url() -> str:
     return DEFAULT_RTUNNEL_DOWNLOAD_URL
 
 
-@dataclass
+@dataclass(slots=True)
 class BridgeProfile:
     """A single bridge configuration."""
 
@@ -88,7 +127,7 @@ class BridgeProfile:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class TunnelConfig:
     """Tunnel configuration with multiple bridge profiles."""
 
@@ -139,44 +178,83 @@ class TunnelConfig:
         return list(self.bridges.values())
 
 
+# Directories already known to exist in this process
+_CREATED_DIRS: set[Path] = set()
+
+
+def _ensure_dir(path: Path, mode: int = 0o777) -> None:
+    """Create a directory (and parents) unless this process already did."""
+    if path in _CREATED_DIRS:
+        return
+    if not path.is_dir():
+        path.mkdir(mode=mode, parents=True, exist_ok=True)
+    _CREATED_DIRS.add(path)
+
+
+# KEY=value assignments of interest in the legacy ~/.inspire/tunnel.conf
+_LEGACY_CONFIG_RE = re.compile(
+    rb"^[ \t]*(PROXY_URL|SSH_USER)[ \t]*=[ \t]*(.*?)[ \t\r]*$", re.MULTILINE
+)
+
+# Parsed bridges.json keyed by path: (st_mtime_ns, st_size, config)
+_CONFIG_CACHE: dict[Path, tuple[int, int, TunnelConfig]] = {}
+
+
+def _invalidate_config_cache() -> None:
+    """Drop cached tunnel configs so the next load re-reads bridges.json."""
+    _CONFIG_CACHE.clear()
+
+
+def _copy_config(config: TunnelConfig) -> TunnelConfig:
+    """Return a copy whose bridges dict can be mutated without touching the cache."""
+    return replace(config, bridges=dict(config.bridges))
+
+
 def load_tunnel_config(config_dir: Optional[Path] = None) -> TunnelConfig:
-    """Load tunnel configuration from ~/.inspire/bridges.json."""
+    """Load tunnel configuration from ~/.inspire/bridges.json.
+
+    Results are cached per file and reused while its mtime and size are
+    unchanged.
+    """
     config = TunnelConfig()
     if config_dir:
         config.config_dir = config_dir
 
-    config.config_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(config.config_dir)
+
+    config_file = config.config_file
+    try:
+        st = os.stat(config_file)
+    except FileNotFoundError:
+        st = None
 
     # Try new JSON format first
-    if config.config_file.exists():
+    if st is not None:
+        cached = _CONFIG_CACHE.get(config_file)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return _copy_config(cached[2])
+
         try:
-            with open(config.config_file) as f:
-                data = json.load(f)
-                config.default_bridge = data.get("default")
-                for bridge_data in data.get("bridges", []):
-                    profile = BridgeProfile.from_dict(bridge_data)
-                    config.bridges[profile.name] = profile
-        except (json.JSONDecodeError, KeyError):
+            data = _json_loads(config_file.read_bytes())
+            config.default_bridge = data.get("default")
+            for bridge_data in data.get("bridges", []):
+                profile = BridgeProfile.from_dict(bridge_data)
+                config.bridges[profile.name] = profile
+        except (ValueError, KeyError):
             pass
 
+        if config.bridges:
+            _CONFIG_CACHE[config_file] = (st.st_mtime_ns, st.st_size, _copy_config(config))
+
     # Migrate from old format if new format is empty
     old_config_file = config.config_dir / "tunnel.conf"
     if not config.bridges and old_config_file.exists():
-        proxy_url = None
-        ssh_user = DEFAULT_SSH_USER
-        with open(old_config_file) as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith("#"):
-                    continue
-                if "=" in line:
-                    key, value = line.split("=", 1)
-                    key = key.strip()
-                    value = value.strip().strip('"').strip("'")
-                    if key == "PROXY_URL":
-                        proxy_url = value
-                    elif key == "SSH_USER":
-                        ssh_user = value
+        values = {
+            key: value.decode("utf-8", errors="replace").strip('"').strip("'")
+            for key, value in _LEGACY_CONFIG_RE.findall(old_config_file.read_bytes())
+        }
+        proxy_url = values.get(b"PROXY_URL")
+        ssh_user = values.get(b"SSH_USER", DEFAULT_SSH_USER)
 
         if proxy_url:
             # Create a default bridge from old config
@@ -194,16 +272,47 @@ def load_tunnel_config(config_dir: Optional[Path] = None) -> TunnelConfig:
 
 def save_tunnel_config(config: TunnelConfig) -> None:
     """Save tunnel configuration to ~/.inspire/bridges.json."""
-    config.config_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(config.config_dir)
 
     data = {
         "default": config.default_bridge,
         "bridges": [p.to_dict() for p in config.bridges.values()],
     }
 
-    with open(config.config_file, "w") as f:
-        json.dump(data, f, indent=2)
-        f.write("\n")
+    config.config_file.write_bytes(_json_dumps(data) + b"\n")
+
+    _invalidate_config_cache()
+    _AVAILABLE_CACHE.clear()
+
+
+# (http prefix, websocket prefix, prefix length) for proxy URL rewriting
+_WS_SCHEME_MAP = (
+    ("https://", "wss://", len("https://")),
+    ("http://", "ws://", len("http://")),
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _url_to_ws(proxy_url: str) -> str:
+    """Convert an http(s):// proxy URL to the ws(s):// URL rtunnel expects."""
+    for prefix, ws_prefix, prefix_len in _WS_SCHEME_MAP:
+        if proxy_url.startswith(prefix):
+            return ws_prefix + proxy_url[prefix_len:]
+    return proxy_url
+
+
+@functools.lru_cache(maxsize=32)
+def _build_proxy_command(ws_url: str, rtunnel_bin: str, quiet: bool) -> str:
+    """Build (and memoize) the ProxyCommand string for a websocket URL."""
+    # ProxyCommand is executed by a shell on the client; quote the URL because it
+    # can contain characters like '?' (e.g. token query params) that some shells
+    # treat as glob patterns.
+    if quiet:
+        # Wrap in sh -c to redirect stderr, suppressing rtunnel's verbose output
+        cmd = f"{rtunnel_bin} {shlex.quote(ws_url)} stdio://%h:%p 2>/dev/null"
+        return f"sh -c {shlex.quote(cmd)}"
+    else:
+        return f"{shlex.quote(rtunnel_bin)} {shlex.quote(ws_url)} {shlex.quote('stdio://%h:%p')}"
 
 
 def _get_proxy_command(bridge: BridgeProfile, rtunnel_bin: Path, quiet: bool = False) -> str:
@@ -217,32 +326,132 @@ def _get_proxy_command(bridge: BridgeProfile, rtunnel_bin: Path, quiet: bool = F
     Returns:
         ProxyCommand string for SSH -o option
     """
-    import shlex
-
-    # Convert https:// URL to wss:// for websocket
-    proxy_url = bridge.proxy_url
-    if proxy_url.startswith("https://"):
-        ws_url = "wss://" + proxy_url[8:]
-    elif proxy_url.startswith("http://"):
-        ws_url = "ws://" + proxy_url[7:]
-    else:
-        ws_url = proxy_url
+    return _build_proxy_command(_url_to_ws(bridge.proxy_url), str(rtunnel_bin), quiet)
 
-    # ProxyCommand is executed by a shell on the client; quote the URL because it
-    # can contain characters like '?' (e.g. token query params) that some shells
-    # treat as glob patterns.
-    if quiet:
-        # Wrap in sh -c to redirect stderr, suppressing rtunnel's verbose output
-        cmd = f"{rtunnel_bin} {shlex.quote(ws_url)} stdio://%h:%p 2>/dev/null"
-        return f"sh -c {shlex.quote(cmd)}"
-    else:
-        return f"{shlex.quote(str(rtunnel_bin))} {shlex.quote(ws_url)} {shlex.quote('stdio://%h:%p')}"
+
+def _ssh_control_path(bridge: BridgeProfile, config: TunnelConfig) -> Path:
+    """Get the ControlMaster socket path for a bridge.
+
+    The name is derived from the full bridge profile so that a changed proxy
+    URL never reuses a master connection opened for the old one, and stays
+    short enough for the unix socket path limit.
+    """
+    key = f"{bridge.name}|{bridge.proxy_url}|{bridge.ssh_user}|{bridge.ssh_port}"
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+    return config.config_dir / "ssh" / f"cm-{digest}"
+
+
+def _ssh_base_opts(bridge: BridgeProfile, config: TunnelConfig) -> list[str]:
+    """Build the ssh options shared by every connection to a bridge.
+
+    Connections are multiplexed over a persistent ControlMaster so that
+    subsequent commands skip the rtunnel/websocket and SSH handshakes.
+    """
+    if os.name == "nt":
+        # Windows OpenSSH does not support connection multiplexing
+        return list(_SSH_STATIC_OPTS)
+
+    control_path = _ssh_control_path(bridge, config)
+    _ensure_dir(control_path.parent, mode=0o700)
+    return [
+        *_SSH_CONTROL_OPTS,
+        "-o", f"ControlPath={control_path}",
+        *_SSH_STATIC_OPTS,
+    ]
+
+
+def _build_ssh_argv(
+    bridge: BridgeProfile,
+    config: TunnelConfig,
+    proxy_cmd: str,
+    *,
+    extra_opts: tuple[str, ...] = (),
+    remote_cmd: Optional[str] = None,
+) -> list[str]:
+    """Build the full ssh argv for connecting to a bridge via ProxyCommand.
+
+    Args:
+        bridge: Bridge profile to connect to
+        config: Tunnel configuration (for the ControlMaster socket dir)
+        proxy_cmd: ProxyCommand string from _get_proxy_command
+        extra_opts: Additional ssh options placed before the destination
+        remote_cmd: Optional command to run (None for interactive shell)
+
+    Returns:
+        List of command arguments for subprocess
+    """
+    argv = [
+        "ssh",
+        *_ssh_base_opts(bridge, config),
+        *extra_opts,
+        "-o", f"ProxyCommand={proxy_cmd}",
+        "-p", str(bridge.ssh_port),
+        f"{bridge.ssh_user}@localhost",
+    ]
+    if remote_cmd:
+        argv.append(remote_cmd)
+    return argv
+
+
+def _require_bridge(config: TunnelConfig, bridge_name: Optional[str]) -> BridgeProfile:
+    """Resolve a bridge profile or raise a descriptive tunnel error."""
+    bridge = config.get_bridge(bridge_name)
+    if not bridge:
+        if bridge_name:
+            raise BridgeNotFoundError(f"Bridge '{bridge_name}' not found")
+        raise TunnelNotAvailableError(
+            "No bridge configured. Run 'inspire tunnel add <name> <url>' first."
+        )
+    return bridge
+
+
+def close_ssh_master(
+    bridge_name: Optional[str] = None,
+    config: Optional[TunnelConfig] = None,
+) -> bool:
+    """Stop the multiplexed SSH master connection for a bridge, if any.
+
+    Args:
+        bridge_name: Name of bridge (uses default if None)
+        config: Tunnel configuration (loads default if None)
+
+    Returns:
+        True if a running master was told to exit, False otherwise
+    """
+    if config is None:
+        config = load_tunnel_config()
+
+    bridge = config.get_bridge(bridge_name)
+    if not bridge or os.name == "nt":
+        return False
+
+    control_path = _ssh_control_path(bridge, config)
+    if not control_path.exists():
+        return False
+
+    try:
+        result = subprocess.run(
+            [
+                "ssh",
+                "-o", f"ControlPath={control_path}",
+                "-O", "exit",
+                "-p", str(bridge.ssh_port),
+                f"{bridge.ssh_user}@localhost",
+            ],
+            capture_output=True,
+            timeout=10,
+        )
+        return result.returncode == 0
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return False
 
 
 def _test_ssh_connection(
     bridge: BridgeProfile,
     config: TunnelConfig,
     timeout: int = 10,
+    *,
+    rtunnel_bin: Optional[Path] = None,
 ) -> bool:
     """Test if SSH connection works via ProxyCommand.
 
@@ -250,41 +459,52 @@ def _test_ssh_connection(
         bridge: Bridge profile to test
         config: Tunnel configuration (for rtunnel binary path)
         timeout: SSH connection timeout in seconds (default: 10)
+        rtunnel_bin: Already-verified rtunnel binary; skips the binary check
 
     Returns:
         True if SSH connection succeeds, False otherwise
     """
-    # Ensure rtunnel binary exists
-    try:
-        _ensure_rtunnel_binary(config)
-    except TunnelError:
-        return False
+    if rtunnel_bin is None:
+        # Ensure rtunnel binary exists
+        try:
+            rtunnel_bin = _ensure_rtunnel_binary(config)
+        except TunnelError:
+            return False
 
-    proxy_cmd = _get_proxy_command(bridge, config.rtunnel_bin, quiet=True)
+    proxy_cmd = _get_proxy_command(bridge, rtunnel_bin, quiet=True)
 
     try:
         result = subprocess.run(
-            [
-                "ssh",
-                "-o", "StrictHostKeyChecking=no",
-                "-o", "UserKnownHostsFile=/dev/null",
-                "-o", "BatchMode=yes",
-                "-o", f"ConnectTimeout={timeout}",
-                "-o", f"ProxyCommand={proxy_cmd}",
-                "-o", "LogLevel=ERROR",
-                "-p", str(bridge.ssh_port),
-                f"{bridge.ssh_user}@localhost",
-                "echo ok",
-            ],
+            _build_ssh_argv(
+                bridge,
+                config,
+                proxy_cmd,
+                extra_opts=("-o", "BatchMode=yes", "-o", f"ConnectTimeout={timeout}"),
+                remote_cmd="echo ok",
+            ),
             capture_output=True,
-            text=True,
             timeout=timeout + 5,
         )
-        return result.returncode == 0 and "ok" in result.stdout
+        return result.returncode == 0 and b"ok" in result.stdout
     except (subprocess.TimeoutExpired, FileNotFoundError):
         return False
 
 
+# Last successful availability check: (config_file, bridge name) -> monotonic time
+_AVAILABLE_CACHE: dict[tuple[Path, str], float] = {}
+
+
+def _tunnel_health_ttl() -> float:
+    """Get the TTL for cached tunnel availability from the environment."""
+    value = os.environ.get("INSPIRE_TUNNEL_HEALTH_TTL")
+    if value:
+        try:
+            return float(value)
+        except ValueError:
+            pass
+    return DEFAULT_TUNNEL_HEALTH_TTL
+
+
 def is_tunnel_available(
     bridge_name: Optional[str] = None,
     config: Optional[TunnelConfig] = None,
@@ -299,6 +519,9 @@ def is_tunnel_available(
 
     Returns:
         True if SSH via ProxyCommand works, False otherwise
+
+    A successful check is remembered for INSPIRE_TUNNEL_HEALTH_TTL seconds
+    (default 15); failures are never cached.
     """
     if config is None:
         config = load_tunnel_config()
@@ -307,15 +530,83 @@ def is_tunnel_available(
     if not bridge:
         return False
 
+    cache_key = (config.config_file, bridge.name)
+    checked_at = _AVAILABLE_CACHE.get(cache_key)
+    if checked_at is not None and time.monotonic() - checked_at < _tunnel_health_ttl():
+        return True
+
     # Test SSH connection with retry
     for attempt in range(retries + 1):
         if _test_ssh_connection(bridge, config):
+            _AVAILABLE_CACHE[cache_key] = time.monotonic()
             return True
         if attempt < retries:
             time.sleep(1)  # Brief pause before retry
+    _AVAILABLE_CACHE.pop(cache_key, None)
     return False
 
 
+def check_all_bridges(
+    config: Optional[TunnelConfig] = None,
+    timeout: int = 10,
+) -> dict[str, bool]:
+    """Test SSH connectivity of every configured bridge concurrently.
+
+    Args:
+        config: Tunnel configuration (loads default if None)
+        timeout: SSH connection timeout in seconds per bridge (default: 10)
+
+    Returns:
+        Dict mapping bridge name to whether SSH via ProxyCommand works
+    """
+    if config is None:
+        config = load_tunnel_config()
+
+    bridges = config.list_bridges()
+    if not bridges:
+        return {}
+
+    try:
+        rtunnel_bin = _ensure_rtunnel_binary(config)
+    except TunnelError:
+        return {bridge.name: False for bridge in bridges}
+
+    # Each probe is dominated by network round-trips, so threads overlap them
+    with ThreadPoolExecutor(max_workers=min(8, len(bridges))) as executor:
+        futures = {
+            bridge.name: executor.submit(
+                _test_ssh_connection, bridge, config, timeout, rtunnel_bin=rtunnel_bin
+            )
+            for bridge in bridges
+        }
+        return {name: future.result() for name, future in futures.items()}
+
+
+def _remote_command_argv(
+    command: str,
+    bridge_name: Optional[str],
+    config: TunnelConfig,
+) -> list[str]:
+    """Resolve the bridge and build the ssh argv for a non-interactive command."""
+    bridge = _require_bridge(config, bridge_name)
+
+    # Ensure rtunnel binary exists
+    _ensure_rtunnel_binary(config)
+
+    proxy_cmd = _get_proxy_command(bridge, config.rtunnel_bin, quiet=True)
+
+    # Wrap command in login shell to source ~/.bash_profile for PATH etc.
+    wrapped_command = f"LC_ALL=C LANG=C bash -l -c {shlex.quote(command)}"
+
+    return _build_ssh_argv(
+        bridge,
+        config,
+        proxy_cmd,
+        extra_opts=("-o", "BatchMode=yes"),
+        remote_cmd=wrapped_command,
+    )
+
+
 def run_ssh_command(
     command: str,
     bridge_name: Optional[str] = None,
@@ -346,34 +637,7 @@ def run_ssh_command(
     if config is None:
         config = load_tunnel_config()
 
-    bridge = config.get_bridge(bridge_name)
-    if not bridge:
-        if bridge_name:
-            raise BridgeNotFoundError(f"Bridge '{bridge_name}' not found")
-        raise TunnelNotAvailableError(
-            "No bridge configured. Run 'inspire tunnel add <name> <url>' first."
-        )
-
-    # Ensure rtunnel binary exists
-    _ensure_rtunnel_binary(config)
-
-    proxy_cmd = _get_proxy_command(bridge, config.rtunnel_bin, quiet=True)
-
-    # Wrap command in login shell to source ~/.bash_profile for PATH etc.
-    import shlex
-    wrapped_command = f"LC_ALL=C LANG=C bash -l -c {shlex.quote(command)}"
-
-    ssh_cmd = [
-        "ssh",
-        "-o", "StrictHostKeyChecking=no",
-        "-o", "UserKnownHostsFile=/dev/null",
-        "-o", "BatchMode=yes",
-        "-o", f"ProxyCommand={proxy_cmd}",
-        "-o", "LogLevel=ERROR",
-        "-p", str(bridge.ssh_port),
-        f"{bridge.ssh_user}@localhost",
-        wrapped_command,
-    ]
+    ssh_cmd = _remote_command_argv(command, bridge_name, config)
 
     return subprocess.run(
         ssh_cmd,
@@ -384,6 +648,60 @@ def run_ssh_command(
     )
 
 
+def run_ssh_command_tail(
+    command: str,
+    bridge_name: Optional[str] = None,
+    config: Optional[TunnelConfig] = None,
+    timeout: Optional[int] = None,
+    tail_bytes: int = 4096,
+) -> tuple[int, str, str]:
+    """Execute a command on Bridge and keep only the last line of stdout.
+
+    Stdout is spooled to a temporary file instead of being held in memory,
+    which keeps chatty commands (e.g. git fetch on a large repo) cheap when
+    only their final line matters.
+
+    Args:
+        command: Shell command to execute on Bridge
+        bridge_name: Name of bridge to use (uses default if None)
+        config: Tunnel configuration (loads default if None)
+        timeout: Optional timeout in seconds
+        tail_bytes: How many bytes from the end of stdout to inspect
+
+    Returns:
+        Tuple of (returncode, last non-empty stdout line, stderr text)
+
+    Raises:
+        TunnelNotAvailableError: If no bridge configured
+        BridgeNotFoundError: If specified bridge not found
+        subprocess.TimeoutExpired: If command times out
+    """
+    if config is None:
+        config = load_tunnel_config()
+
+    ssh_cmd = _remote_command_argv(command, bridge_name, config)
+
+    with tempfile.TemporaryFile() as stdout_file:
+        proc = subprocess.Popen(ssh_cmd, stdout=stdout_file, stderr=subprocess.PIPE)
+        try:
+            _, stderr = proc.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.communicate()
+            raise
+
+        size = stdout_file.seek(0, os.SEEK_END)
+        stdout_file.seek(max(0, size - tail_bytes))
+        tail = stdout_file.read().strip()
+
+    last_line = tail.rsplit(b"\n", 1)[-1].strip() if tail else b""
+    return (
+        proc.returncode,
+        last_line.decode("utf-8", errors="replace"),
+        stderr.decode("utf-8", errors="replace"),
+    )
+
+
 def get_ssh_command_args(
     bridge_name: Optional[str] = None,
     config: Optional[TunnelConfig] = None,
@@ -406,66 +724,126 @@ def get_ssh_command_args(
     if config is None:
         config = load_tunnel_config()
 
-    bridge = config.get_bridge(bridge_name)
-    if not bridge:
-        if bridge_name:
-            raise BridgeNotFoundError(f"Bridge '{bridge_name}' not found")
-        raise TunnelNotAvailableError(
-            "No bridge configured. Run 'inspire tunnel add <name> <url>' first."
-        )
+    bridge = _require_bridge(config, bridge_name)
 
     # Ensure rtunnel binary exists
     _ensure_rtunnel_binary(config)
 
     proxy_cmd = _get_proxy_command(bridge, config.rtunnel_bin, quiet=True)
 
-    args = [
-        "ssh",
-        "-o", "StrictHostKeyChecking=no",
-        "-o", "UserKnownHostsFile=/dev/null",
-        "-o", f"ProxyCommand={proxy_cmd}",
-        "-o", "LogLevel=ERROR",
-        "-p", str(bridge.ssh_port),
-        f"{bridge.ssh_user}@localhost",
-    ]
+    return _build_ssh_argv(bridge, config, proxy_cmd, remote_cmd=remote_command)
+
+
+def _rtunnel_usable(path: Path) -> bool:
+    """Check that path is an executable regular file with a single stat call."""
+    try:
+        st = os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+    return stat.S_ISREG(st.st_mode) and bool(st.st_mode & 0o111)
+
+
+# (shutil, tarfile, urllib.request), imported on first rtunnel download
+_DOWNLOAD_MODULES: Optional[tuple] = None
+
+
+def _download_modules() -> tuple:
+    """Import the modules needed to download rtunnel, once per process."""
+    global _DOWNLOAD_MODULES
+    if _DOWNLOAD_MODULES is None:
+        import shutil
+        import tarfile
+        import urllib.request
+
+        _DOWNLOAD_MODULES = (shutil, tarfile, urllib.request)
+    return _DOWNLOAD_MODULES
+
+
+def _rtunnel_etag_file(config: TunnelConfig) -> Path:
+    """Sidecar file recording the download URL, ETag and size of the installed rtunnel."""
+    return config.config_dir / ".rtunnel.etag"
 
-    if remote_command:
-        args.append(remote_command)
 
-    return args
+def _read_rtunnel_etag(config: TunnelConfig, url: str) -> Optional[str]:
+    """Get the cached ETag for url if the binary on disk is the one it was recorded for.
+
+    Returns None when the sidecar is absent, was recorded for another URL, or
+    its size does not match rtunnel_bin (e.g. a partial or foreign file), so
+    the caller falls back to an unconditional download.
+    """
+    try:
+        cached_url, etag, size = _rtunnel_etag_file(config).read_text().split("\n")[:3]
+        if cached_url != url or int(size) != config.rtunnel_bin.stat().st_size:
+            return None
+    except (OSError, ValueError):
+        return None
+    return etag.strip() or None
 
 
 def _ensure_rtunnel_binary(config: TunnelConfig) -> Path:
-    """Ensure rtunnel binary exists, download if needed."""
-    if config.rtunnel_bin.exists() and os.access(config.rtunnel_bin, os.X_OK):
+    """Ensure rtunnel binary exists, download if needed.
+
+    When a previously downloaded binary is still on disk (e.g. it lost its
+    executable bit) and matches the size recorded with the cached ETag, the
+    download is made conditional on that ETag so an unchanged release is not
+    fetched again.
+    """
+    if _rtunnel_usable(config.rtunnel_bin):
         return config.rtunnel_bin
 
     # Download rtunnel
-    config.rtunnel_bin.parent.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(config.rtunnel_bin.parent)
 
     try:
-        import tarfile
-        import tempfile
-        import urllib.request
+        shutil, tarfile, urllib_request = _download_modules()
 
-        # Download tar.gz and extract
-        with tempfile.NamedTemporaryFile(suffix=".tar.gz", delete=False) as tmp:
-            urllib.request.urlretrieve(_get_rtunnel_download_url(), tmp.name)
-            with tarfile.open(tmp.name, "r:gz") as tar:
+        url = _get_rtunnel_download_url()
+        request = urllib_request.Request(url)
+        etag = _read_rtunnel_etag(config, url) if config.rtunnel_bin.is_file() else None
+        if etag:
+            request.add_header("If-None-Match", etag)
+
+        try:
+            response = urllib_request.urlopen(request)
+        except urllib_request.HTTPError as e:
+            if e.code == 304 and etag:
+                # Unchanged upstream; the binary on disk is current
+                config.rtunnel_bin.chmod(0o755)
+                return config.rtunnel_bin
+            raise
+
+        # Stream the tar.gz into a sibling temp file and only move it into place
+        # once fully extracted, so a dropped connection or corrupt archive never
+        # leaves a truncated executable at rtunnel_bin.
+        fd, tmp_name = tempfile.mkstemp(prefix=".rtunnel-", dir=config.rtunnel_bin.parent)
+        tmp_path = Path(tmp_name)
+        try:
+            found = False
+            with os.fdopen(fd, "wb") as dst, response as resp, tarfile.open(
+                fileobj=resp, mode="r|gz"
+            ) as tar:
+                new_etag = resp.headers.get("ETag")
                 # Extract the rtunnel binary (should be the only file or named rtunnel*)
-                for member in tar.getmembers():
+                for member in tar:
                     if member.isfile() and "rtunnel" in member.name:
-                        # Extract to a temp location first
                         extracted = tar.extractfile(member)
                         if extracted:
-                            config.rtunnel_bin.write_bytes(extracted.read())
-                            config.rtunnel_bin.chmod(0o755)
+                            shutil.copyfileobj(extracted, dst, length=1 << 20)
+                            found = True
                             break
-            # Clean up temp file
-            Path(tmp.name).unlink(missing_ok=True)
 
-        if not config.rtunnel_bin.exists():
-            raise TunnelError("rtunnel binary not found in archive")
+            if not found:
+                raise TunnelError("rtunnel binary not found in archive")
+
+            tmp_path.chmod(0o755)
+            os.replace(tmp_path, config.rtunnel_bin)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+        if new_etag:
+            _ensure_dir(config.config_dir)
+            size = config.rtunnel_bin.stat().st_size
+            _rtunnel_etag_file(config).write_text(f"{url}\n{new_etag}\n{size}\n")
 
         return config.rtunnel_bin
     except Exception as e:
@@ -475,12 +853,14 @@ def _ensure_rtunnel_binary(config: TunnelConfig) -> Path:
 def get_tunnel_status(
     bridge_name: Optional[str] = None,
     config: Optional[TunnelConfig] = None,
+    check_all: bool = False,
 ) -> dict:
     """Get tunnel status for a bridge (ProxyCommand mode).
 
     Args:
         bridge_name: Name of bridge to check (uses default if None)
         config: Tunnel configuration
+        check_all: Also test every configured bridge (in parallel)
 
     Returns:
         Dict with keys:
@@ -492,23 +872,30 @@ def get_tunnel_status(
         - bridges: list of all bridge names
         - default_bridge: Optional[str]
         - error: Optional[str]
+        - bridge_status: dict of bridge name -> ssh_works (only with check_all)
     """
     if config is None:
         config = load_tunnel_config()
 
     bridge = config.get_bridge(bridge_name)
+    rtunnel_ok = _rtunnel_usable(config.rtunnel_bin)
 
     status = {
         "configured": bridge is not None,
         "bridge_name": bridge.name if bridge else None,
         "ssh_works": False,
         "proxy_url": bridge.proxy_url if bridge else None,
-        "rtunnel_path": str(config.rtunnel_bin) if config.rtunnel_bin.exists() else None,
-        "bridges": [b.name for b in config.list_bridges()],
+        "rtunnel_path": str(config.rtunnel_bin) if rtunnel_ok else None,
+        "bridges": list(config.bridges),
         "default_bridge": config.default_bridge,
         "error": None,
     }
 
+    if check_all:
+        status["bridge_status"] = check_all_bridges(config)
+        rtunnel_ok = _rtunnel_usable(config.rtunnel_bin)
+        status["rtunnel_path"] = str(config.rtunnel_bin) if rtunnel_ok else None
+
     if not bridge:
         if bridge_name:
             status["error"] = f"Bridge '{bridge_name}' not found."
@@ -517,7 +904,7 @@ def get_tunnel_status(
         return status
 
     # Check if rtunnel binary exists
-    if not config.rtunnel_bin.exists():
+    if not rtunnel_ok:
         try:
             _ensure_rtunnel_binary(config)
             status["rtunnel_path"] = str(config.rtunnel_bin)
@@ -526,7 +913,12 @@ def get_tunnel_status(
             return status
 
     # Test SSH connection
-    status["ssh_works"] = _test_ssh_connection(bridge, config)
+    if check_all:
+        status["ssh_works"] = status["bridge_status"].get(bridge.name, False)
+    else:
+        status["ssh_works"] = _test_ssh_connection(
+            bridge, config, rtunnel_bin=config.rtunnel_bin
+        )
     if not status["ssh_works"]:
         status["error"] = "SSH connection failed. Check proxy URL and Bridge rtunnel server."
 
@@ -568,14 +960,7 @@ def generate_ssh_config(
     if host_alias is None:
         host_alias = bridge.name
 
-    # Convert https:// URL to wss:// for websocket
-    proxy_url = bridge.proxy_url
-    if proxy_url.startswith("https://"):
-        ws_url = "wss://" + proxy_url[8:]
-    elif proxy_url.startswith("http://"):
-        ws_url = "ws://" + proxy_url[7:]
-    else:
-        ws_url = proxy_url
+    ws_url = _url_to_ws(bridge.proxy_url)
 
     ssh_config = f"""Host {host_alias}
     HostName localhost
@@ -609,6 +994,39 @@ def generate_all_ssh_configs(config: TunnelConfig) -> str:
     return "\n\n".join(configs)
 
 
+def _atomic_write_text(path: Path, content: str) -> None:
+    """Replace a file's content atomically via a sibling temp file and os.replace.
+
+    Symlinks are followed so that a symlinked ~/.ssh/config keeps pointing at
+    its (updated) target, and the existing permission bits are preserved.
+    """
+    target = path.resolve()
+    try:
+        mode = stat.S_IMODE(os.stat(target).st_mode)
+    except FileNotFoundError:
+        mode = 0o600
+
+    tmp = target.with_name(f".{target.name}.tmp")
+    try:
+        tmp.write_text(content)
+        os.chmod(tmp, mode)
+        os.replace(tmp, target)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+@functools.lru_cache(maxsize=64)
+def _host_patterns(escaped_alias: str) -> tuple[re.Pattern, re.Pattern]:
+    """Compile the Host-line and Host-block patterns for an escaped alias."""
+    return (
+        re.compile(rf"^Host\s+.*?\b{escaped_alias}\b.*$", re.MULTILINE),
+        re.compile(
+            rf"(^Host\s+.*?\b{escaped_alias}\b.*$)((?:\n(?!Host\s).*)*)", re.MULTILINE
+        ),
+    )
+
+
 def install_ssh_config(ssh_config: str, host_alias: str) -> dict:
     """Install SSH config to ~/.ssh/config.
 
@@ -622,10 +1040,8 @@ def install_ssh_config(ssh_config: str, host_alias: str) -> dict:
         - updated: bool (True if existing entry was updated)
         - error: Optional[str]
     """
-    import re
-
     ssh_config_path = Path.home() / ".ssh" / "config"
-    ssh_config_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    _ensure_dir(ssh_config_path.parent, mode=0o700)
 
     existing_content = ""
     if ssh_config_path.exists():
@@ -633,15 +1049,14 @@ def install_ssh_config(ssh_config: str, host_alias: str) -> dict:
 
     # Check if host alias already exists
     # Match "Host <alias>" at start of line, possibly with other hosts on same line
-    host_pattern = rf"^Host\s+.*?\b{re.escape(host_alias)}\b.*$"
-    match = re.search(host_pattern, existing_content, re.MULTILINE)
+    host_pattern, block_pattern = _host_patterns(re.escape(host_alias))
+    match = host_pattern.search(existing_content)
 
     if match:
         # Find the full block to replace (from Host line to next Host line or end)
-        block_pattern = rf"(^Host\s+.*?\b{re.escape(host_alias)}\b.*$)((?:\n(?!Host\s).*)*)"
-        new_content = re.sub(block_pattern, ssh_config, existing_content, flags=re.MULTILINE)
+        new_content = block_pattern.sub(ssh_config, existing_content)
 
-        ssh_config_path.write_text(new_content)
+        _atomic_write_text(ssh_config_path, new_content)
         return {"success": True, "updated": True, "error": None}
     else:
         # Append new entry
@@ -650,7 +1065,7 @@ def install_ssh_config(ssh_config: str, host_alias: str) -> dict:
         if existing_content:
             existing_content += "\n"
 
-        ssh_config_path.write_text(existing_content + ssh_config + "\n")
+        _atomic_write_text(ssh_config_path, existing_content + ssh_config + "\n")
         return {"success": True, "updated": False, "error": None}
 
 
@@ -708,27 +1123,22 @@ git rev-parse HEAD
 """
 
     try:
-        result = run_ssh_command(
+        returncode, last_line, stderr = run_ssh_command_tail(
             sync_cmd.strip(),
             bridge_name=bridge_name,
             config=config,
             timeout=timeout,
-            capture_output=True,
-            check=False,
         )
 
-        if result.returncode == 0:
-            # Extract the synced SHA from output (last line)
-            lines = result.stdout.strip().split('\n')
-            synced_sha = lines[-1].strip() if lines else ""
-
+        if returncode == 0:
+            # The synced SHA is the last line of output
             return {
                 "success": True,
-                "synced_sha": synced_sha,
+                "synced_sha": last_line,
                 "error": None,
             }
         else:
-            error_msg = result.stderr.strip() or result.stdout.strip() or "Unknown error"
+            error_msg = stderr.strip() or last_line or "Unknown error"
             return {
                 "success": False,
                 "synced_sha": None,
@@ -10,18 +10,45 @@ import atexit
 import hashlib
 import json
 import os
+import threading
 import time
-from dataclasses import dataclass
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Any, Callable, Optional
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Optional, Union
 from urllib.parse import urlsplit
 
-import requests
+from inspire.compute_groups import save_group_meta
+
+try:
+    import orjson
+
+    def _json_loads(data: bytes):
+        return orjson.loads(data)
+
+    def _json_dumps(obj, *, sort_keys: bool = False) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS if sort_keys else 0)
+
+except ImportError:  # orjson is optional
+
+    def _json_loads(data: bytes):
+        return json.loads(data)
+
+    def _json_dumps(obj, *, sort_keys: bool = False) -> bytes:
+        return json.dumps(obj, sort_keys=sort_keys, separators=(",", ":")).encode("utf-8")
+
+if TYPE_CHECKING:
+    import requests
 
 # Session cache file
 SESSION_CACHE_FILE = Path.home() / ".cache" / "inspire-cli" / "web_session.json"
 SESSION_TTL = 3600  # 1 hour
 
+# Short-lived cache for read-mostly API responses (see request_json cache_ttl)
+RESPONSE_CACHE_TTL = 10  # seconds
+RESPONSE_CACHE_MAX_ENTRIES = 64
+
 
 class SessionExpiredError(Exception):
     """Raised when the web session has expired (401 from server)."""
@@ -38,26 +65,48 @@ def get_playwright_proxy() -> Optional[dict]:
     return None
 
 
+_REQUESTS_MODULE = None
+
+
+def _lazy_requests():
+    """Import ``requests`` on first use; commands that never hit the web API skip it."""
+    global _REQUESTS_MODULE
+    if _REQUESTS_MODULE is None:
+        import requests
+
+        _REQUESTS_MODULE = requests
+    return _REQUESTS_MODULE
+
+
 def _cookie_jar_from_session(session: "WebSession", base_url: str) -> requests.cookies.RequestsCookieJar:
-    jar = requests.cookies.RequestsCookieJar()
+    cookies_mod = _lazy_requests().cookies
+    create_cookie = cookies_mod.create_cookie
+    jar = cookies_mod.RequestsCookieJar()
+    set_cookie = jar.set_cookie
     base_host = urlsplit(base_url).hostname or ""
 
+    # Build Cookie objects directly; jar.set() re-normalizes its kwargs and
+    # scans for duplicates on every call.
     storage_cookies = session.storage_state.get("cookies") if session.storage_state else None
     if storage_cookies:
         for cookie in storage_cookies:
             name = cookie.get("name")
-            value = cookie.get("value")
             if not name:
                 continue
-            domain = cookie.get("domain") or base_host
-            path = cookie.get("path") or "/"
-            jar.set(name, value, domain=domain, path=path)
+            set_cookie(
+                create_cookie(
+                    name,
+                    cookie.get("value"),
+                    domain=cookie.get("domain") or base_host,
+                    path=cookie.get("path") or "/",
+                )
+            )
 
     if not storage_cookies and session.cookies:
         for name, value in session.cookies.items():
             if not name:
                 continue
-            jar.set(name, value, domain=base_host, path="/")
+            set_cookie(create_cookie(name, value, domain=base_host, path="/"))
 
     return jar
 
@@ -67,7 +116,24 @@ def build_requests_session(session: "WebSession", base_url: str) -> requests.Ses
     if not storage_cookies and not session.cookies:
         raise ValueError("Session expired or invalid (missing storage state)")
 
-    http = requests.Session()
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    http = _lazy_requests().Session()
+    # Keep-alive pool sized for concurrent per-group fetches; only idempotent
+    # requests are retried on gateway errors.
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.2,
+            status_forcelist=[502, 503, 504],
+            raise_on_status=False,
+        ),
+    )
+    http.mount("https://", adapter)
+    http.mount("http://", adapter)
     http.cookies.update(_cookie_jar_from_session(session, base_url))
     http.headers.update(
         {
@@ -81,19 +147,183 @@ def build_requests_session(session: "WebSession", base_url: str) -> requests.Ses
     return http
 
 
-class _BrowserRequestClient:
-    def __init__(self, session: "WebSession") -> None:
+_ATEXIT_REGISTERED: set[Callable[[], None]] = set()
+
+
+def _register_atexit(func: Callable[[], None]) -> None:
+    """Register a cleanup hook once, only when there is something to clean up."""
+    if func not in _ATEXIT_REGISTERED:
+        _ATEXIT_REGISTERED.add(func)
+        atexit.register(func)
+
+
+# Pooled HTTP sessions keyed by (host, session fingerprint)
+_HTTP_SESSIONS: dict[tuple[str, str], requests.Session] = {}
+_HTTP_SESSIONS_LOCK = threading.Lock()
+
+
+def _http_session_key(session: "WebSession", url: str) -> tuple[str, str]:
+    return (urlsplit(url).netloc, session.fingerprint())
+
+
+def _get_http_session(session: "WebSession", url: str) -> requests.Session:
+    """Get a pooled requests session for this web session and host.
+
+    Reusing the session keeps TCP/TLS connections alive across API calls.
+    """
+    key = _http_session_key(session, url)
+    with _HTTP_SESSIONS_LOCK:
+        http = _HTTP_SESSIONS.get(key)
+        if http is None:
+            http = build_requests_session(session, url)
+            if not _HTTP_SESSIONS:
+                _register_atexit(_close_http_sessions)
+            _HTTP_SESSIONS[key] = http
+        return http
+
+
+def _invalidate_http_session(session: "WebSession", url: str) -> None:
+    with _HTTP_SESSIONS_LOCK:
+        http = _HTTP_SESSIONS.pop(_http_session_key(session, url), None)
+    if http is not None:
+        http.close()
+
+
+def _close_http_sessions() -> None:
+    with _HTTP_SESSIONS_LOCK:
+        sessions = list(_HTTP_SESSIONS.values())
+        _HTTP_SESSIONS.clear()
+    for http in sessions:
+        try:
+            http.close()
+        except Exception:
+            pass
+
+
+# Shared Playwright driver and headless Chromium, each started on first use.
+# The driver serves every caller; the headless browser is only launched for
+# login and the browser request client, never for a headed login.
+_PLAYWRIGHT: Optional[Any] = None
+_HEADLESS_BROWSER: Optional[Any] = None
+
+
+def _get_playwright() -> Any:
+    """Return the shared Playwright driver, starting it if needed."""
+    global _PLAYWRIGHT
+    if _PLAYWRIGHT is None:
         from playwright.sync_api import sync_playwright
 
+        _register_atexit(_close_browser_client)
+        _PLAYWRIGHT = sync_playwright().start()
+    return _PLAYWRIGHT
+
+
+def _get_headless_browser() -> Any:
+    """Return the shared headless Chromium, launching it if needed."""
+    global _HEADLESS_BROWSER
+    if _HEADLESS_BROWSER is None:
+        _HEADLESS_BROWSER = _get_playwright().chromium.launch(
+            headless=True, proxy=get_playwright_proxy()
+        )
+    return _HEADLESS_BROWSER
+
+
+def _close_playwright() -> None:
+    global _PLAYWRIGHT, _HEADLESS_BROWSER
+    browser, pw = _HEADLESS_BROWSER, _PLAYWRIGHT
+    _HEADLESS_BROWSER = _PLAYWRIGHT = None
+    if browser is not None:
+        try:
+            browser.close()
+        except Exception:
+            pass
+    if pw is not None:
+        try:
+            pw.stop()
+        except Exception:
+            pass
+
+
+class _ReAuthClient:
+    """Refresh app cookies by replaying the SSO redirect chain over HTTP.
+
+    When the app cookie expires but the SSO (Keycloak/CAS) session cookie is
+    still valid, loading a UI page bounces through the SSO server and back
+    with fresh cookies, no browser required.
+    """
+
+    def __init__(self, http: requests.Session) -> None:
+        self._http = http
+
+    def refresh(
+        self,
+        url: str,
+        *,
+        headers: Optional[dict[str, str]] = None,
+        timeout: int = 30,
+    ) -> bool:
+        """Follow the redirect chain for ``url``'s UI page; True if it ends back on the app."""
+        target = urlsplit(url)
+        page_url = (headers or {}).get("Referer") or f"{target.scheme}://{target.netloc}/"
+        try:
+            resp = self._http.get(page_url, timeout=timeout, allow_redirects=True)
+        except Exception:
+            return False
+
+        final = urlsplit(getattr(resp, "url", "") or "")
+        return (
+            resp.status_code == 200
+            and final.netloc == target.netloc
+            and "login" not in final.path.lower()
+        )
+
+
+def _http_request_json(
+    http: requests.Session,
+    method: str,
+    url: str,
+    *,
+    headers: Optional[dict[str, str]] = None,
+    body: Optional[dict] = None,
+    timeout: int = 30,
+) -> dict:
+    method_upper = method.upper()
+    req_headers = headers or {}
+    if method_upper == "GET":
+        resp = http.get(url, headers=req_headers, timeout=timeout)
+    elif method_upper == "POST":
+        req_headers = dict(req_headers)
+        req_headers["Content-Type"] = "application/json"
+        resp = http.post(url, headers=req_headers, json=body or {}, timeout=timeout)
+    else:
+        raise ValueError(f"Unsupported HTTP method: {method}")
+
+    if resp.status_code == 401:
+        raise SessionExpiredError("Session expired or invalid")
+    if resp.status_code >= 400:
+        raise ValueError(f"API returned {resp.status_code}: {resp.text}")
+    try:
+        return resp.json()
+    except ValueError as e:
+        raise SessionExpiredError(
+            "Session expired or invalid (non-JSON response)"
+        ) from e
+
+
+_JSON_CONTENT_TYPE = {"Content-Type": "application/json"}
+_EMPTY_JSON = b"{}"
+
+
+class _BrowserRequestClient:
+    def __init__(self, session: "WebSession") -> None:
         proxy = get_playwright_proxy()
-        self._playwright = sync_playwright().start()
-        self._browser = self._playwright.chromium.launch(headless=True, proxy=proxy)
-        self._context = self._browser.new_context(
+        browser = _get_headless_browser()
+        self._context = browser.new_context(
             storage_state=session.storage_state,
             proxy=proxy,
             ignore_https_errors=True,
         )
-        self.session_fingerprint = _session_fingerprint(session)
+        self.session_fingerprint = session.fingerprint()
 
     def request_json(
         self,
@@ -111,13 +341,16 @@ class _BrowserRequestClient:
         if method_upper == "GET":
             resp = self._context.request.get(url, headers=req_headers, timeout=timeout_ms)
         elif method_upper == "POST":
-            post_headers = dict(req_headers)
-            if not any(key.lower() == "content-type" for key in post_headers):
-                post_headers["Content-Type"] = "application/json"
+            if not req_headers:
+                post_headers = _JSON_CONTENT_TYPE
+            elif "Content-Type" in req_headers or "content-type" in req_headers:
+                post_headers = req_headers
+            else:
+                post_headers = {**req_headers, **_JSON_CONTENT_TYPE}
             resp = self._context.request.post(
                 url,
                 headers=post_headers,
-                data=json.dumps(body or {}),
+                data=_json_dumps(body) if body else _EMPTY_JSON,
                 timeout=timeout_ms,
             )
         else:
@@ -135,23 +368,33 @@ class _BrowserRequestClient:
             self._context.close()
         except Exception:
             pass
-        try:
-            self._browser.close()
-        except Exception:
-            pass
-        try:
-            self._playwright.stop()
-        except Exception:
-            pass
 
 
-_BROWSER_API_FORCE_BROWSER = False
+# API sections (scheme://host/api/v1/<section>) where plain HTTP failed and
+# the browser client is used instead; other endpoints keep the fast path.
+_BROWSER_ONLY_PREFIXES: set[str] = set()
 _BROWSER_CLIENT: Optional[_BrowserRequestClient] = None
 
 
+def _browser_prefix(url: str) -> str:
+    parts = urlsplit(url)
+    section = "/".join(parts.path.split("/")[:4])
+    return f"{parts.scheme}://{parts.netloc}{section}"
+
+
+def _needs_browser(url: str) -> bool:
+    return _browser_prefix(url) in _BROWSER_ONLY_PREFIXES
+
+
+# Worker threads set `requests_only` so they never touch the Playwright client,
+# which is bound to the thread that created it, nor renew or invalidate the
+# pooled HTTP session they share with each other.
+_THREAD_STATE = threading.local()
+
+
 def _session_fingerprint(session: "WebSession") -> str:
     cookies = session.storage_state.get("cookies") if session.storage_state else []
-    payload = json.dumps(
+    payload = _json_dumps(
         [
             {
                 "name": c.get("name"),
@@ -162,15 +405,15 @@ def _session_fingerprint(session: "WebSession") -> str:
             for c in cookies or []
         ],
         sort_keys=True,
-        ensure_ascii=True,
     )
-    return hashlib.sha256(payload.encode()).hexdigest()
+    # Identity key only (the cookies are the secret), so a fast hash suffices
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
 
 
 def _get_browser_client(session: "WebSession") -> _BrowserRequestClient:
     global _BROWSER_CLIENT
 
-    fingerprint = _session_fingerprint(session)
+    fingerprint = session.fingerprint()
     if _BROWSER_CLIENT and _BROWSER_CLIENT.session_fingerprint == fingerprint:
         return _BROWSER_CLIENT
 
@@ -186,9 +429,26 @@ def _close_browser_client() -> None:
     if _BROWSER_CLIENT:
         _BROWSER_CLIENT.close()
         _BROWSER_CLIENT = None
+    _close_playwright()
+
+
+
+# LRU of (method, url, body, session fingerprint) -> (stored_at, payload)
+_RESPONSE_CACHE: "OrderedDict[tuple[str, str, str, str], tuple[float, dict]]" = OrderedDict()
+_RESPONSE_CACHE_LOCK = threading.Lock()
 
 
-atexit.register(_close_browser_client)
+def _response_cache_key(
+    session: "WebSession", method: str, url: str, body: Optional[dict]
+) -> tuple[str, str, str, str]:
+    body_key = json.dumps(body, sort_keys=True) if body is not None else ""
+    return (method.upper(), url, body_key, session.fingerprint())
+
+
+def clear_response_cache() -> None:
+    """Drop all cached API responses."""
+    with _RESPONSE_CACHE_LOCK:
+        _RESPONSE_CACHE.clear()
 
 
 def request_json(
@@ -199,38 +459,58 @@ def request_json(
     headers: Optional[dict[str, str]] = None,
     body: Optional[dict] = None,
     timeout: int = 30,
+    cache_ttl: float = 0,
     _retry_count: int = 0,
 ) -> dict:
-    global _BROWSER_API_FORCE_BROWSER
+    """Call a web UI API and return the decoded JSON.
 
-    if not _BROWSER_API_FORCE_BROWSER:
-        http = build_requests_session(session, url)
+    With ``cache_ttl`` > 0, a response for the same method, URL, body and
+    session fetched within the last ``cache_ttl`` seconds is returned as-is;
+    callers must treat it as read-only.
+    """
+    if cache_ttl > 0:
+        key = _response_cache_key(session, method, url, body)
+        now = time.monotonic()
+        with _RESPONSE_CACHE_LOCK:
+            hit = _RESPONSE_CACHE.get(key)
+            if hit is not None and now - hit[0] < cache_ttl:
+                _RESPONSE_CACHE.move_to_end(key)
+                return hit[1]
+        result = request_json(
+            session, method, url, headers=headers, body=body, timeout=timeout
+        )
+        with _RESPONSE_CACHE_LOCK:
+            _RESPONSE_CACHE[key] = (time.monotonic(), result)
+            _RESPONSE_CACHE.move_to_end(key)
+            while len(_RESPONSE_CACHE) > RESPONSE_CACHE_MAX_ENTRIES:
+                _RESPONSE_CACHE.popitem(last=False)
+        return result
+
+    requests_only = getattr(_THREAD_STATE, "requests_only", False)
+    needs_browser = _needs_browser(url)
+    if needs_browser and requests_only:
+        raise SessionExpiredError("Browser fallback required")
+
+    if not needs_browser:
+        http = _get_http_session(session, url)
+        kwargs = {"headers": headers, "body": body, "timeout": timeout}
         try:
-            method_upper = method.upper()
-            req_headers = headers or {}
-            if method_upper == "GET":
-                resp = http.get(url, headers=req_headers, timeout=timeout)
-            elif method_upper == "POST":
-                req_headers = dict(req_headers)
-                req_headers["Content-Type"] = "application/json"
-                resp = http.post(url, headers=req_headers, json=body or {}, timeout=timeout)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
-
-            if resp.status_code == 401:
-                raise SessionExpiredError("Session expired or invalid")
-            if resp.status_code >= 400:
-                raise ValueError(f"API returned {resp.status_code}: {resp.text}")
-            try:
-                return resp.json()
-            except ValueError as e:
-                raise SessionExpiredError(
-                    "Session expired or invalid (non-JSON response)"
-                ) from e
+            return _http_request_json(http, method, url, **kwargs)
         except SessionExpiredError:
-            _BROWSER_API_FORCE_BROWSER = True
-        finally:
-            http.close()
+            if requests_only:
+                # Concurrent prefetch workers share this pooled session; leave
+                # renewal and invalidation to the caller's serial retry so they
+                # happen once rather than racing on its cookies and adapters.
+                raise
+        # The SSO session usually outlives the app cookie; try to renew it
+        # over plain HTTP before paying for a Chromium start.
+        if _ReAuthClient(http).refresh(url, headers=headers, timeout=timeout):
+            try:
+                return _http_request_json(http, method, url, **kwargs)
+            except SessionExpiredError:
+                pass
+        _invalidate_http_session(session, url)
+        _BROWSER_ONLY_PREFIXES.add(_browser_prefix(url))
 
     client = _get_browser_client(session)
     try:
@@ -278,6 +558,15 @@ class WebSession:
     # Back-compat: older cache stored only name->value cookies
     cookies: Optional[dict[str, str]] = None
 
+    # Memoized cookie fingerprint (see fingerprint())
+    _fingerprint: Optional[str] = field(default=None, repr=False, compare=False)
+
+    def fingerprint(self) -> str:
+        """Identity of this session's cookies, computed once per object."""
+        if self._fingerprint is None:
+            self._fingerprint = _session_fingerprint(self)
+        return self._fingerprint
+
     def is_valid(self) -> bool:
         """Check if session is still valid (not expired)."""
         return (time.time() - self.created_at) < SESSION_TTL
@@ -306,36 +595,56 @@ class WebSession:
 
     def save(self) -> None:
         """Save session to cache file."""
+        global _LAST_LOAD
+        self._fingerprint = None
+        _LAST_LOAD = None
         SESSION_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
         # Restrict permissions: session contains sensitive cookies/tokens.
+        # Create the temp file 0600 up front so the cookies are never briefly
+        # world-readable; a stale temp file is removed so its mode can't leak in.
         tmp_path = SESSION_CACHE_FILE.with_suffix(".tmp")
-        with open(tmp_path, "w") as f:
-            json.dump(self.to_dict(), f)
+        tmp_path.unlink(missing_ok=True)
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(_json_dumps(self.to_dict()))
         os.replace(tmp_path, SESSION_CACHE_FILE)
-        try:
-            os.chmod(SESSION_CACHE_FILE, 0o600)
-        except Exception:
-            pass
 
     @classmethod
     def load(cls, allow_expired: bool = False) -> Optional["WebSession"]:
         """Load session from cache file if valid.
 
+        The parsed file is cached against its mtime/size, so repeated loads
+        within one command don't re-read it.
+
         Args:
             allow_expired: If True, return session even if TTL has expired.
                           The session cookies may still be valid server-side.
         """
-        if not SESSION_CACHE_FILE.exists():
-            return None
+        global _LAST_LOAD
         try:
-            with open(SESSION_CACHE_FILE) as f:
-                data = json.load(f)
-            session = cls.from_dict(data)
-            if allow_expired or session.is_valid():
-                return session
-        except (json.JSONDecodeError, KeyError):
-            pass
-        return None
+            st = os.stat(SESSION_CACHE_FILE)
+        except OSError:
+            return None
+
+        stamp = (str(SESSION_CACHE_FILE), st.st_mtime_ns, st.st_size)
+        if _LAST_LOAD is not None and _LAST_LOAD[0] == stamp:
+            session = _LAST_LOAD[1]
+        else:
+            try:
+                data = _json_loads(SESSION_CACHE_FILE.read_bytes())
+                session = cls.from_dict(data)
+            except (OSError, ValueError, KeyError):
+                session = None
+            _LAST_LOAD = (stamp, session)
+
+        if session is None or not (allow_expired or session.is_valid()):
+            return None
+        # Hand out a shallow copy so callers can't change the cached object
+        return replace(session)
+
+
+# (path, mtime_ns, size) of the session cache file -> session parsed from it
+_LAST_LOAD: Optional[tuple[tuple[str, int, int], Optional[WebSession]]] = None
 
 
 def get_credentials() -> tuple[str, str]:
@@ -362,19 +671,21 @@ def login_with_playwright(
 
     The login flow: qz/login -> CAS (Keycloak broker) -> Keycloak -> qz.
     """
-    from playwright.sync_api import sync_playwright
-
     proxy = get_playwright_proxy()
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=headless, proxy=proxy)
-        context = browser.new_context(proxy=proxy, ignore_https_errors=True)
+    # A headed login needs its own window; headless logins share the browser
+    # with the request client and only open a fresh context.
+    own_browser = None
+    if headless:
+        browser = _get_headless_browser()
+    else:
+        own_browser = browser = _get_playwright().chromium.launch(headless=False, proxy=proxy)
+    context = browser.new_context(proxy=proxy, ignore_https_errors=True)
+    try:
         page = context.new_page()
 
         # Navigate to login page; use domcontentloaded since CAS may have
         # long-polling resources that prevent networkidle from completing.
         page.goto(f"{base_url}/login", wait_until="domcontentloaded", timeout=60000)
-        # Give some time for any redirects to settle
-        page.wait_for_timeout(2000)
 
         login_pairs = [
             ("input#username", "input#passwordShow"),
@@ -382,19 +693,33 @@ def login_with_playwright(
             ("input[placeholder='Username/alias']", "input[placeholder='Password']"),
         ]
 
+        # One union selector per field, so a single wait covers every layout.
+        # Some layouts keep a hidden password input next to the visible one.
+        user_union = ", ".join(user_sel for user_sel, _ in login_pairs)
+        pass_union = ", ".join(pass_sel for _, pass_sel in login_pairs)
+
+        # Wait for the redirects to settle on a login form (or the tab that
+        # reveals it) instead of sleeping a fixed amount.
+        try:
+            page.wait_for_selector(
+                f"{user_union}, :text-is('Account login')",
+                timeout=10000,
+                state="visible",
+            )
+        except Exception:
+            pass
+
         def _fill_login_form() -> Optional[object]:
-            for user_sel, pass_sel in login_pairs:
-                try:
-                    page.wait_for_selector(user_sel, timeout=5000, state="visible")
-                    page.wait_for_selector(pass_sel, timeout=5000, state="visible")
-                    user_locator = page.locator(user_sel).first
-                    pass_locator = page.locator(pass_sel).first
-                    user_locator.fill(username)
-                    pass_locator.fill(password)
-                    return pass_locator
-                except Exception:
-                    continue
-            return None
+            try:
+                page.wait_for_selector(user_union, timeout=10000, state="visible")
+                page.wait_for_selector(pass_union, timeout=10000, state="visible")
+                user_locator = page.locator(f"{user_union} >> visible=true").first
+                pass_locator = page.locator(f"{pass_union} >> visible=true").first
+                user_locator.fill(username)
+                pass_locator.fill(password)
+                return pass_locator
+            except Exception:
+                return None
 
         def _submit_login_form(pass_locator) -> None:  # noqa: ANN001
             try:
@@ -424,7 +749,6 @@ def login_with_playwright(
         if not pass_locator:
             try:
                 page.get_by_text("Account login", exact=True).click(timeout=3000, force=True)
-                page.wait_for_timeout(500)
             except Exception:
                 pass
             pass_locator = _fill_login_form()
@@ -432,13 +756,23 @@ def login_with_playwright(
         if pass_locator:
             _submit_login_form(pass_locator)
 
+        # The app fetches the user detail itself once the session is live;
+        # watching for that response usually makes polling unnecessary.
+        auth_seen: list[bool] = []
+
+        def _on_response(resp) -> None:  # noqa: ANN001
+            if resp.status == 200 and urlsplit(resp.url).path.endswith("/api/v1/user/detail"):
+                auth_seen.append(True)
+
+        page.on("response", _on_response)
+
         # Visit a real page to ensure app session cookies and localStorage are set.
         # Use domcontentloaded with fallback since some pages have long-polling.
         try:
             page.goto(f"{base_url}/jobs/distributedTraining", wait_until="networkidle", timeout=15000)
         except Exception:
             page.goto(f"{base_url}/jobs/distributedTraining", wait_until="domcontentloaded", timeout=30000)
-        page.wait_for_timeout(1000)
+        page.wait_for_load_state("domcontentloaded")
 
         def _wait_for_api_auth() -> None:
             deadline = time.time() + 30
@@ -446,7 +780,10 @@ def login_with_playwright(
                 "Accept": "application/json",
                 "Referer": f"{base_url}/jobs/distributedTraining",
             }
+            delay = 0.25
             while time.time() < deadline:
+                if auth_seen:
+                    return
                 try:
                     resp = context.request.get(
                         f"{base_url}/api/v1/user/detail",
@@ -457,7 +794,9 @@ def login_with_playwright(
                         return
                 except Exception:
                     pass
-                page.wait_for_timeout(500)
+                # wait_for_timeout also lets Playwright dispatch page events
+                page.wait_for_timeout(delay * 1000)
+                delay = min(2.0, delay * 1.5)
             raise ValueError("Login did not complete; check credentials")
 
         _wait_for_api_auth()
@@ -476,18 +815,23 @@ def login_with_playwright(
         # Keep a simple cookie name->value mapping for debugging/back-compat
         cookies = context.cookies()
         cookie_dict = {c["name"]: c["value"] for c in cookies}
+    finally:
+        try:
+            context.close()
+        except Exception:
+            pass
+        if own_browser is not None:
+            own_browser.close()
+
+    session = WebSession(
+        storage_state=storage_state,
+        cookies=cookie_dict,
+        workspace_id=workspace_id,
+        created_at=time.time()
+    )
+    session.save()
 
-        browser.close()
-
-        session = WebSession(
-            storage_state=storage_state,
-            cookies=cookie_dict,
-            workspace_id=workspace_id,
-            created_at=time.time()
-        )
-        session.save()
-
-        return session
+    return session
 
 
 def get_web_session(force_refresh: bool = False, require_workspace: bool = False) -> WebSession:
@@ -500,14 +844,14 @@ def get_web_session(force_refresh: bool = False, require_workspace: bool = False
     Returns:
         A valid WebSession with storage_state and optionally workspace_id.
     """
-    if not force_refresh:
-        cached = WebSession.load()
-        if cached and cached.storage_state.get("cookies"):
-            if require_workspace and not cached.workspace_id:
-                # Need workspace_id, force re-login
-                pass
-            else:
-                return cached
+    # Read the cache once; expiry is checked here rather than by a second load.
+    cached = WebSession.load(allow_expired=True)
+    has_cookies = bool(cached and cached.storage_state.get("cookies"))
+
+    if not force_refresh and has_cookies and cached.is_valid():
+        # A missing workspace_id with require_workspace forces a re-login below
+        if not (require_workspace and not cached.workspace_id):
+            return cached
 
     # Check for workspace override from environment
     env_workspace_id = os.environ.get('INSPIRE_WORKSPACE_ID')
@@ -516,8 +860,7 @@ def get_web_session(force_refresh: bool = False, require_workspace: bool = False
     try:
         username, password = get_credentials()
     except ValueError:
-        cached = WebSession.load(allow_expired=True)
-        if cached and cached.storage_state.get("cookies"):
+        if has_cookies:
             if env_workspace_id and cached.workspace_id != env_workspace_id:
                 cached.workspace_id = env_workspace_id
                 try:
@@ -532,8 +875,7 @@ def get_web_session(force_refresh: bool = False, require_workspace: bool = False
 
     # Use cached session if available and has cookies, even if beyond TTL.
     # The session cookies may still be valid server-side; let API calls determine validity.
-    cached = WebSession.load(allow_expired=True)
-    if cached and cached.storage_state.get("cookies"):
+    if has_cookies:
         if env_workspace_id and cached.workspace_id != env_workspace_id:
             cached.workspace_id = env_workspace_id
             try:
@@ -571,14 +913,57 @@ def fetch_node_specs(
         url,
         headers={"Referer": f"{base_url}/jobs/distributedTraining"},
         timeout=30,
+        cache_ttl=RESPONSE_CACHE_TTL,
     )
 
 
+def _iter_json_items(
+    session: WebSession,
+    method: str,
+    url: str,
+    path: tuple[str, ...],
+    *,
+    headers: Optional[dict[str, str]] = None,
+    body: Optional[dict] = None,
+    timeout: int = 30,
+) -> Iterator[dict]:
+    """Yield the items of the JSON array at ``path`` in the response.
+
+    With ijson installed, the pooled HTTP response is parsed incrementally so
+    the raw body and the full object tree are never held together. Anything
+    other than a plain 200 JSON response (expired session, browser fallback)
+    goes through request_json instead.
+    """
+    try:
+        import ijson
+    except ImportError:  # ijson is optional
+        ijson = None
+
+    if ijson is not None and not _needs_browser(url):
+        http = _get_http_session(session, url)
+        req_headers = {**(headers or {}), **_JSON_CONTENT_TYPE}
+        resp = http.request(
+            method.upper(), url, headers=req_headers, json=body, timeout=timeout, stream=True
+        )
+        with resp:
+            content_type = resp.headers.get("Content-Type", "")
+            if resp.status_code == 200 and "json" in content_type:
+                resp.raw.decode_content = True
+                yield from ijson.items(resp.raw, ".".join(path + ("item",)))
+                return
+
+    data: Any = request_json(session, method, url, headers=headers, body=body, timeout=timeout)
+    for key in path:
+        data = (data or {}).get(key)
+    yield from data or []
+
+
 def fetch_workspace_availability(
     session: WebSession,
     base_url: str = "https://api.example.com",
     progress_callback: Optional[Callable[[int, int], None]] = None,
-) -> list[dict]:
+    stream: bool = False,
+) -> Union[list[dict], Iterator[dict]]:
     """Fetch workspace-specific GPU availability.
 
     Uses the browser API endpoint POST /api/v1/cluster_nodes/list which returns
@@ -589,9 +974,12 @@ def fetch_workspace_availability(
         session: Web session with storage_state and workspace_id
         base_url: Base URL for the API
         progress_callback: Optional callback(fetched, total) for progress updates
+        stream: Return an iterator that parses nodes as they arrive (uses
+            ijson when installed) instead of building the whole list
 
     Returns:
-        List of node dictionaries with availability info.
+        List (or iterator, with ``stream``) of node dictionaries with
+        availability info.
 
     Raises:
         ValueError: If session is invalid or workspace_id is missing.
@@ -609,14 +997,21 @@ def fetch_workspace_availability(
         "page_size": -1,  # Get all nodes
         "filter": {},  # No filter to get all workspace nodes
     }
+    headers = {"Referer": f"{base_url}/jobs/distributedTraining"}
+
+    if stream:
+        return _iter_json_items(
+            session, "POST", url, ("data", "nodes"), headers=headers, body=body, timeout=30
+        )
 
     data = request_json(
         session,
         "POST",
         url,
         body=body,
-        headers={"Referer": f"{base_url}/jobs/distributedTraining"},
+        headers=headers,
         timeout=30,
+        cache_ttl=RESPONSE_CACHE_TTL,
     )
     return data.get("data", {}).get("nodes", [])
 
@@ -632,66 +1027,116 @@ class GPUAvailability:
     low_priority_gpus: int  # GPUs used by low-priority tasks
 
 
+def _parse_node_specs(group_id: str, data: dict) -> GPUAvailability:
+    """Summarize a node_specs response into per-group GPU availability."""
+    nodes = data.get("data", {}).get("node_dimensions", [])
+
+    total_gpus = 0
+    free_gpus = 0
+    low_priority_gpus = 0
+
+    for node in nodes:
+        gpu_count = node.get("gpu_count", 8)
+        total_gpus += gpu_count
+
+        # A GPU dimension without tasks is free; otherwise count the
+        # low-priority (preemptible) tasks on it.
+        tasks = node.get("tasks_associated")
+        if not tasks:
+            free_gpus += gpu_count
+        else:
+            low_priority_gpus += sum(1 for task in tasks if task.get("priority", 10) < 5)
+
+    # Name and GPU type are the same on every node of a group
+    group_name = gpu_type = ""
+    if nodes:
+        group_name = next(
+            (name for node in nodes if (name := node.get("logic_compute_group_name"))),
+            "Unknown",
+        )
+        gpu_type = next(
+            (
+                gpu
+                for node in nodes
+                if (gpu := (node.get("gpu_info") or {}).get("gpu_type_display"))
+            ),
+            "Unknown",
+        )
+
+    return GPUAvailability(
+        group_id=group_id,
+        group_name=group_name,
+        gpu_type=gpu_type,
+        total_gpus=total_gpus,
+        free_gpus=free_gpus,
+        low_priority_gpus=low_priority_gpus,
+    )
+
+
+def _prefetch_node_specs(
+    session: WebSession,
+    compute_group_ids: list[str],
+    base_url: str,
+) -> dict[str, dict]:
+    """Fetch node specs for several groups concurrently over plain HTTP.
+
+    Groups that fail (including ones needing the browser fallback) are left
+    out so the caller can retry them serially.
+    """
+
+    def fetch(group_id: str) -> tuple[str, Optional[dict]]:
+        _THREAD_STATE.requests_only = True
+        try:
+            return group_id, fetch_node_specs(session, group_id, base_url)
+        except Exception:
+            return group_id, None
+        finally:
+            _THREAD_STATE.requests_only = False
+
+    with ThreadPoolExecutor(max_workers=min(8, len(compute_group_ids))) as executor:
+        return {
+            group_id: data
+            for group_id, data in executor.map(fetch, compute_group_ids)
+            if data is not None
+        }
+
+
 def fetch_gpu_availability(
     session: WebSession,
     compute_group_ids: list[str],
     base_url: str = "https://api.example.com",
 ) -> list[GPUAvailability]:
     """Fetch accurate per-GPU availability for compute groups."""
-    results = []
+    prefetched: dict[str, dict] = {}
+    node_specs_url = f"{base_url}/api/v1/compute_resources/node_specs/"
+    if len(compute_group_ids) > 1 and not _needs_browser(node_specs_url):
+        prefetched = _prefetch_node_specs(session, compute_group_ids, base_url)
 
+    results = []
     for group_id in compute_group_ids:
         try:
-            data = fetch_node_specs(session, group_id, base_url)
-
-            # Parse the response to count free GPUs
-            nodes = data.get("data", {}).get("node_dimensions", [])
-
-            total_gpus = 0
-            free_gpus = 0
-            low_priority_gpus = 0
-            group_name = ""
-            gpu_type = ""
-
-            for node in nodes:
-                gpu_count = node.get("gpu_count", 8)
-                total_gpus += gpu_count
-
-                # Check tasks_associated for each GPU dimension
-                tasks = node.get("tasks_associated", [])
-                if not tasks:
-                    free_gpus += gpu_count
-                else:
-                    # Check if tasks are low priority
-                    for task in tasks:
-                        priority = task.get("priority", 10)
-                        if priority < 5:  # Low priority threshold
-                            low_priority_gpus += 1
-
-                if not group_name:
-                    group_name = node.get("logic_compute_group_name", "Unknown")
-                if not gpu_type:
-                    gpu_info = node.get("gpu_info", {})
-                    gpu_type = gpu_info.get("gpu_type_display", "Unknown")
-
-            results.append(GPUAvailability(
-                group_id=group_id,
-                group_name=group_name,
-                gpu_type=gpu_type,
-                total_gpus=total_gpus,
-                free_gpus=free_gpus,
-                low_priority_gpus=low_priority_gpus,
-            ))
-
+            data = prefetched.get(group_id)
+            if data is None:
+                data = fetch_node_specs(session, group_id, base_url)
+            results.append(_parse_node_specs(group_id, data))
         except Exception as e:
             # Skip groups that fail
             print(f"Warning: Failed to fetch {group_id}: {e}")
             continue
 
+    save_group_meta(
+        {
+            r.group_id: {"group_name": r.group_name, "gpu_type": r.gpu_type}
+            for r in results
+            if r.group_name and r.group_name != "Unknown"
+        }
+    )
     return results
 
 
 def clear_session_cache() -> None:
     """Clear the cached web session."""
+    global _LAST_LOAD
+    _LAST_LOAD = None
     if SESSION_CACHE_FILE.exists():
         SESSION_CACHE_FILE.unlink()
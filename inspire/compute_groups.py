@@ -2,7 +2,20 @@
 
 from __future__ import annotations
 
+import functools
+import json
+import os
 from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping, Optional
+
+# compute_group_id -> {"group_name": ..., "gpu_type": ...}, as last seen from
+# the node specs API. Names and GPU types do not change per group, so this
+# lets labels be resolved without a network round-trip.
+GROUP_META_CACHE_FILE = Path.home() / ".cache" / "inspire-cli" / "group_meta.json"
+
+_group_meta: Optional[dict[str, dict[str, str]]] = None
 
 
 @dataclass(frozen=True)
@@ -24,7 +37,8 @@ def load_compute_groups_from_config(raw_list: list[dict]) -> tuple[ComputeGroupD
         raw_list: List of compute group dicts from config.toml
 
     Returns:
-        Tuple of ComputeGroupDefinition objects
+        Tuple of ComputeGroupDefinition objects (entries that are not tables
+        are skipped)
 
     Example config.toml:
         [[compute_groups]]
@@ -33,32 +47,79 @@ def load_compute_groups_from_config(raw_list: list[dict]) -> tuple[ComputeGroupD
         gpu_type = "H100"
         location = "CUDA 12.8"
     """
-    groups = []
-    for item in raw_list:
+    return tuple(
+        ComputeGroupDefinition(
+            name=item.get("name", ""),
+            compute_group_id=item.get("id", ""),
+            gpu_type=item.get("gpu_type", ""),
+            location=item.get("location", ""),
+        )
+        for item in raw_list
+        if isinstance(item, dict)
+    )
+
+
+def _load_group_meta() -> dict[str, dict[str, str]]:
+    global _group_meta
+    if _group_meta is None:
         try:
-            groups.append(
-                ComputeGroupDefinition(
-                    name=item.get("name", ""),
-                    compute_group_id=item.get("id", ""),
-                    gpu_type=item.get("gpu_type", ""),
-                    location=item.get("location", ""),
-                )
-            )
-        except (KeyError, TypeError) as e:
-            # Skip invalid entries
-            continue
-    return tuple(groups)
+            data = json.loads(GROUP_META_CACHE_FILE.read_text())
+        except (OSError, ValueError):
+            data = {}
+        _group_meta = data if isinstance(data, dict) else {}
+    return _group_meta
 
 
+def get_group_meta(group_id: str) -> Optional[dict[str, str]]:
+    """Return the cached ``{"group_name", "gpu_type"}`` for a compute group, if any."""
+    return _load_group_meta().get(group_id)
+
+
+def save_group_meta(entries: dict[str, dict[str, str]]) -> None:
+    """Merge group metadata into the disk cache; a no-op when nothing changed.
+
+    Empty or ``"Unknown"`` values never overwrite a field that is already cached.
+    """
+    meta = _load_group_meta()
+    changed = {}
+    for gid, info in entries.items():
+        current = meta.get(gid) or {}
+        merged = {**current, **{k: v for k, v in info.items() if v and v != "Unknown"}}
+        if merged != current:
+            changed[gid] = merged
+    if not changed:
+        return
+    meta.update(changed)
+    try:
+        GROUP_META_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = GROUP_META_CACHE_FILE.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(meta))
+        os.replace(tmp_path, GROUP_META_CACHE_FILE)
+    except OSError:
+        pass
+
+
+@functools.lru_cache(maxsize=4)
 def compute_group_name_map(
     groups: tuple[ComputeGroupDefinition, ...] = COMPUTE_GROUPS,
-) -> dict[str, str]:
+) -> Mapping[str, str]:
     """Create a mapping from compute group ID to name.
 
+    The result is cached per ``groups`` tuple and returned as a read-only view.
+
     Args:
         groups: Tuple of ComputeGroupDefinition objects
 
     Returns:
-        Dict mapping compute_group_id to name
+        Read-only mapping of compute_group_id to configured name
+    """
+    return MappingProxyType({group.compute_group_id: group.name for group in groups})
+
+
+def resolve_group_name(group_id: str, names: Mapping[str, str]) -> str:
+    """Return the name for ``group_id`` from ``names``, else the one cached on disk.
+
+    Groups configured without a name fall back to the name last seen from the
+    node specs API, so labels do not need a network round-trip.
     """
-    return {group.compute_group_id: group.name for group in groups}
+    return names.get(group_id) or (get_group_meta(group_id) or {}).get("group_name", "")
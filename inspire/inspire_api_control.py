@@ -19,22 +19,64 @@ New Features:
 API Documentation: https://api.example.com/openapi/
 """
 
+from __future__ import annotations
+
+import bisect
+import functools
 import os
 import json
 import logging
-import requests
-import argparse
+import sys
 import time
-import re
-from typing import Dict, Any, Optional, Tuple, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Dict, Any, Iterator, Optional, Set, Tuple, List
 from dataclasses import dataclass
-from enum import Enum
+
+import click
 
 from inspire.compute_groups import load_compute_groups_from_config
 
-# Suppress SSL warnings when verification is disabled
-import urllib3
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+if TYPE_CHECKING:
+    import requests
+
+try:
+    import orjson
+
+    def _json_loads(data: bytes):
+        return orjson.loads(data)
+
+    def _json_dumps(obj, *, indent: bool = False) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+
+except ImportError:  # orjson is optional
+
+    def _json_loads(data: bytes):
+        return json.loads(data)
+
+    def _json_dumps(obj, *, indent: bool = False) -> bytes:
+        return json.dumps(
+            obj,
+            ensure_ascii=False,
+            indent=2 if indent else None,
+            separators=(",", ": " if indent else ":"),
+        ).encode("utf-8")
+
+try:
+    # google-re2 gives linear-time matching; the patterns below stay RE2-compatible
+    import re2 as _re
+except ImportError:  # pragma: no cover - optional dependency
+    import re as _re
+
+
+@functools.lru_cache(maxsize=1)
+def _lazy_requests():
+    """Import ``requests`` on first API use; commands that stay offline skip it."""
+    import requests
+    import urllib3
+
+    # Suppress SSL warnings when verification is disabled
+    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+    return requests
 
 
 # Configure logging
@@ -47,6 +89,17 @@ logger = logging.getLogger(__name__)
 DEFAULT_SHM_ENV_VAR = "INSPIRE_SHM_SIZE"
 
 
+def _env_flag(name: str) -> bool:
+    return os.getenv(name, '').lower() in ('1', 'true', 'yes')
+
+
+# Connection flags are resolved once at import rather than per client
+_SKIP_SSL_VERIFY = _env_flag('INSPIRE_SKIP_SSL_VERIFY')
+_FORCE_PROXY = _env_flag('INSPIRE_FORCE_PROXY')
+_USE_HTTP2 = _env_flag('INSPIRE_HTTP2')
+
+
+@functools.lru_cache(maxsize=1)
 def _get_default_shm_size(fallback: int = 200) -> int:
     """Read default shared memory size from env, falling back to a sane default."""
     env_value = os.getenv(DEFAULT_SHM_ENV_VAR)
@@ -71,16 +124,22 @@ def _get_default_shm_size(fallback: int = 200) -> int:
     return fallback
 
 
-class GPUType(Enum):
-    """GPU type enumeration."""
-    H100 = "H100"
-    H200 = "H200"
+# Resource request, matched against the upper-cased request with spaces
+# removed: "4xH200"/"4H200"/"4 H200" (c1, t1) or "H200"/"H200x4"/"H200 4" (t2, c2)
+_RES_COMBINED = _re.compile(r'^(?:(?P<c1>\d+)X?(?P<t1>H100|H200)|(?P<t2>H100|H200)X?(?P<c2>\d+)?)$')
+_LOCATION_NUM_RE = _re.compile(r'\d+')
+
+
+# GPU types are plain strings ("H100"/"H200"): comparisons and dict lookups
+# in the spec/group indexes stay at str speed instead of going through Enum.
+GPUType = str
+_VALID_GPU_TYPES = frozenset({"H100", "H200"})
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceSpec:
     """Resource specification configuration."""
-    gpu_type: GPUType
+    gpu_type: str
     gpu_count: int
     cpu_cores: int
     memory_gb: int
@@ -89,16 +148,16 @@ class ResourceSpec:
     description: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ComputeGroup:
     """Compute group configuration."""
     name: str
     compute_group_id: str
-    gpu_type: GPUType
+    gpu_type: str
     location: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class InspireConfig:
     """Inspire API configuration class."""
     base_url: str = "https://api.example.com"
@@ -114,6 +173,49 @@ class InspireConfig:
     compute_groups: Optional[list[dict]] = None  # List of compute group dicts from config
 
 
+def _digit_substrings(text: str) -> Set[str]:
+    """Return every substring of every digit run in text ("Room 12" -> {"1", "2", "12"})."""
+    subs: Set[str] = set()
+    for run in _LOCATION_NUM_RE.findall(text):
+        for i in range(len(run)):
+            for j in range(i + 1, len(run) + 1):
+                subs.add(run[i:j])
+    return subs
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_resource_cached(resource_str: str) -> Tuple[GPUType, int]:
+    """Parse a non-empty resource request; see ResourceManager.parse_resource_request."""
+    # Clean up and convert to uppercase
+    resource_str = resource_str.upper().strip()
+
+    gpu_count = 1  # Default count
+    gpu_type_str = None
+
+    match = _RES_COMBINED.match(resource_str.replace(' ', ''))
+    if match:
+        gpu_type_str = match.group('t1') or match.group('t2')
+        gpu_count = int(match.group('c1') or match.group('c2') or 1)
+
+    # If no number+GPU pattern matched, try to match GPU type directly
+    if not gpu_type_str:
+        if 'H200' in resource_str:
+            gpu_type_str = 'H200'
+        elif 'H100' in resource_str:
+            gpu_type_str = 'H100'
+
+    if not gpu_type_str:
+        raise ValueError(f"Unrecognized GPU type: {resource_str}")
+
+    if gpu_type_str not in _VALID_GPU_TYPES:
+        raise ValueError(f"Unsupported GPU type: {gpu_type_str}, supported types: H100, H200")
+
+    if gpu_count <= 0:
+        raise ValueError(f"GPU count must be positive: {gpu_count}")
+
+    return gpu_type_str, gpu_count
+
+
 class ResourceManager:
     """Resource manager - handles resource spec and compute group matching."""
 
@@ -121,7 +223,7 @@ class ResourceManager:
         # Define available resource specs
         self.resource_specs = [
             ResourceSpec(
-                gpu_type=GPUType.H200,
+                gpu_type="H200",
                 gpu_count=1,
                 cpu_cores=15,
                 memory_gb=200,
@@ -130,7 +232,7 @@ class ResourceManager:
                 description="1 × NVIDIA H200 (141GB) + 15 CPU cores + 200GB RAM"
             ),
             ResourceSpec(
-                gpu_type=GPUType.H200,
+                gpu_type="H200",
                 gpu_count=4,
                 cpu_cores=60,
                 memory_gb=800,
@@ -139,7 +241,7 @@ class ResourceManager:
                 description="4 × NVIDIA H200 (141GB) + 60 CPU cores + 800GB RAM"
             ),
             ResourceSpec(
-                gpu_type=GPUType.H200,
+                gpu_type="H200",
                 gpu_count=8,
                 cpu_cores=120,
                 memory_gb=1600,
@@ -151,16 +253,57 @@ class ResourceManager:
 
         # Define available compute groups from config
         compute_groups_tuples = load_compute_groups_from_config(compute_groups_raw or [])
+        for group in compute_groups_tuples:
+            if group.gpu_type not in _VALID_GPU_TYPES:
+                raise ValueError(f"{group.gpu_type!r} is not a valid GPUType")
         self.compute_groups = [
             ComputeGroup(
                 name=group.name,
                 compute_group_id=group.compute_group_id,
-                gpu_type=GPUType(group.gpu_type),
+                gpu_type=group.gpu_type,
                 location=group.location,
             )
             for group in compute_groups_tuples
         ]
-    
+
+        # Lookup indexes by GPU type, stored as tuples so callers can never
+        # mutate them; the find_* methods hand out fresh lists. H100 requests
+        # can also run on H200 specs (same spec_id), so those are included in
+        # the H100 bucket.
+        groups_by_gpu: Dict[GPUType, List[ComputeGroup]] = {}
+        for group in self.compute_groups:
+            groups_by_gpu.setdefault(group.gpu_type, []).append(group)
+        self._groups_by_gpu: Dict[GPUType, Tuple[ComputeGroup, ...]] = {
+            gpu_type: tuple(groups) for gpu_type, groups in groups_by_gpu.items()
+        }
+
+        self._specs_by_gpu: Dict[GPUType, Tuple[ResourceSpec, ...]] = {
+            gpu_type: tuple(sorted(
+                (
+                    spec for spec in self.resource_specs
+                    if spec.gpu_type == gpu_type
+                    or (gpu_type == "H100" and spec.gpu_type == "H200")
+                ),
+                key=lambda spec: spec.gpu_count,
+            ))
+            for gpu_type in _VALID_GPU_TYPES
+        }
+        self._spec_counts_by_gpu: Dict[GPUType, Tuple[int, ...]] = {
+            gpu_type: tuple(spec.gpu_count for spec in specs)
+            for gpu_type, specs in self._specs_by_gpu.items()
+        }
+        self._recommended_config = functools.lru_cache(maxsize=128)(
+            self._compute_recommended_config
+        )
+
+        # Per-group location metadata for prefer_location matching, keyed by
+        # compute_group_id: (lowercased location, every substring of each digit
+        # run). A set lookup on the latter is equivalent to `num in location`.
+        self._loc_meta: Dict[str, Tuple[str, Set[str]]] = {
+            group.compute_group_id: (group.location.lower(), _digit_substrings(group.location))
+            for group in self.compute_groups
+        }
+
     def parse_resource_request(self, resource_str: str) -> Tuple[GPUType, int]:
         """
         Parse natural language resource request.
@@ -177,55 +320,8 @@ class ResourceManager:
         if not resource_str:
             raise ValueError("Resource description cannot be empty")
 
-        # Clean up and convert to uppercase
-        resource_str = resource_str.upper().strip()
-
-        # Match patterns: number + x/X + GPU type, or number + space + GPU type, or just GPU type
-        patterns = [
-            r'^(\d+)[xX]?(H100|H200)$',  # "4xH200", "4H200", "4 H200"
-            r'^(H100|H200)[xX]?(\d+)?$',  # "H200", "H200x4", "H200 4"
-            r'^(\d+)\s+(H100|H200)$',     # "4 H200"
-        ]
-
-        gpu_count = 1  # Default count
-        gpu_type_str = None
-        
-        for pattern in patterns:
-            match = re.match(pattern, resource_str.replace(' ', ''))
-            if match:
-                groups = match.groups()
-                if len(groups) == 2:
-                    # 可能是 (数字, GPU类型) 或 (GPU类型, 数字)
-                    if groups[0].isdigit():
-                        gpu_count = int(groups[0])
-                        gpu_type_str = groups[1]
-                    elif groups[1] and groups[1].isdigit():
-                        gpu_type_str = groups[0]
-                        gpu_count = int(groups[1])
-                    else:
-                        gpu_type_str = groups[0] if not groups[0].isdigit() else groups[1]
-                break
-        
-        # If no number+GPU pattern matched, try to match GPU type directly
-        if not gpu_type_str:
-            if 'H200' in resource_str:
-                gpu_type_str = 'H200'
-            elif 'H100' in resource_str:
-                gpu_type_str = 'H100'
-
-        if not gpu_type_str:
-            raise ValueError(f"Unrecognized GPU type: {resource_str}")
-
-        try:
-            gpu_type = GPUType(gpu_type_str)
-        except ValueError:
-            raise ValueError(f"Unsupported GPU type: {gpu_type_str}, supported types: H100, H200")
+        return _parse_resource_cached(resource_str)
 
-        if gpu_count <= 0:
-            raise ValueError(f"GPU count must be positive: {gpu_count}")
-        
-        return gpu_type, gpu_count
-    
     def find_matching_specs(self, gpu_type: GPUType, gpu_count: int) -> List[ResourceSpec]:
         """
         Find matching resource specs.
@@ -237,18 +333,10 @@ class ResourceManager:
         Returns:
             List of matching resource specs
         """
-        matching_specs = []
-
-        for spec in self.resource_specs:
-            # For H100, since spec_id is the same, H200 specs can be used
-            if (spec.gpu_type == gpu_type or
-                (gpu_type == GPUType.H100 and spec.gpu_type == GPUType.H200)):
-                if spec.gpu_count >= gpu_count:
-                    matching_specs.append(spec)
-
-        # Sort by GPU count, prefer configurations closest to requirements
-        matching_specs.sort(key=lambda x: x.gpu_count)
-        return matching_specs
+        # Specs are pre-sorted by GPU count, closest to requirements first
+        counts = self._spec_counts_by_gpu.get(gpu_type, _EMPTY)
+        specs = self._specs_by_gpu.get(gpu_type, _EMPTY)
+        return list(specs[bisect.bisect_left(counts, gpu_count):])
 
     def find_compute_groups(self, gpu_type: GPUType) -> List[ComputeGroup]:
         """
@@ -260,12 +348,17 @@ class ResourceManager:
         Returns:
             List of matching compute groups
         """
-        return [group for group in self.compute_groups if group.gpu_type == gpu_type]
+        return list(self._groups_by_gpu.get(gpu_type, _EMPTY))
 
-    def get_recommended_config(self, resource_str: str, prefer_location: Optional[str] = None) -> Tuple[str, str]:
+    def get_recommended_config(
+        self, resource_str: str, prefer_location: Optional[str] = None
+    ) -> Tuple[str, str]:
         """
         Get recommended configuration.
 
+        Results are memoized per (resource_str, prefer_location); the spec
+        table and compute groups are fixed once the manager is built.
+
         Args:
             resource_str: Resource description string
             prefer_location: Preferred datacenter location
@@ -276,15 +369,21 @@ class ResourceManager:
         Raises:
             ValueError: When no matching configuration is found
         """
+        return self._recommended_config(resource_str, prefer_location)
+
+    def _compute_recommended_config(
+        self, resource_str: str, prefer_location: Optional[str]
+    ) -> Tuple[str, str]:
+        """Uncached get_recommended_config."""
         gpu_type, gpu_count = self.parse_resource_request(resource_str)
 
         # Find matching specs
         matching_specs = self.find_matching_specs(gpu_type, gpu_count)
         if not matching_specs:
-            available_configs = [f"{spec.gpu_count}x{spec.gpu_type.value}"
+            available_configs = [f"{spec.gpu_count}x{spec.gpu_type}"
                                for spec in self.resource_specs]
             raise ValueError(
-                f"No configuration found matching {gpu_count}x{gpu_type.value}. "
+                f"No configuration found matching {gpu_count}x{gpu_type}. "
                 f"Available configurations: {', '.join(available_configs)}"
             )
 
@@ -294,28 +393,30 @@ class ResourceManager:
         # Find matching compute groups
         matching_groups = self.find_compute_groups(gpu_type)
         if not matching_groups:
-            raise ValueError(f"No compute group found supporting {gpu_type.value}")
+            raise ValueError(f"No compute group found supporting {gpu_type}")
 
         # Select compute group (consider location preference)
         selected_group = matching_groups[0]  # Default to first one
 
         if prefer_location:
             matched = False
+            loc_meta = self._loc_meta
 
             # Step 1: Try substring match
+            pl = prefer_location.lower()
             for group in matching_groups:
-                if prefer_location.lower() in group.location.lower():
+                if pl in loc_meta[group.compute_group_id][0]:
                     selected_group = group
                     matched = True
                     break
 
             # Step 2: Try number-based semantic match
             if not matched:
-                numbers = re.findall(r'\d+', prefer_location)
+                numbers = _LOCATION_NUM_RE.findall(prefer_location)
                 if numbers:
                     for num in numbers:
                         for group in matching_groups:
-                            if num in group.location:
+                            if num in loc_meta[group.compute_group_id][1]:
                                 selected_group = group
                                 matched = True
                                 break
@@ -326,33 +427,38 @@ class ResourceManager:
             if not matched:
                 available_locations = [g.location for g in matching_groups]
                 raise ValueError(
-                    f"Location '{prefer_location}' not found for {gpu_type.value}. "
+                    f"Location '{prefer_location}' not found for {gpu_type}. "
                     f"Available locations: {', '.join(available_locations)}"
                 )
 
         return selected_spec.spec_id, selected_group.compute_group_id
-    
+
     def display_available_resources(self) -> None:
         """Display all available resource configurations."""
-        print("\n📊 Available Resource Configurations:")
-        print("=" * 60)
-
-        print("\n🖥️  GPU Spec Configurations:")
+        # Built up front and written once rather than one print() per line
+        lines = [
+            "\n📊 Available Resource Configurations:",
+            "=" * 60,
+            "\n🖥️  GPU Spec Configurations:",
+        ]
         for spec in self.resource_specs:
-            print(f"  • {spec.description}")
-            print(f"    Spec ID: {spec.spec_id}")
+            lines.append(f"  • {spec.description}")
+            lines.append(f"    Spec ID: {spec.spec_id}")
 
-        print("\n🏢 Compute Groups:")
+        lines.append("\n🏢 Compute Groups:")
         for group in self.compute_groups:
-            print(f"  • {group.name} ({group.location})")
-            print(f"    Compute Group ID: {group.compute_group_id}")
+            lines.append(f"  • {group.name} ({group.location})")
+            lines.append(f"    Compute Group ID: {group.compute_group_id}")
 
-        print("\n💡 Usage Examples:")
-        print("  • --resource 'H200'     -> 1x H200 GPU")
-        print("  • --resource '4xH200'   -> 4x H200 GPU")
-        print("  • --resource '8 H200'   -> 8x H200 GPU")
-        print("  • --resource 'H100'     -> 1x H100 GPU")
-        print("=" * 60)
+        lines.extend([
+            "\n💡 Usage Examples:",
+            "  • --resource 'H200'     -> 1x H200 GPU",
+            "  • --resource '4xH200'   -> 4x H200 GPU",
+            "  • --resource '8 H200'   -> 8x H200 GPU",
+            "  • --resource 'H100'     -> 1x H100 GPU",
+            "=" * 60,
+        ])
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 class APIEndpoints:
@@ -440,8 +546,16 @@ def _translate_api_error(code: int, message: str) -> str:
 
 
 # Job ID format: job-<uuid> where uuid is 8-4-4-4-12 hex chars
-JOB_ID_PATTERN = re.compile(r'^job-[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$', re.IGNORECASE)
+JOB_ID_PATTERN = _re.compile(
+    r'(?i)^job-[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$'
+)
 JOB_ID_EXPECTED_LENGTH = 40  # "job-" (4) + UUID with hyphens (36)
+_JOB_ID_FULLMATCH = JOB_ID_PATTERN.fullmatch
+
+
+def _is_valid_job_id(job_id: str) -> bool:
+    """Check the job-<uuid> format with a single precompiled regex step."""
+    return _JOB_ID_FULLMATCH(job_id) is not None
 
 
 def _validate_job_id_format(job_id: str) -> Optional[str]:
@@ -455,19 +569,28 @@ def _validate_job_id_format(job_id: str) -> Optional[str]:
     if not job_id.startswith("job-"):
         return f"Job ID should start with 'job-', got: {job_id[:20]}..."
 
-    if JOB_ID_PATTERN.match(job_id):
+    if _is_valid_job_id(job_id):
         return None  # Valid
 
     # Try to give a helpful hint
     actual_len = len(job_id)
     if actual_len < JOB_ID_EXPECTED_LENGTH:
         missing = JOB_ID_EXPECTED_LENGTH - actual_len
-        return (f"Job ID appears to be truncated (got {actual_len} chars, expected {JOB_ID_EXPECTED_LENGTH}). "
+        return (f"Job ID appears to be truncated (got {actual_len} chars, "
+                f"expected {JOB_ID_EXPECTED_LENGTH}). "
                 f"Missing {missing} character(s). Did you copy the full ID?")
     elif actual_len > JOB_ID_EXPECTED_LENGTH:
         return f"Job ID is too long (got {actual_len} chars, expected {JOB_ID_EXPECTED_LENGTH})"
     else:
-        return f"Job ID format is invalid. Expected format: job-xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx"
+        return ("Job ID format is invalid. "
+                "Expected format: job-xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx")
+
+
+# Shared immutable stand-in for empty list fields in request payloads; both
+# JSON encoders write tuples as arrays.
+_EMPTY: tuple = ()
+
+_VALID_POOLS: frozenset[str] = frozenset({'online', 'backup', 'fault', 'unknown'})
 
 
 class InspireAPI:
@@ -483,7 +606,8 @@ class InspireAPI:
     DEFAULT_IMAGE_TYPE = "SOURCE_PRIVATE"
     DEFAULT_PROJECT_ID = os.getenv(
         'INSPIRE_PROJECT_ID',
-        "project-00000000-0000-0000-0000-000000000000" # Placeholder - set INSPIRE_PROJECT_ID env var
+        # Placeholder - set INSPIRE_PROJECT_ID env var
+        "project-00000000-0000-0000-0000-000000000000",
     )
     DEFAULT_WORKSPACE_ID = os.getenv(
         'INSPIRE_WORKSPACE_ID',
@@ -493,12 +617,12 @@ class InspireAPI:
     DEFAULT_IMAGE_PATH = "inspire-studio/ngc-cuda12.8-base:1.0"
     DEFAULT_DOCKER_REGISTRY = "docker.example.com"
     ERROR_BODY_PREVIEW_LIMIT = 4000
+    BATCH_MAX_JOBS = 1000  # jobs accepted per create_training_jobs_batch call
+    NODE_LIST_CACHE_TTL = 30  # seconds a cluster node page is served from memory
 
     def _get_default_image(self) -> str:
         """Get the default Docker image, using configurable registry if set."""
-        if self.config.docker_registry:
-            return f"{self.config.docker_registry}/{self.DEFAULT_IMAGE_PATH}"
-        return self.DEFAULT_IMAGE
+        return self._default_image
 
     def __init__(self, config: Optional[InspireConfig] = None):
         """
@@ -510,15 +634,16 @@ class InspireAPI:
         self.config = config or InspireConfig()
 
         # Check for SSL verification override via environment variable
-        if os.getenv('INSPIRE_SKIP_SSL_VERIFY', '').lower() in ('1', 'true', 'yes'):
+        if _SKIP_SSL_VERIFY:
             self.config.verify_ssl = False
 
         self.base_url = self.config.base_url.rstrip('/')
         self.token = None
-        self.headers = {
-            'Content-Type': 'application/json',
-            'Accept': 'application/json'
-        }
+        self._default_image = (
+            f"{self.config.docker_registry}/{self.DEFAULT_IMAGE_PATH}"
+            if self.config.docker_registry
+            else self.DEFAULT_IMAGE
+        )
 
         # Initialize API endpoints with configurable prefixes
         self.endpoints = APIEndpoints(
@@ -529,14 +654,41 @@ class InspireAPI:
         # Initialize resource manager
         self.resource_manager = ResourceManager(self.config.compute_groups)
 
-        # Use simple requests session
+        requests = _lazy_requests()
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        # One pooled keep-alive session for the whole job lifecycle
+        # (auth, create, detail, polling) so TCP/TLS setup is paid once.
         self.session = requests.Session()
+        # Timeouts, connection errors and gateway 5xx are retried here with
+        # exponential backoff (429 honours Retry-After). A plain 500 usually
+        # carries an API error body and is left to _make_request_with_retry.
+        retry = Retry(
+            total=self.config.max_retries,
+            backoff_factor=self.config.retry_delay,
+            status_forcelist=(429, 502, 503, 504),
+            allowed_methods=frozenset({'GET', 'POST'}),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         # Enable proxy and no_proxy support from environment by default
         self.session.trust_env = True
 
+        # Default headers live on the session so requests never pass (or
+        # merge) a per-call headers dict; self.headers is the same mapping.
+        self.session.headers.update({
+            'Content-Type': 'application/json',
+            'Accept': 'application/json',
+            'Connection': 'keep-alive',
+        })
+        self.headers = self.session.headers
+
         # Optional override: force using proxy even if no_proxy would normally bypass it.
         # This preserves the previous WSL corporate-proxy workaround when needed.
-        if os.getenv('INSPIRE_FORCE_PROXY', '').lower() in ('1', 'true', 'yes'):
+        if _FORCE_PROXY:
             http_proxy = os.environ.get('http_proxy') or os.environ.get('HTTP_PROXY')
             https_proxy = os.environ.get('https_proxy') or os.environ.get('HTTPS_PROXY')
             if http_proxy or https_proxy:
@@ -544,179 +696,272 @@ class InspireAPI:
                     'http': http_proxy or https_proxy,
                     'https': https_proxy or http_proxy,
                 }
-                logger.debug(f"INSPIRE_FORCE_PROXY enabled, using explicit proxy configuration: {self.session.proxies}")
-    
+                logger.debug(
+                    "INSPIRE_FORCE_PROXY enabled, using explicit proxy configuration: %s",
+                    self.session.proxies,
+                )
+
+        # list_cluster_nodes cache: (page_num, page_size, resource_pool)
+        # -> (etag, expires_at, result)
+        self._node_list_cache: Dict[
+            Tuple[int, int, Optional[str]], Tuple[Optional[str], float, Dict[str, Any]]
+        ] = {}
+
+        # Opt-in HTTP/2 (INSPIRE_HTTP2=1): auth, create and polling share one
+        # multiplexed connection with HPACK-compressed headers.
+        self.client = None
+        self._http_error_types: Tuple[type, ...] = (requests.exceptions.HTTPError,)
+        if _USE_HTTP2:
+            self.client = self._build_http2_client()
+
+    def close(self) -> None:
+        """Close pooled connections held by the client."""
+        if self.client is not None:
+            self.client.close()
+        self.session.close()
+
+    def __enter__(self) -> "InspireAPI":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _build_http2_client(self):
+        """Create an httpx HTTP/2 client, or return None if httpx[http2] is missing."""
+        try:
+            import httpx
+            import h2  # noqa: F401 - required by httpx for http2=True
+        except ImportError:
+            logger.warning(
+                "INSPIRE_HTTP2 is set but httpx[http2] is not installed; using HTTP/1.1."
+            )
+            return None
+
+        requests = _lazy_requests()
+        # A custom transport disables httpx's own proxy discovery, so resolve
+        # the proxy the same way the requests session would (no_proxy included).
+        proxies = self.session.proxies or requests.utils.get_environ_proxies(self.base_url)
+        transport = httpx.HTTPTransport(
+            http2=True,
+            verify=self.config.verify_ssl,
+            retries=self.config.max_retries,
+            proxy=requests.utils.select_proxy(self.base_url, proxies),
+        )
+        # Connection: keep-alive is not a legal HTTP/2 header, so it is left out
+        client = httpx.Client(
+            transport=transport,
+            timeout=self.config.timeout,
+            follow_redirects=True,
+            headers={
+                'Content-Type': 'application/json',
+                'Accept': 'application/json',
+            },
+        )
+        self.headers = client.headers
+        self._http_error_types = (requests.exceptions.HTTPError, httpx.HTTPStatusError)
+        return client
+
+    def _send_http2(self, method: str, url: str, **kwargs):
+        """Send a request through the HTTP/2 client, mapping httpx errors to InspireAPIError."""
+        import httpx
+
+        kwargs.pop('verify', None)  # fixed on the transport
+        if 'data' in kwargs:
+            kwargs['content'] = kwargs.pop('data')
+        retries = self.config.max_retries
+        try:
+            return self.client.request(method.upper(), url, **kwargs)
+        except httpx.TimeoutException as e:
+            raise InspireAPIError(f"Request timeout after {retries} retries") from e
+        except httpx.TransportError as e:
+            raise InspireAPIError(f"Connection error after {retries} retries: {str(e)}") from e
+        except httpx.HTTPError as e:
+            raise InspireAPIError(f"Request failed: {str(e)}") from e
+
     def _validate_required_params(self, **kwargs) -> None:
         """Validate required parameters."""
         for param_name, param_value in kwargs.items():
             if param_value is None or (isinstance(param_value, str) and not param_value.strip()):
                 raise ValidationError(f"Required parameter '{param_name}' cannot be empty")
-    
+
     def _make_request_with_retry(self, method: str, url: str, **kwargs) -> requests.Response:
-        """Request method with retry mechanism."""
-        last_exception = None
+        """Send a request; transient failures are retried by the session's urllib3 Retry.
+
+        With INSPIRE_HTTP2 the httpx transport retries failed connects instead.
+        """
+        requests = _lazy_requests()
         # Add SSL verification setting to kwargs if not already present
         if 'verify' not in kwargs:
             kwargs['verify'] = self.config.verify_ssl
+        retries = self.config.max_retries
 
-        for attempt in range(self.config.max_retries + 1):
+        if self.client is not None:
+            response = self._send_http2(method, url, **kwargs)
+        else:
             try:
-                if method.upper() == 'POST':
-                    response = self.session.post(url, timeout=self.config.timeout, **kwargs)
-                else:
-                    response = self.session.get(url, timeout=self.config.timeout, **kwargs)
-
-                if response.status_code < 500:
-                    return response
-                else:
-                    # Check if server returned an API error in JSON body (don't retry these)
-                    try:
-                        error_body = response.json()
-                        error_code = error_body.get('code')
-                        error_msg = error_body.get('message', '')
-                        if error_code is not None and error_code != 0:
-                            # This is an API-level error, not a transient server error
-                            # Don't retry - return immediately so caller can handle it
-                            logger.warning(f"API error {error_code}: {error_msg} (HTTP {response.status_code})")
-                            return response
-                    except (ValueError, KeyError):
-                        pass  # Not JSON or missing fields, treat as normal 500
-
-                    if attempt < self.config.max_retries:
-                        logger.warning(f"Server error {response.status_code}, retrying in {self.config.retry_delay}s...")
-                        time.sleep(self.config.retry_delay * (attempt + 1))
-                        continue
-                    else:
-                        response.raise_for_status()
-
-            except requests.exceptions.Timeout as e:
-                last_exception = e
-                if attempt < self.config.max_retries:
-                    logger.warning(f"Request timeout, retrying in {self.config.retry_delay}s...")
-                    time.sleep(self.config.retry_delay * (attempt + 1))
-                    continue
-                else:
-                    raise InspireAPIError(f"Request timeout after {self.config.max_retries} retries")
-
-            except requests.exceptions.ConnectionError as e:
-                last_exception = e
-                if attempt < self.config.max_retries:
-                    logger.warning(f"Connection error, retrying in {self.config.retry_delay}s...")
-                    time.sleep(self.config.retry_delay * (attempt + 1))
-                    continue
-                else:
-                    raise InspireAPIError(f"Connection error after {self.config.max_retries} retries: {str(e)}")
-            
+                response = self.session.request(
+                    method.upper(), url, timeout=self.config.timeout, **kwargs
+                )
             except requests.exceptions.SSLError as e:
-                last_exception = e
+                error_msg = str(e)
                 if not self.config.verify_ssl:
-                    logger.warning(f"SSL error detected, but SSL verification is disabled. This may be normal with corporate proxies.")
-                if attempt < self.config.max_retries:
-                    logger.warning(f"SSL error, retrying in {self.config.retry_delay}s...")
-                    time.sleep(self.config.retry_delay * (attempt + 1))
-                    continue
-                else:
-                    error_msg = str(e)
-                    if not self.config.verify_ssl:
-                        error_msg += "\n💡 Hint: SSL verification is disabled (INSPIRE_SKIP_SSL_VERIFY=1). If this persists, check your proxy settings or firewall."
-                    raise InspireAPIError(f"SSL error after {self.config.max_retries} retries: {error_msg}")
-
+                    error_msg += (
+                        "\n💡 Hint: SSL verification is disabled (INSPIRE_SKIP_SSL_VERIFY=1). "
+                        "If this persists, check your proxy settings or firewall."
+                    )
+                raise InspireAPIError(f"SSL error after {retries} retries: {error_msg}")
+            except requests.exceptions.Timeout:
+                raise InspireAPIError(f"Request timeout after {retries} retries")
+            except requests.exceptions.ConnectionError as e:
+                raise InspireAPIError(f"Connection error after {retries} retries: {str(e)}")
             except requests.exceptions.RequestException as e:
                 raise InspireAPIError(f"Request failed: {str(e)}")
 
-        if last_exception:
-            raise InspireAPIError(f"All retry attempts failed. Last error: {str(last_exception)}")
-        else:
-            raise InspireAPIError("All retry attempts failed")
+        if response.status_code >= 500:
+            # An API error in the JSON body is not transient; hand it to the caller
+            try:
+                error_body = _json_loads(response.content)
+                error_code = error_body.get('code')
+                error_msg = error_body.get('message', '')
+                if error_code is not None and error_code != 0:
+                    logger.warning(
+                        "API error %s: %s (HTTP %s)", error_code, error_msg, response.status_code
+                    )
+                    return response
+            except (ValueError, KeyError, AttributeError):
+                pass  # Not JSON or missing fields, treat as normal 5xx
+            response.raise_for_status()
+
+        return response
+
+    def _body_preview(self, response) -> Tuple[str, bool]:
+        """Decode at most ERROR_BODY_PREVIEW_LIMIT bytes of the body; also report truncation.
+
+        Slicing the raw bytes first means a large error page is never decoded
+        in full just to show its first few KB.
+        """
+        content = response.content or b""
+        raw = bytes(memoryview(content)[:self.ERROR_BODY_PREVIEW_LIMIT])
+        try:
+            preview = raw.decode(response.encoding or "utf-8", errors="replace")
+        except LookupError:  # unknown charset in Content-Type
+            preview = raw.decode("utf-8", errors="replace")
+        return preview, len(content) > self.ERROR_BODY_PREVIEW_LIMIT
 
     def _summarize_response_error(self, response: Optional[requests.Response]) -> str:
         """Format HTTP error response with status, URL, headers, and truncated body."""
         if response is None:
             return "No HTTP response available."
-        headers = {k: v for k, v in response.headers.items()}
-        body_preview = response.text or ""
-        truncated = False
-        if len(body_preview) > self.ERROR_BODY_PREVIEW_LIMIT:
-            body_preview = body_preview[:self.ERROR_BODY_PREVIEW_LIMIT]
-            truncated = True
+        body_preview, truncated = self._body_preview(response)
+        reason = getattr(response, 'reason', None) or getattr(response, 'reason_phrase', '')
         summary_lines = [
-            f"Status: {response.status_code} {response.reason}",
+            f"Status: {response.status_code} {reason}",
             f"URL: {response.url}",
-            f"Headers: {json.dumps(headers, ensure_ascii=False)}",
+            f"Headers: {_json_dumps(dict(response.headers)).decode('utf-8')}",
             "Body:",
             (body_preview.strip() or "<empty>")
         ]
         if truncated:
-            summary_lines.append(f"... (truncated to {self.ERROR_BODY_PREVIEW_LIMIT} characters)")
+            summary_lines.append(f"... (truncated to {self.ERROR_BODY_PREVIEW_LIMIT} bytes)")
         return "\n".join(summary_lines)
 
-    def _make_request(self, method: str, endpoint: str, payload: Optional[Dict] = None) -> Dict[str, Any]:
+    def _make_request(
+        self, method: str, endpoint: str, payload: Optional[Dict] = None
+    ) -> Dict[str, Any]:
         """Generic method for sending HTTP requests."""
+        return self._request_json(method, endpoint, payload)[0]
+
+    def _request_json(
+        self,
+        method: str,
+        endpoint: str,
+        payload: Optional[Dict] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Tuple[Optional[Dict[str, Any]], Any]:
+        """Send a request and return (result, response).
+
+        headers are merged over the client headers for this call only. The
+        result is None when the server answers 304 Not Modified.
+        """
+        requests = _lazy_requests()
         url = f"{self.base_url}{endpoint}"
         response: Optional[requests.Response] = None
 
         try:
-            kwargs = {'headers': self.headers}
+            kwargs = {}
             if payload is not None:
-                kwargs['json'] = payload
+                # Content-Type: application/json is already a client header
+                kwargs['data'] = _json_dumps(payload)
+            if headers:
+                kwargs['headers'] = headers
 
             response = self._make_request_with_retry(method, url, **kwargs)
 
-            logger.debug(f"Request: {method} {url}")
-            logger.debug(f"Response status: {response.status_code}")
+            logger.debug("Request: %s %s", method, url)
+            logger.debug("Response status: %s", response.status_code)
 
+            if response.status_code == 304:
+                return None, response
             response.raise_for_status()
-            result = response.json()
+            result = _json_loads(response.content)
 
             if not isinstance(result, dict) or 'code' not in result:
                 raise InspireAPIError("Invalid API response format")
 
-            return result
+            return result, response
 
-        except requests.exceptions.HTTPError as http_err:
+        except self._http_error_types as http_err:
             error_summary = self._summarize_response_error(http_err.response or response)
             logger.error("❌ Inspire API returned non-success response.\n%s", error_summary)
-            raise InspireAPIError(f"HTTP error while requesting {endpoint}: {error_summary}") from http_err
+            raise InspireAPIError(
+                f"HTTP error while requesting {endpoint}: {error_summary}"
+            ) from http_err
         except json.JSONDecodeError:
-            body_preview = (response.text[:self.ERROR_BODY_PREVIEW_LIMIT] + "..."
-                            if response and len(response.text) > self.ERROR_BODY_PREVIEW_LIMIT
-                            else (response.text if response else "<no response>"))
+            if response is None:
+                body_preview = "<no response>"
+            else:
+                body_preview, truncated = self._body_preview(response)
+                if truncated:
+                    body_preview += "..."
             raise InspireAPIError(f"Invalid JSON response from API. Body preview: {body_preview}")
         except requests.exceptions.RequestException as e:
             raise InspireAPIError(f"Request failed: {str(e)}")
-    
+
     def authenticate(self, username: str, password: str) -> bool:
         """Authenticate with username and password to obtain access token."""
         self._validate_required_params(username=username, password=password)
-        
+
         payload = {
             "username": username,
             "password": password
         }
-        
+
         try:
             result = self._make_request('POST', self.endpoints.AUTH_TOKEN, payload)
-            
+
             if result.get('code') == 0:
                 self.token = result['data']['access_token']
+                # self.headers is the active client's header mapping
                 self.headers['Authorization'] = f"Bearer {self.token}"
                 expires_in = result['data'].get('expires_in', 'unknown')
-                logger.info(f"🔐 Authentication successful. Token expires in {expires_in} seconds.")
+                logger.info(
+                    "🔐 Authentication successful. Token expires in %s seconds.", expires_in
+                )
                 return True
             else:
                 error_msg = result.get('message', 'Unknown authentication error')
                 raise AuthenticationError(f"Authentication failed: {error_msg}")
-                
+
         except InspireAPIError as e:
             if "Authentication failed" in str(e):
                 raise
             raise AuthenticationError(f"Authentication request failed: {str(e)}")
-    
+
     def _check_authentication(self) -> None:
         """Check if authenticated."""
         if not self.token:
             raise AuthenticationError("Not authenticated. Please authenticate first.")
-    
+
     def create_training_job_smart(self,
                                 name: str,
                                 command: str,
@@ -763,7 +1008,36 @@ class InspireAPI:
             AuthenticationError: When not authenticated
         """
         self._check_authentication()
-
+        return self.create_training_job(**self._smart_create_kwargs(
+            name=name,
+            command=command,
+            resource=resource,
+            framework=framework,
+            prefer_location=prefer_location,
+            project_id=project_id,
+            workspace_id=workspace_id,
+            image=image,
+            task_priority=task_priority,
+            instance_count=instance_count,
+            shm_gi=shm_gi,
+            max_running_time_ms=max_running_time_ms,
+            auto_fault_tolerance=auto_fault_tolerance,
+            enable_notification=enable_notification,
+            enable_troubleshoot=enable_troubleshoot,
+            **kwargs
+        ))
+
+    def _smart_create_kwargs(self,
+                             name: str,
+                             command: str,
+                             resource: str,
+                             framework: str = "pytorch",
+                             prefer_location: Optional[str] = None,
+                             project_id: Optional[str] = None,
+                             workspace_id: Optional[str] = None,
+                             image: Optional[str] = None,
+                             **kwargs) -> Dict[str, Any]:
+        """Resolve a smart (resource-string) request into create_training_job arguments."""
         # Validate required parameters
         self._validate_required_params(name=name, command=command, resource=resource)
 
@@ -772,63 +1046,76 @@ class InspireAPI:
             spec_id, compute_group_id = self.resource_manager.get_recommended_config(
                 resource, prefer_location
             )
-            logger.info(f"🎯 Smart resource matching:")
-            logger.info(f"   Resource: {resource}")
-            logger.info(f"   Spec ID: {spec_id}")
-            logger.info(f"   Compute Group ID: {compute_group_id}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("🎯 Smart resource matching:")
+                logger.info("   Resource: %s", resource)
+                logger.info("   Spec ID: %s", spec_id)
+                logger.info("   Compute Group ID: %s", compute_group_id)
         except ValueError as e:
             raise ValidationError(f"Resource matching failed: {str(e)}")
 
         # Fill optional parameters with defaults
-        project_id = project_id or self.DEFAULT_PROJECT_ID
-        workspace_id = workspace_id or self.DEFAULT_WORKSPACE_ID
-        image = image or self._get_default_image()
-
-        # Call the original create method
-        return self.create_training_job(
+        return dict(
             name=name,
             logic_compute_group_id=compute_group_id,
-            project_id=project_id,
-            workspace_id=workspace_id,
+            project_id=project_id or self.DEFAULT_PROJECT_ID,
+            workspace_id=workspace_id or self.DEFAULT_WORKSPACE_ID,
             framework=framework,
             command=command,
             spec_id=spec_id,
-            task_priority=task_priority,
-            auto_fault_tolerance=auto_fault_tolerance,
-            enable_notification=enable_notification,
-            enable_troubleshoot=enable_troubleshoot,
-            image=image,
-            instance_count=instance_count,
-            shm_gi=shm_gi,
-            max_running_time_ms=max_running_time_ms,
+            image=image or self._get_default_image(),
             **kwargs
         )
-    
-    def create_training_job(self, 
-                           name: str, 
-                           logic_compute_group_id: str, 
+
+    def create_training_job(self,
+                           name: str,
+                           logic_compute_group_id: str,
                            project_id: str,
                            workspace_id: str,
                            framework: str,
                            command: str,
                            spec_id: str,
-                           task_priority: int = DEFAULT_TASK_PRIORITY,
-                           auto_fault_tolerance: bool = False,
-                           enable_notification: bool = False,
-                           enable_troubleshoot: bool = False,
-                           image: str = "",
-                           image_type: str = DEFAULT_IMAGE_TYPE,
-                           instance_count: int = DEFAULT_INSTANCE_COUNT,
-                           shm_gi: int = DEFAULT_SHM_SIZE,
-                           max_running_time_ms: str = DEFAULT_MAX_RUNNING_TIME,
-                           reserve_on_fail_ms: str = "0",
-                           reserve_on_success_ms: str = "0",
-                           tb_summary_path: str = "",
-                           dataset_info: Optional[list] = None,
-                           envs: Optional[list] = None) -> Dict[str, Any]:
-        """Create distributed training job (original method)."""
-        self._check_authentication()
+                           **kwargs) -> Dict[str, Any]:
+        """Create distributed training job (original method).
 
+        Optional arguments are those of _build_create_payload.
+        """
+        self._check_authentication()
+        payload = self._build_create_payload(
+            name=name,
+            logic_compute_group_id=logic_compute_group_id,
+            project_id=project_id,
+            workspace_id=workspace_id,
+            framework=framework,
+            command=command,
+            spec_id=spec_id,
+            **kwargs
+        )
+        return self._submit_create(payload)
+
+    def _build_create_payload(self,
+                              name: str,
+                              logic_compute_group_id: str,
+                              project_id: str,
+                              workspace_id: str,
+                              framework: str,
+                              command: str,
+                              spec_id: str,
+                              task_priority: int = DEFAULT_TASK_PRIORITY,
+                              auto_fault_tolerance: bool = False,
+                              enable_notification: bool = False,
+                              enable_troubleshoot: bool = False,
+                              image: str = "",
+                              image_type: str = DEFAULT_IMAGE_TYPE,
+                              instance_count: int = DEFAULT_INSTANCE_COUNT,
+                              shm_gi: int = DEFAULT_SHM_SIZE,
+                              max_running_time_ms: str = DEFAULT_MAX_RUNNING_TIME,
+                              reserve_on_fail_ms: str = "0",
+                              reserve_on_success_ms: str = "0",
+                              tb_summary_path: str = "",
+                              dataset_info: Optional[list] = None,
+                              envs: Optional[list] = None) -> Dict[str, Any]:
+        """Validate job arguments and build the train_job/create request payload."""
         # Validate required parameters
         self._validate_required_params(
             name=name,
@@ -839,7 +1126,7 @@ class InspireAPI:
             command=command,
             spec_id=spec_id
         )
-        
+
         # Validate numeric parameters
         if instance_count < 1:
             raise ValidationError("Instance count must be at least 1")
@@ -853,7 +1140,7 @@ class InspireAPI:
             image = self._get_default_image()
 
         # Build request payload
-        payload = {
+        return {
             "name": name,
             "logic_compute_group_id": logic_compute_group_id,
             "project_id": project_id,
@@ -875,57 +1162,91 @@ class InspireAPI:
                 "shm_gi": shm_gi,
                 "spec_id": spec_id
             }],
-            "dataset_info": dataset_info or [],
-            "envs": envs or []
+            "dataset_info": dataset_info if dataset_info else _EMPTY,
+            "envs": envs if envs else _EMPTY
         }
-        
+
+    def _submit_create(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """POST a built create payload and check the API result."""
+        name = payload["name"]
         logger.debug("Creating training job with payload structure defined")
-        
+
         try:
             result = self._make_request('POST', self.endpoints.TRAIN_JOB_CREATE, payload)
-            
+
             if result.get('code') == 0:
-                logger.info(f"✅ Training job '{name}' created successfully.")
+                logger.info("✅ Training job '%s' created successfully.", name)
                 if 'data' in result and 'job_id' in result['data']:
-                    logger.info(f"🆔 Job ID: {result['data']['job_id']}")
+                    logger.info("🆔 Job ID: %s", result['data']['job_id'])
                 return result
             else:
                 error_msg = result.get('message', 'Unknown error')
                 raise JobCreationError(f"Failed to create training job: {error_msg}")
-                
+
         except InspireAPIError as e:
             if "Failed to create training job" in str(e):
                 raise
             raise JobCreationError(f"Training job creation request failed: {str(e)}")
-    
-    def get_job_detail(self, job_id: str) -> Dict[str, Any]:
-        """Get training job details."""
-        self._check_authentication()
-        self._validate_required_params(job_id=job_id)
 
-        # Validate job ID format before making API call
-        format_error = _validate_job_id_format(job_id)
-        if format_error:
-            raise JobNotFoundError(f"Invalid job ID '{job_id}': {format_error}")
+    def create_training_jobs_batch(
+        self, jobs: List[Dict[str, Any]], max_workers: int = 1
+    ) -> List[Dict[str, Any]]:
+        """Create many training jobs with one authenticated, pooled session.
+
+        Each item holds create_training_job_smart arguments (``resource``) or
+        create_training_job arguments (``spec_id``/``logic_compute_group_id``),
+        plus an optional ``custom_id`` (defaults to the item index). Every item
+        is validated before anything is submitted; failures are reported per
+        item instead of aborting the batch. With max_workers > 1 the valid
+        items are submitted concurrently. At most BATCH_MAX_JOBS items are
+        accepted per call.
+
+        Returns:
+            One ``{"custom_id", "status": "ok"|"error", "result"|"error"}``
+            record per input item, in input order.
+        """
+        self._check_authentication()
+        if len(jobs) > self.BATCH_MAX_JOBS:
+            raise ValidationError(
+                f"Batch has {len(jobs)} jobs; at most {self.BATCH_MAX_JOBS} are allowed"
+            )
 
-        payload = {"job_id": job_id}
+        records: List[Dict[str, Any]] = []
+        payloads: List[Tuple[Dict[str, Any], Dict[str, Any]]] = []
+        for index, job in enumerate(jobs):
+            job = dict(job)
+            record: Dict[str, Any] = {"custom_id": str(job.pop("custom_id", index))}
+            records.append(record)
+            try:
+                kwargs = self._smart_create_kwargs(**job) if "resource" in job else job
+                payloads.append((record, self._build_create_payload(**kwargs)))
+            except (InspireAPIError, TypeError) as e:
+                record.update(status="error", error=str(e))
 
-        result = self._make_request('POST', self.endpoints.TRAIN_JOB_DETAIL, payload)
+        def submit(item: Tuple[Dict[str, Any], Dict[str, Any]]) -> None:
+            record, payload = item
+            try:
+                record.update(status="ok", result=self._submit_create(payload))
+            except InspireAPIError as e:
+                record.update(status="error", error=str(e))
 
-        if result.get('code') == 0:
-            logger.info(f"📋 Retrieved details for job {job_id}")
-            return result
+        if max_workers > 1 and len(payloads) > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(payloads))) as executor:
+                list(executor.map(submit, payloads))
         else:
-            error_code = result.get('code')
-            error_msg = result.get('message', 'Unknown error')
-            friendly_msg = _translate_api_error(error_code, error_msg)
-            # Use specific exception for parameter errors (likely invalid job ID)
-            if error_code == 100002:
-                raise JobNotFoundError(f"Failed to get job details for '{job_id}': {friendly_msg}")
-            raise InspireAPIError(f"Failed to get job details: {friendly_msg}")
-    
-    def stop_training_job(self, job_id: str) -> bool:
-        """Stop training job."""
+            for item in payloads:
+                submit(item)
+
+        return records
+
+    def _post_job_id(
+        self, endpoint_attr: str, job_id: str, action: str, failure: str
+    ) -> Dict[str, Any]:
+        """POST {"job_id": ...} to one endpoint and return the successful result.
+
+        Checks authentication and the job ID format first, and maps API errors
+        (100002 -> JobNotFoundError) using ``action`` and ``failure`` in the message.
+        """
         self._check_authentication()
         self._validate_required_params(job_id=job_id)
 
@@ -934,217 +1255,240 @@ class InspireAPI:
         if format_error:
             raise JobNotFoundError(f"Invalid job ID '{job_id}': {format_error}")
 
-        payload = {"job_id": job_id}
-
-        result = self._make_request('POST', self.endpoints.TRAIN_JOB_STOP, payload)
+        result = self._make_request(
+            'POST', getattr(self.endpoints, endpoint_attr), {"job_id": job_id}
+        )
 
         if result.get('code') == 0:
-            logger.info(f"🛑 Training job {job_id} stopped successfully.")
-            return True
-        else:
-            error_code = result.get('code')
-            error_msg = result.get('message', 'Unknown error')
-            friendly_msg = _translate_api_error(error_code, error_msg)
-            if error_code == 100002:
-                raise JobNotFoundError(f"Failed to stop job '{job_id}': {friendly_msg}")
-            raise InspireAPIError(f"Failed to stop training job: {friendly_msg}")
+            return result
+        error_code = result.get('code')
+        error_msg = result.get('message', 'Unknown error')
+        friendly_msg = _translate_api_error(error_code, error_msg)
+        # Use specific exception for parameter errors (likely invalid job ID)
+        if error_code == 100002:
+            raise JobNotFoundError(f"Failed to {action} '{job_id}': {friendly_msg}")
+        raise InspireAPIError(f"Failed to {failure}: {friendly_msg}")
 
-    def list_cluster_nodes(self,
-                          page_num: int = 1,
-                          page_size: int = 10,
-                          resource_pool: Optional[str] = None) -> Dict[str, Any]:
-        """Get cluster node list."""
+    def get_job_detail(self, job_id: str) -> Dict[str, Any]:
+        """Get training job details."""
+        result = self._post_job_id(
+            'TRAIN_JOB_DETAIL', job_id, "get job details for", "get job details"
+        )
+        logger.info("📋 Retrieved details for job %s", job_id)
+        return result
+
+    def stop_training_job(self, job_id: str) -> bool:
+        """Stop training job."""
+        self._post_job_id('TRAIN_JOB_STOP', job_id, "stop job", "stop training job")
+        logger.info("🛑 Training job %s stopped successfully.", job_id)
+        return True
+
+    def _fan_out(self, func, job_ids: List[str], max_workers: int) -> List[Dict[str, Any]]:
+        """Run func(job_id) concurrently and collect a per-id status record.
+
+        Failures are recorded per job ID instead of aborting the whole call.
+        """
         self._check_authentication()
-        
+
+        def run(job_id: str) -> Dict[str, Any]:
+            try:
+                return {"job_id": job_id, "status": "ok", "result": func(job_id)}
+            except InspireAPIError as e:
+                return {"job_id": job_id, "status": "error", "error": str(e)}
+
+        if not job_ids:
+            return []
+        # Each call is one network round-trip on the shared pooled session,
+        # so threads overlap them
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(job_ids))) as executor:
+            return list(executor.map(run, job_ids))
+
+    def get_job_details(self, job_ids: List[str], max_workers: int = 10) -> List[Dict[str, Any]]:
+        """Get details for several jobs concurrently; one record per job ID, in order."""
+        return self._fan_out(self.get_job_detail, job_ids, max_workers)
+
+    def stop_training_jobs(self, job_ids: List[str], max_workers: int = 10) -> List[Dict[str, Any]]:
+        """Stop several jobs concurrently; one record per job ID, in order."""
+        return self._fan_out(self.stop_training_job, job_ids, max_workers)
+
+    def _node_list_payload(
+        self, page_num: int, page_size: int, resource_pool: Optional[str]
+    ) -> Dict[str, Any]:
+        """Validate cluster node list arguments and build the request payload."""
         if page_num < 1:
             raise ValidationError("Page number must be at least 1")
         if page_size < 1 or page_size > 1000:
             raise ValidationError("Page size must be between 1 and 1000")
-        
-        valid_pools = ['online', 'backup', 'fault', 'unknown']
-        if resource_pool and resource_pool not in valid_pools:
-            raise ValidationError(f"Resource pool must be one of: {valid_pools}")
-        
+
+        if resource_pool and resource_pool not in _VALID_POOLS:
+            raise ValidationError(f"Resource pool must be one of: {sorted(_VALID_POOLS)}")
+
         payload = {
             "page_num": page_num,
             "page_size": page_size
         }
-        
+
         if resource_pool:
             payload["filter"] = {"resource_pool": resource_pool}
-        
-        result = self._make_request('POST', self.endpoints.CLUSTER_NODES_LIST, payload)
-        
+        return payload
+
+    def list_cluster_nodes(self,
+                          page_num: int = 1,
+                          page_size: int = 10,
+                          resource_pool: Optional[str] = None) -> Dict[str, Any]:
+        """Get cluster node list."""
+        self._check_authentication()
+        payload = self._node_list_payload(page_num, page_size, resource_pool)
+
+        # Node topology changes far less often than it is listed: serve a
+        # page from memory for NODE_LIST_CACHE_TTL seconds, then revalidate
+        # with If-None-Match when the server sent an ETag.
+        cache_key = (page_num, page_size, resource_pool)
+        cached = self._node_list_cache.get(cache_key)
+        if cached and cached[1] > time.monotonic():
+            return cached[2]
+
+        headers = {'If-None-Match': cached[0]} if cached and cached[0] else None
+        result, response = self._request_json(
+            'POST', self.endpoints.CLUSTER_NODES_LIST, payload, headers=headers
+        )
+        if result is None:
+            if not cached:
+                raise InspireAPIError("Failed to get node list: unexpected 304 Not Modified")
+            result = cached[2]
+
         if result.get('code') == 0:
+            etag = response.headers.get('ETag') or (cached[0] if cached else None)
+            self._node_list_cache[cache_key] = (
+                etag, time.monotonic() + self.NODE_LIST_CACHE_TTL, result
+            )
             node_count = len(result['data'].get('nodes', []))
-            logger.info(f"🖥️  Retrieved {node_count} nodes successfully.")
+            logger.info("🖥️  Retrieved %d nodes successfully.", node_count)
             return result
         else:
             error_msg = result.get('message', 'Unknown error')
             raise InspireAPIError(f"Failed to get node list: {error_msg}")
 
 
+    def list_cluster_nodes_stream(self,
+                                  page_num: int = 1,
+                                  page_size: int = 10,
+                                  resource_pool: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Yield the nodes of one cluster node page as they are parsed.
+
+        With ijson installed, a plain 200 JSON response is parsed incrementally
+        so a 1000-node page is never held as raw bytes plus a full object tree.
+        Without ijson, over HTTP/2, or on any other response, this falls back
+        to list_cluster_nodes.
+        """
+        self._check_authentication()
+        payload = self._node_list_payload(page_num, page_size, resource_pool)
+
+        try:
+            import ijson
+        except ImportError:  # ijson is optional
+            ijson = None
+
+        if ijson is not None and self.client is None:
+            endpoint = self.endpoints.CLUSTER_NODES_LIST
+            try:
+                response = self._make_request_with_retry(
+                    'POST', f"{self.base_url}{endpoint}", data=_json_dumps(payload), stream=True
+                )
+            except self._http_error_types as http_err:
+                error_summary = self._summarize_response_error(http_err.response)
+                raise InspireAPIError(
+                    f"HTTP error while requesting {endpoint}: {error_summary}"
+                ) from http_err
+            with response:
+                content_type = response.headers.get('Content-Type', '')
+                if response.status_code == 200 and 'json' in content_type:
+                    response.raw.decode_content = True
+                    yield from self._iter_streamed_nodes(ijson, response.raw)
+                    return
+
+        result = self.list_cluster_nodes(page_num, page_size, resource_pool)
+        yield from result['data'].get('nodes', [])
+
+    @staticmethod
+    def _iter_streamed_nodes(ijson, raw) -> Iterator[Dict[str, Any]]:
+        """Build each data.nodes item from ijson events and check the API code."""
+        code = None
+        message = 'Unknown error'
+        builder = None
+        for prefix, event, value in ijson.parse(raw, use_float=True):
+            if builder is not None:
+                builder.event(event, value)
+                if prefix == 'data.nodes.item' and event in ('end_map', 'end_array'):
+                    yield builder.value
+                    builder = None
+            elif prefix == 'data.nodes.item' and event in ('start_map', 'start_array'):
+                if code not in (None, 0):
+                    break
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+            elif prefix == 'code':
+                code = value
+            elif prefix == 'message':
+                message = value
+        if code != 0:
+            raise InspireAPIError(f"Failed to get node list: {message}")
+
+
+
 def get_credentials() -> tuple[str, str]:
     """Get credentials from environment variables."""
     username = os.getenv('INSPIRE_USERNAME')
     password = os.getenv('INSPIRE_PASSWORD')
-    
+
     if not username:
         raise ValidationError(
             "❌ Username not found. Please set INSPIRE_USERNAME environment variable.\n"
             "   Example: export INSPIRE_USERNAME='your_username'"
         )
-    
+
     if not password:
         raise ValidationError(
             "❌ Password not found. Please set INSPIRE_PASSWORD environment variable.\n"
             "   Example: export INSPIRE_PASSWORD='your_password'"
         )
-    
+
     return username, password
 
 
-def main():
-    """Main function - provides command line interface."""
-    parser = argparse.ArgumentParser(
-        description='🚀 Inspire Platform API Smart Control Tool',
-        epilog='Credentials provided via environment variables: INSPIRE_USERNAME and INSPIRE_PASSWORD\n'
-               'Use --show-resources to view all available resource configurations',
-        formatter_class=argparse.RawDescriptionHelpFormatter
-    )
+_CLI_EPILOG = (
+    '\b\n'
+    'Credentials provided via environment variables: INSPIRE_USERNAME and INSPIRE_PASSWORD\n'
+    'Use --show-resources to view all available resource configurations'
+)
+_POOL_CHOICES = click.Choice(['online', 'backup', 'fault', 'unknown'])
 
-    # Global options
-    parser.add_argument('--debug', action='store_true', help='Enable debug mode')
-    parser.add_argument('--base-url', type=str, default="https://api.example.com",
-                       help='API base URL (default: https://api.example.com)')
-    parser.add_argument('--show-resources', action='store_true',
-                       help='Show all available resource configurations and exit')
-
-    subparsers = parser.add_subparsers(dest='command', help='Available commands')
-
-    # Smart training job creation
-    create_parser = subparsers.add_parser('create', help='🎯 Smart distributed training job creation')
-    create_parser.add_argument('--name', required=True, type=str, help='Training job name')
-    create_parser.add_argument('--start-command', required=True, type=str, help='Start command')
-    create_parser.add_argument('--resource', required=True, type=str,
-                              help='Resource configuration (e.g., "H200", "4xH200", "8 H200", "H100")')
-    create_parser.add_argument('--framework', type=str, default="pytorch",
-                              help='Training framework (default: pytorch)')
-    create_parser.add_argument('--location', type=str,
-                              help='Preferred datacenter location (e.g., "Room1", "Room2")')
-    create_parser.add_argument('--priority', type=int, default=8,
-                              help='Task priority 1-10 (default: 8)')
-    create_parser.add_argument('--image', type=str,
-                              help='Custom image name (optional)')
-    create_parser.add_argument('--instances', type=int, default=1,
-                              help='Instance count (default: 1)')
-    default_shm_size = InspireAPI.DEFAULT_SHM_SIZE
-    create_parser.add_argument('--shm-size', type=int, default=default_shm_size,
-                              help=f'Shared memory size (Gi) (default: {default_shm_size}, overridable via {DEFAULT_SHM_ENV_VAR})')
-    create_parser.add_argument('--max-time-hours', type=float, default=100.0,
-                              help='Max running time (hours) (default: 100)')
-    create_parser.add_argument('--project-id', type=str,
-                              help='Project ID (optional, uses default)')
-    create_parser.add_argument('--workspace-id', type=str,
-                              help='Workspace ID (optional, uses default)')
-    create_parser.add_argument('--auto-fault-tolerance', action='store_true',
-                              help='Enable auto fault tolerance')
-    create_parser.add_argument('--enable-notification', action='store_true',
-                              help='Enable notifications')
-    create_parser.add_argument('--enable-troubleshoot', action='store_true',
-                              help='Enable troubleshooting')
-
-    # Query job details
-    detail_parser = subparsers.add_parser('detail', help='📋 Query training job details')
-    detail_parser.add_argument('--job-id', required=True, type=str, help='Job ID')
-
-    # Stop training job
-    stop_parser = subparsers.add_parser('stop', help='🛑 Stop training job')
-    stop_parser.add_argument('--job-id', required=True, type=str, help='Job ID')
-
-    # List cluster nodes
-    list_parser = subparsers.add_parser('list-nodes', help='🖥️  List cluster nodes')
-    list_parser.add_argument('--page', type=int, default=1, help='Page number (default: 1)')
-    list_parser.add_argument('--size', type=int, default=10, help='Page size (default: 10)')
-    list_parser.add_argument('--pool', type=str, choices=['online', 'backup', 'fault', 'unknown'],
-                            help='Resource pool filter')
-    
-    args = parser.parse_args()
 
-    # Show resource configuration and exit
-    if args.show_resources:
-        resource_manager = ResourceManager()
-        resource_manager.display_available_resources()
-        return 0
+def _split_job_ids(job_ids: str) -> List[str]:
+    return [job_id.strip() for job_id in job_ids.split(',') if job_id.strip()]
+
+
+def _print_records(records: List[Dict[str, Any]]) -> int:
+    """Print one JSON record per line; exit code 1 if any record failed."""
+    for record in records:
+        click.echo(_json_dumps(record).decode('utf-8'))
+    return 1 if any(record['status'] == 'error' for record in records) else 0
 
-    # Set log level
-    if args.debug:
-        logging.getLogger().setLevel(logging.DEBUG)
-        logger.debug("🐛 Debug mode enabled")
 
+def _run_with_api(ctx: click.Context, action: Callable[[InspireAPI], Optional[int]]) -> int:
+    """Authenticate, run action(api) and map failures to exit code 1."""
     try:
         # Get credentials from environment variables
         username, password = get_credentials()
 
         # Create API client
-        config = InspireConfig(base_url=args.base_url)
-        api = InspireAPI(config)
-
-        # Authenticate
-        logger.info("🔐 Authenticating with Inspire API...")
-        api.authenticate(username, password)
-
-        # Execute corresponding operation based on command
-        if args.command == 'create':
-            # Convert hours to milliseconds
-            max_time_ms = str(int(args.max_time_hours * 3600 * 1000))
-            
-            result = api.create_training_job_smart(
-                name=args.name,
-                command=args.start_command,
-                resource=args.resource,
-                framework=args.framework,
-                prefer_location=args.location,
-                project_id=args.project_id,
-                workspace_id=args.workspace_id,
-                image=args.image,
-                task_priority=args.priority,
-                instance_count=args.instances,
-                shm_gi=args.shm_size,
-                max_running_time_ms=max_time_ms,
-                auto_fault_tolerance=args.auto_fault_tolerance,
-                enable_notification=args.enable_notification,
-                enable_troubleshoot=args.enable_troubleshoot
-            )
-            
-            print("\n✅ Creation result:")
-            print(json.dumps(result, indent=2, ensure_ascii=False))
-
-        elif args.command == 'detail':
-            result = api.get_job_detail(args.job_id)
-            print("\n📋 Job details:")
-            print(json.dumps(result, indent=2, ensure_ascii=False))
-
-        elif args.command == 'stop':
-            api.stop_training_job(args.job_id)
-            print("🛑 Job stopped")
-
-        elif args.command == 'list-nodes':
-            result = api.list_cluster_nodes(
-                page_num=args.page,
-                page_size=args.size,
-                resource_pool=args.pool
-            )
-            print("\n🖥️  Node list:")
-            print(json.dumps(result, indent=2, ensure_ascii=False))
+        config = InspireConfig(base_url=ctx.obj['base_url'])
+        with InspireAPI(config) as api:
+            # Authenticate
+            logger.info("🔐 Authenticating with Inspire API...")
+            api.authenticate(username, password)
+            return action(api) or 0
 
-        else:
-            parser.print_help()
-            print("\n💡 Tip: Use --show-resources to view all available resource configurations")
-            return 1
-        
-        return 0
-        
     except (ValidationError, AuthenticationError, JobCreationError, InspireAPIError) as e:
         logger.error(f"❌ Error: {str(e)}")
         return 1
@@ -1153,11 +1497,210 @@ def main():
         return 1
     except Exception as e:
         logger.error(f"💥 Unexpected error: {str(e)}")
-        if args.debug:
+        if ctx.obj['debug']:
             import traceback
             traceback.print_exc()
         return 1
 
 
+def _run_batch_create(api: InspireAPI, path: str, concurrency: int) -> int:
+    """Create the jobs in a JSONL file and print one JSON record per line."""
+    with open(path, 'rb') as f:
+        jobs = [_json_loads(line) for line in f if line.strip()]
+    return _print_records(api.create_training_jobs_batch(jobs, max_workers=concurrency))
+
+
+@click.group(
+    invoke_without_command=True,
+    epilog=_CLI_EPILOG,
+    context_settings={'help_option_names': ['-h', '--help']},
+)
+@click.option('--debug', is_flag=True, help='Enable debug mode')
+@click.option(
+    '--base-url', default="https://api.example.com", show_default=True, help='API base URL'
+)
+@click.option('--show-resources', is_flag=True,
+              help='Show all available resource configurations and exit')
+@click.pass_context
+def cli(ctx: click.Context, debug: bool, base_url: str, show_resources: bool) -> None:
+    """🚀 Inspire Platform API Smart Control Tool"""
+    # Show resource configuration and exit
+    if show_resources:
+        ResourceManager().display_available_resources()
+        ctx.exit(0)
+
+    # Set log level
+    if debug:
+        logging.getLogger().setLevel(logging.DEBUG)
+        logger.debug("🐛 Debug mode enabled")
+
+    if ctx.invoked_subcommand is None:
+        click.echo(ctx.get_help())
+        click.echo("\n💡 Tip: Use --show-resources to view all available resource configurations")
+        ctx.exit(1)
+
+    ctx.obj = {'debug': debug, 'base_url': base_url}
+
+
+@cli.command()
+@click.option('--batch-file', type=click.Path(exists=True, dir_okay=False),
+              help='Create every job in a JSONL file instead (see create-batch)')
+@click.option('--concurrency', type=int, default=10, show_default=True,
+              help='Jobs submitted in parallel with --batch-file')
+@click.option('--name', help='Training job name (required without --batch-file)')
+@click.option('--start-command', help='Start command (required without --batch-file)')
+@click.option(
+    '--resource', help='Resource configuration (e.g., "H200", "4xH200", "8 H200", "H100")'
+)
+@click.option('--framework', default="pytorch", show_default=True, help='Training framework')
+@click.option('--location', help='Preferred datacenter location (e.g., "Room1", "Room2")')
+@click.option('--priority', type=int, default=8, show_default=True, help='Task priority 1-10')
+@click.option('--image', help='Custom image name (optional)')
+@click.option('--instances', type=int, default=1, show_default=True, help='Instance count')
+@click.option('--shm-size', type=int, default=InspireAPI.DEFAULT_SHM_SIZE, show_default=True,
+              help=f'Shared memory size (Gi), overridable via {DEFAULT_SHM_ENV_VAR}')
+@click.option('--max-time-hours', type=float, default=100.0, show_default=True,
+              help='Max running time (hours)')
+@click.option('--project-id', help='Project ID (optional, uses default)')
+@click.option('--workspace-id', help='Workspace ID (optional, uses default)')
+@click.option('--auto-fault-tolerance', is_flag=True, help='Enable auto fault tolerance')
+@click.option('--enable-notification', is_flag=True, help='Enable notifications')
+@click.option('--enable-troubleshoot', is_flag=True, help='Enable troubleshooting')
+@click.pass_context
+def create(ctx: click.Context, batch_file: Optional[str], concurrency: int, **options: Any) -> int:
+    """🎯 Smart distributed training job creation"""
+    if batch_file:
+        return _run_with_api(ctx, lambda api: _run_batch_create(api, batch_file, concurrency))
+    if not (options['name'] and options['start_command'] and options['resource']):
+        raise click.UsageError(
+            "create requires --name, --start-command and --resource unless --batch-file is given"
+        )
+
+    def action(api: InspireAPI) -> None:
+        # Convert hours to milliseconds
+        max_time_ms = str(int(options['max_time_hours'] * 3600 * 1000))
+
+        result = api.create_training_job_smart(
+            name=options['name'],
+            command=options['start_command'],
+            resource=options['resource'],
+            framework=options['framework'],
+            prefer_location=options['location'],
+            project_id=options['project_id'],
+            workspace_id=options['workspace_id'],
+            image=options['image'],
+            task_priority=options['priority'],
+            instance_count=options['instances'],
+            shm_gi=options['shm_size'],
+            max_running_time_ms=max_time_ms,
+            auto_fault_tolerance=options['auto_fault_tolerance'],
+            enable_notification=options['enable_notification'],
+            enable_troubleshoot=options['enable_troubleshoot']
+        )
+
+        click.echo("\n✅ Creation result:")
+        click.echo(_json_dumps(result, indent=True).decode('utf-8'))
+
+    return _run_with_api(ctx, action)
+
+
+@cli.command('create-batch')
+@click.option('--file', 'path', required=True, type=click.Path(exists=True, dir_okay=False),
+              help='JSONL file, one job per line (create arguments, optional "custom_id"); '
+                   f'at most {InspireAPI.BATCH_MAX_JOBS} jobs')
+@click.option(
+    '--concurrency', type=int, default=10, show_default=True, help='Jobs submitted in parallel'
+)
+@click.pass_context
+def create_batch(ctx: click.Context, path: str, concurrency: int) -> int:
+    """📦 Create many training jobs from a JSONL file"""
+    return _run_with_api(ctx, lambda api: _run_batch_create(api, path, concurrency))
+
+
+@cli.command()
+@click.option('--job-id', required=True, help='Job ID')
+@click.pass_context
+def detail(ctx: click.Context, job_id: str) -> int:
+    """📋 Query training job details"""
+
+    def action(api: InspireAPI) -> None:
+        result = api.get_job_detail(job_id)
+        click.echo("\n📋 Job details:")
+        click.echo(_json_dumps(result, indent=True).decode('utf-8'))
+
+    return _run_with_api(ctx, action)
+
+
+@cli.command()
+@click.option('--job-id', required=True, help='Job ID')
+@click.pass_context
+def stop(ctx: click.Context, job_id: str) -> int:
+    """🛑 Stop training job"""
+
+    def action(api: InspireAPI) -> None:
+        api.stop_training_job(job_id)
+        click.echo("🛑 Job stopped")
+
+    return _run_with_api(ctx, action)
+
+
+@cli.command('detail-many')
+@click.option('--job-ids', required=True, help='Comma-separated job IDs')
+@click.pass_context
+def detail_many(ctx: click.Context, job_ids: str) -> int:
+    """📋 Query several training jobs concurrently"""
+    return _run_with_api(
+        ctx, lambda api: _print_records(api.get_job_details(_split_job_ids(job_ids)))
+    )
+
+
+@cli.command('stop-many')
+@click.option('--job-ids', required=True, help='Comma-separated job IDs')
+@click.pass_context
+def stop_many(ctx: click.Context, job_ids: str) -> int:
+    """🛑 Stop several training jobs concurrently"""
+    return _run_with_api(
+        ctx, lambda api: _print_records(api.stop_training_jobs(_split_job_ids(job_ids)))
+    )
+
+
+@cli.command('list-nodes')
+@click.option('--page', type=int, default=1, show_default=True, help='Page number')
+@click.option('--size', type=int, default=10, show_default=True, help='Page size')
+@click.option('--pool', type=_POOL_CHOICES, help='Resource pool filter')
+@click.option(
+    '--stream', is_flag=True, help='Print one JSON node per line as the response is parsed'
+)
+@click.pass_context
+def list_nodes(ctx: click.Context, page: int, size: int, pool: Optional[str], stream: bool) -> int:
+    """🖥️  List cluster nodes"""
+
+    def action(api: InspireAPI) -> None:
+        if stream:
+            for node in api.list_cluster_nodes_stream(
+                page_num=page, page_size=size, resource_pool=pool
+            ):
+                sys.stdout.write(_json_dumps(node).decode('utf-8') + '\n')
+            return
+
+        result = api.list_cluster_nodes(page_num=page, page_size=size, resource_pool=pool)
+        click.echo("\n🖥️  Node list:")
+        click.echo(_json_dumps(result, indent=True).decode('utf-8'))
+
+    return _run_with_api(ctx, action)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main function - provides command line interface."""
+    try:
+        return cli.main(args=argv, prog_name="inspire_api_control.py", standalone_mode=False) or 0
+    except click.ClickException as e:
+        e.show()
+        return e.exit_code
+    except click.Abort:
+        logger.info("⏹️  Operation cancelled by user")
+        return 1
+
+
 if __name__ == "__main__":
     exit(main())
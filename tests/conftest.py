@@ -0,0 +1,339 @@
+"""Shared fixtures for the CLI test suite."""
+
+import copy
+import dataclasses
+import functools
+import importlib
+import re
+import uuid
+from pathlib import Path
+from types import ModuleType, SimpleNamespace
+from typing import Any, Callable, Dict, NamedTuple, Optional
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from inspire.cli.utils import auth as auth_module
+from inspire.cli.utils import config as config_module
+from inspire.cli.utils.auth import AuthenticationError
+from inspire.cli.utils.config import ConfigError
+from inspire.cli.utils.job_cache import JobCache
+from inspire.inspire_api_control import ResourceManager
+
+# Job IDs are "job-" followed by a lowercase UUID
+JOB_ID_RE = re.compile(r"job-[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}")
+
+TEST_JOB_ID = "job-12345678-1234-1234-1234-123456789abc"
+TEST_JOB_ID_2 = "job-abcdef12-3456-7890-abcd-ef1234567890"
+TEST_JOB_ID_3 = "job-11111111-2222-3333-4444-555555555555"
+
+
+def make_job_id() -> str:
+    """Return a fresh, well-formed job ID for tests that need many distinct jobs."""
+    return f"job-{uuid.uuid4()}"
+
+
+TEST_GROUP_ID = "lcg-test000-0000-0000-0000-000000000000"
+
+REMOTE_LOG_PATH = f"/train/logs/.inspire/training_master_{TEST_JOB_ID}.log"
+
+# Canonical job seeded by the seeded_cache fixture (JobCache.add_job kwargs).
+_DEFAULT_JOB_RECORD: Dict[str, Any] = {
+    "job_id": TEST_JOB_ID,
+    "name": "test-job",
+    "resource": "H200",
+    "command": "echo test",
+    "status": "RUNNING",
+    "log_path": REMOTE_LOG_PATH,
+}
+
+# Built once per session; tests only get a copy with their own tmp_path paths.
+_CONFIG_TEMPLATE = config_module.Config(
+    username="user",
+    password="pass",
+    base_url="https://example.invalid",
+    timeout=5,
+    max_retries=0,
+    retry_delay=0.0,
+)
+
+_TEST_COMPUTE_GROUPS = [
+    {
+        "name": "H200 TestRoom",
+        "id": TEST_GROUP_ID,
+        "gpu_type": "H200",
+        "location": "Test",
+    }
+]
+
+
+def make_test_config(tmp_path: Path, include_compute_groups: bool = False) -> config_module.Config:
+    """Create a test Config object rooted at ``tmp_path``.
+
+    Args:
+        tmp_path: Temporary directory path
+        include_compute_groups: If True, include test compute groups
+    """
+    return dataclasses.replace(
+        _CONFIG_TEMPLATE,
+        target_dir=str(tmp_path / "logs"),
+        job_cache_path=str(tmp_path / "jobs.json"),
+        log_cache_dir=str(tmp_path / "log_cache"),
+        compute_groups=[dict(g) for g in _TEST_COMPUTE_GROUPS] if include_compute_groups else [],
+    )
+
+
+class DummyAPI:
+    def __init__(self) -> None:
+        self.calls: Dict[str, Any] = {}
+        self.resource_manager = ResourceManager()
+
+    # Job-related methods -------------------------------------------------
+    def create_training_job_smart(self, **kwargs: Any) -> Dict[str, Any]:
+        self.calls["create_training_job_smart"] = kwargs
+        return {"data": {"job_id": TEST_JOB_ID}}
+
+    def get_job_detail(self, job_id: str) -> Dict[str, Any]:
+        self.calls.setdefault("get_job_detail", []).append(job_id)
+        return {
+            "data": {
+                "job_id": job_id,
+                "name": "test-job",
+                "status": "SUCCEEDED",
+                "running_time_ms": "1000",
+            }
+        }
+
+    def stop_training_job(self, job_id: str) -> None:
+        self.calls.setdefault("stop_training_job", []).append(job_id)
+
+    # Resource / nodes ----------------------------------------------------
+    def list_cluster_nodes(
+        self,
+        page_num: int,
+        page_size: int,
+        resource_pool: Optional[str],
+    ) -> Dict[str, Any]:
+        self.calls["list_cluster_nodes"] = {
+            "page_num": page_num,
+            "page_size": page_size,
+            "resource_pool": resource_pool,
+        }
+        return {
+            "data": {
+                "nodes": [
+                    {
+                        "node_id": "node-1",
+                        "resource_pool": resource_pool or "online",
+                        "status": "ready",
+                        "gpu_count": 4,
+                    }
+                ],
+                "total": 1,
+            }
+        }
+
+
+@pytest.fixture(scope="session")
+def runner() -> CliRunner:
+    """One CliRunner shared by the whole session; invoke() isolates each call."""
+    return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def cli_main() -> click.Group:
+    """The top-level ``inspire`` group, imported on first use rather than at collection."""
+    from inspire.cli.main import main
+
+    return main
+
+
+@pytest.fixture(scope="session")
+def job_cmd() -> ModuleType:
+    """The ``inspire.cli.commands.job`` module, for patching its module-level names.
+
+    ``inspire.cli.commands`` re-exports the ``job`` click group under the same
+    name, so the module itself has to be looked up through importlib.
+    """
+    return importlib.import_module("inspire.cli.commands.job")
+
+
+class FrozenClock:
+    """Deterministic stand-in for ``time.time``; ``time.sleep`` advances it instead of blocking."""
+
+    def __init__(self, start: float = 0.0) -> None:
+        self.now = start
+
+    def time(self) -> float:
+        return self.now
+
+    def tick(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def frozen_time(monkeypatch: pytest.MonkeyPatch, job_cmd: ModuleType) -> FrozenClock:
+    """Freeze the clock seen by the job commands for the duration of a test.
+
+    Only ``job_cmd.time`` is swapped out, so pytest and every other module
+    keep the real ``time`` module.
+    """
+    clock = FrozenClock()
+    monkeypatch.setattr(job_cmd, "time", SimpleNamespace(time=clock.time, sleep=clock.tick))
+    return clock
+
+
+class PatchedCLI(NamedTuple):
+    api: DummyAPI
+    config: config_module.Config
+
+
+def _patch_config_and_auth(
+    monkeypatch: pytest.MonkeyPatch, config: config_module.Config
+) -> PatchedCLI:
+    """Point Config loading and AuthManager.get_api at local stubs."""
+    Path(config.target_dir).mkdir(parents=True, exist_ok=True)
+    monkeypatch.setenv("INSPIRE_JOB_CACHE", config.job_cache_path)
+
+    def fake_from_env(cls, require_target_dir: bool = False) -> config_module.Config:  # type: ignore[override]
+        if require_target_dir and not config.target_dir:
+            raise ConfigError("Missing INSPIRE_TARGET_DIR")
+        return config
+
+    def fake_from_files_and_env(cls, require_target_dir: bool = False, require_credentials: bool = True) -> tuple:  # type: ignore[override]
+        if require_target_dir and not config.target_dir:
+            raise ConfigError("Missing INSPIRE_TARGET_DIR")
+        return config, {}
+
+    monkeypatch.setattr(config_module.Config, "from_env", classmethod(fake_from_env))
+    monkeypatch.setattr(config_module.Config, "from_files_and_env", classmethod(fake_from_files_and_env))
+
+    # A fresh DummyAPI (and ResourceManager) per test, so per-test stubs and
+    # resource lookup state never leak between tests.
+    api = DummyAPI()
+
+    def fake_get_api(self_or_cls, cfg: Optional[config_module.Config] = None) -> DummyAPI:  # type: ignore[override]
+        # Ensure we were passed the same config object
+        assert cfg is config or cfg is None
+        return api
+
+    monkeypatch.setattr(auth_module.AuthManager, "get_api", fake_get_api)
+    # Start from an empty token cache; monkeypatch restores the old state on teardown.
+    monkeypatch.setattr(auth_module.AuthManager, "_token", None)
+    monkeypatch.setattr(auth_module.AuthManager, "_expires_at", 0)
+    monkeypatch.setattr(auth_module.AuthManager, "_api", None)
+
+    return PatchedCLI(api, config)
+
+
+@pytest.fixture
+def patched_cli(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> PatchedCLI:
+    """Stub out config loading and authentication; yields ``(api, config)``."""
+    return _patch_config_and_auth(monkeypatch, make_test_config(tmp_path))
+
+
+@pytest.fixture
+def patched_cli_with_groups(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> PatchedCLI:
+    """Like ``patched_cli`` but with the test compute group configured."""
+    return _patch_config_and_auth(
+        monkeypatch, make_test_config(tmp_path, include_compute_groups=True)
+    )
+
+
+@pytest.fixture(scope="module")
+def shared_tmp(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """One directory tree per test module, for tests that never write to it."""
+    path = tmp_path_factory.mktemp("cli")
+    (path / "logs").mkdir()
+    (path / "log_cache").mkdir()
+    return path
+
+
+@pytest.fixture
+def patched_cli_shared(monkeypatch: pytest.MonkeyPatch, shared_tmp: Path) -> PatchedCLI:
+    """``patched_cli`` rooted at ``shared_tmp``; only for tests that leave the cache untouched."""
+    return _patch_config_and_auth(monkeypatch, make_test_config(shared_tmp))
+
+
+@pytest.fixture
+def patched_cli_failure(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Make config loading or authentication fail, per ``@pytest.mark.cli_failure``.
+
+    ``"config"`` makes Config loading raise ConfigError; ``"auth"`` loads the
+    test config but makes AuthManager.get_api raise AuthenticationError.
+    """
+    marker = request.node.get_closest_marker("cli_failure")
+    if marker is None:
+        pytest.fail("patched_cli_failure requires @pytest.mark.cli_failure('auth'|'config')")
+    mode = marker.args[0]
+
+    if mode == "config":
+
+        def fail_config(cls, *args: Any, **kwargs: Any):  # type: ignore[override]
+            raise ConfigError("missing env")
+
+        monkeypatch.setattr(config_module.Config, "from_env", classmethod(fail_config))
+        monkeypatch.setattr(config_module.Config, "from_files_and_env", classmethod(fail_config))
+    elif mode == "auth":
+        config = make_test_config(request.getfixturevalue("shared_tmp"))
+        _patch_config_and_auth(monkeypatch, config)
+
+        def fail_get_api(self_or_cls, cfg: Optional[config_module.Config] = None):  # type: ignore[override]
+            raise AuthenticationError("bad credentials")
+
+        monkeypatch.setattr(auth_module.AuthManager, "get_api", fail_get_api)
+    else:
+        raise ValueError(f"Unknown cli_failure mode: {mode!r}")
+
+    return mode
+
+
+class InMemoryJobCache(JobCache):
+    """JobCache that keeps its records in ``stores``, keyed by cache path, instead of on disk."""
+
+    def __init__(
+        self, stores: Dict[Path, Dict[str, Dict[str, Any]]], cache_path: Optional[str] = None
+    ):
+        self._stores = stores
+        self.cache_path = Path(cache_path or "~/.inspire/jobs.json").expanduser()
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        return copy.deepcopy(self._stores.get(self.cache_path, {}))
+
+    def _save(self, jobs: Dict[str, Dict[str, Any]]) -> None:
+        self._stores[self.cache_path] = copy.deepcopy(jobs)
+
+
+@pytest.fixture
+def memory_job_cache(
+    monkeypatch: pytest.MonkeyPatch, job_cmd: ModuleType
+) -> Callable[[Optional[str]], InMemoryJobCache]:
+    """Make the job commands use ``InMemoryJobCache`` with a store private to the test.
+
+    Returns the factory patched in for ``JobCache``; call it with a cache path.
+    """
+    factory = functools.partial(InMemoryJobCache, {})
+    monkeypatch.setattr(job_cmd, "JobCache", factory)
+    return factory
+
+
+@pytest.fixture
+def seeded_cache(
+    patched_cli: PatchedCLI,
+    memory_job_cache: Callable[[Optional[str]], InMemoryJobCache],
+    request: pytest.FixtureRequest,
+) -> JobCache:
+    """In-memory job cache pre-populated with one ``TEST_JOB_ID`` record.
+
+    Fields can be overridden per test with
+    ``@pytest.mark.job_cache_kwargs(status=..., log_path=...)``.
+    """
+    record = _DEFAULT_JOB_RECORD
+    marker = request.node.get_closest_marker("job_cache_kwargs")
+    if marker is not None:
+        record = {**record, **marker.kwargs}
+
+    cache = memory_job_cache(patched_cli.config.get_expanded_cache_path())
+    cache.add_job(**record)
+    return cache
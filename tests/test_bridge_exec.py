@@ -3,10 +3,10 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 import importlib
 
+import click
 import pytest
 from click.testing import CliRunner
 
-from inspire.cli.main import main as cli_main
 from inspire.cli.context import EXIT_GENERAL_ERROR, EXIT_SUCCESS
 from inspire.cli.utils.config import Config
 
@@ -29,16 +29,42 @@ def make_sync_config(tmp_path: Path) -> Config:
     )
 
 
-def test_bridge_exec_triggers_and_no_wait(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+@pytest.fixture
+def sync_config(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Config:
+    """Config returned by Config.from_files_and_env for the duration of a test."""
     config = make_sync_config(tmp_path)
-
-    called: Dict[str, Any] = {}
-
     monkeypatch.setattr(
         Config,
         "from_files_and_env",
         classmethod(lambda cls, require_target_dir=False, require_credentials=True: (config, {})),
     )
+    return config
+
+
+@pytest.fixture
+def finished_run(monkeypatch: pytest.MonkeyPatch, sync_config: Config):
+    """Fake a triggered bridge run that completes with the given conclusion and log."""
+
+    def install(conclusion: str, log: Optional[str]) -> None:
+        monkeypatch.setattr(bridge_module, "trigger_bridge_action_workflow", lambda *args, **kwargs: None)
+        monkeypatch.setattr(
+            bridge_module,
+            "wait_for_bridge_action_completion",
+            lambda *args, **kwargs: {
+                "status": "completed",
+                "conclusion": conclusion,
+                "html_url": "http://example.com",
+            },
+        )
+        monkeypatch.setattr(bridge_module, "fetch_bridge_output_log", lambda *args, **kwargs: log)
+
+    return install
+
+
+def test_bridge_exec_triggers_and_no_wait(
+    monkeypatch: pytest.MonkeyPatch, runner: CliRunner, cli_main: click.Group, sync_config: Config
+) -> None:
+    called: Dict[str, Any] = {}
 
     def fake_trigger(
         config: Config,
@@ -56,7 +82,6 @@ def test_bridge_exec_triggers_and_no_wait(monkeypatch: pytest.MonkeyPatch, tmp_p
 
     monkeypatch.setattr(bridge_module, "trigger_bridge_action_workflow", fake_trigger)
 
-    runner = CliRunner()
     result = runner.invoke(cli_main, ["bridge", "exec", "echo hi", "--no-wait", "--no-tunnel"])
 
     assert result.exit_code == EXIT_SUCCESS
@@ -64,18 +89,13 @@ def test_bridge_exec_triggers_and_no_wait(monkeypatch: pytest.MonkeyPatch, tmp_p
     assert called["trigger"]["raw_command"] == "echo hi"
 
 
-def test_bridge_exec_uses_env_denylist(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
-    config = make_sync_config(tmp_path)
-    config.bridge_action_denylist = ["rm -rf /"]
+def test_bridge_exec_uses_env_denylist(
+    monkeypatch: pytest.MonkeyPatch, runner: CliRunner, cli_main: click.Group, sync_config: Config
+) -> None:
+    sync_config.bridge_action_denylist = ["rm -rf /"]
 
     captured: Dict[str, Any] = {}
 
-    monkeypatch.setattr(
-        Config,
-        "from_files_and_env",
-        classmethod(lambda cls, require_target_dir=False, require_credentials=True: (config, {})),
-    )
-
     def fake_trigger(
         config: Config,
         raw_command: str,
@@ -87,65 +107,28 @@ def test_bridge_exec_uses_env_denylist(monkeypatch: pytest.MonkeyPatch, tmp_path
 
     monkeypatch.setattr(bridge_module, "trigger_bridge_action_workflow", fake_trigger)
 
-    runner = CliRunner()
     result = runner.invoke(cli_main, ["bridge", "exec", "echo hi", "--no-wait", "--no-tunnel"])
 
     assert result.exit_code == EXIT_SUCCESS
     assert captured["denylist"] == ["rm -rf /"]
 
 
-def test_bridge_exec_reports_failure(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
-    config = make_sync_config(tmp_path)
-
-    monkeypatch.setattr(
-        Config,
-        "from_files_and_env",
-        classmethod(lambda cls, require_target_dir=False, require_credentials=True: (config, {})),
-    )
-
-    def fake_trigger(*args: Any, **kwargs: Any) -> None:
-        return None
-
-    def fake_wait(*args: Any, **kwargs: Any) -> Dict[str, Any]:
-        return {"status": "completed", "conclusion": "failure", "html_url": "http://example.com"}
-
-    def fake_fetch_log(*args: Any, **kwargs: Any) -> Optional[str]:
-        return None
+def test_bridge_exec_reports_failure(
+    runner: CliRunner, cli_main: click.Group, finished_run
+) -> None:
+    finished_run("failure", None)
 
-    monkeypatch.setattr(bridge_module, "trigger_bridge_action_workflow", fake_trigger)
-    monkeypatch.setattr(bridge_module, "wait_for_bridge_action_completion", fake_wait)
-    monkeypatch.setattr(bridge_module, "fetch_bridge_output_log", fake_fetch_log)
-
-    runner = CliRunner()
     result = runner.invoke(cli_main, ["bridge", "exec", "echo hi", "--no-tunnel"])
 
     assert result.exit_code == EXIT_GENERAL_ERROR
 
 
-def test_bridge_exec_displays_output_log(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+def test_bridge_exec_displays_output_log(
+    runner: CliRunner, cli_main: click.Group, finished_run
+) -> None:
     """Test that command output is displayed to the user."""
-    config = make_sync_config(tmp_path)
-
-    monkeypatch.setattr(
-        Config,
-        "from_files_and_env",
-        classmethod(lambda cls, require_target_dir=False, require_credentials=True: (config, {})),
-    )
-
-    def fake_trigger(*args: Any, **kwargs: Any) -> None:
-        return None
-
-    def fake_wait(*args: Any, **kwargs: Any) -> Dict[str, Any]:
-        return {"status": "completed", "conclusion": "success", "html_url": "http://example.com"}
-
-    def fake_fetch_log(*args: Any, **kwargs: Any) -> Optional[str]:
-        return "Hello from Bridge!\nCommand completed."
-
-    monkeypatch.setattr(bridge_module, "trigger_bridge_action_workflow", fake_trigger)
-    monkeypatch.setattr(bridge_module, "wait_for_bridge_action_completion", fake_wait)
-    monkeypatch.setattr(bridge_module, "fetch_bridge_output_log", fake_fetch_log)
+    finished_run("success", "Hello from Bridge!\nCommand completed.")
 
-    runner = CliRunner()
     result = runner.invoke(cli_main, ["bridge", "exec", "echo hi", "--no-tunnel"])
 
     assert result.exit_code == EXIT_SUCCESS
@@ -155,30 +138,12 @@ def test_bridge_exec_displays_output_log(monkeypatch: pytest.MonkeyPatch, tmp_pa
     assert "--- End Output ---" in result.output
 
 
-def test_bridge_exec_json_includes_output(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+def test_bridge_exec_json_includes_output(
+    runner: CliRunner, cli_main: click.Group, finished_run
+) -> None:
     """Test that JSON output includes the command output."""
-    config = make_sync_config(tmp_path)
-
-    monkeypatch.setattr(
-        Config,
-        "from_files_and_env",
-        classmethod(lambda cls, require_target_dir=False, require_credentials=True: (config, {})),
-    )
-
-    def fake_trigger(*args: Any, **kwargs: Any) -> None:
-        return None
-
-    def fake_wait(*args: Any, **kwargs: Any) -> Dict[str, Any]:
-        return {"status": "completed", "conclusion": "success", "html_url": "http://example.com"}
-
-    def fake_fetch_log(*args: Any, **kwargs: Any) -> Optional[str]:
-        return "Test output"
-
-    monkeypatch.setattr(bridge_module, "trigger_bridge_action_workflow", fake_trigger)
-    monkeypatch.setattr(bridge_module, "wait_for_bridge_action_completion", fake_wait)
-    monkeypatch.setattr(bridge_module, "fetch_bridge_output_log", fake_fetch_log)
+    finished_run("success", "Test output")
 
-    runner = CliRunner()
     result = runner.invoke(cli_main, ["--json", "bridge", "exec", "echo hi", "--no-tunnel"])
 
     assert result.exit_code == EXIT_SUCCESS
@@ -0,0 +1,432 @@
+import io
+import json
+import sys
+
+import pytest
+import requests
+from click.testing import CliRunner
+
+from inspire import inspire_api_control
+from inspire.inspire_api_control import (
+    InspireAPI,
+    InspireAPIError,
+    InspireConfig,
+    JobNotFoundError,
+    ValidationError,
+    ResourceManager,
+    _is_valid_job_id,
+)
+
+from tests.conftest import JOB_ID_RE, TEST_JOB_ID, TEST_JOB_ID_2, TEST_JOB_ID_3, make_job_id
+
+
+@pytest.mark.parametrize(
+    ("resource", "expected"),
+    [
+        ("H200", ("H200", 1)),
+        ("4xH200", ("H200", 4)),
+        ("4 h200", ("H200", 4)),
+        ("H100x8", ("H100", 8)),
+        ("H200 4", ("H200", 4)),
+        ("gpu H100 please", ("H100", 1)),
+    ],
+)
+def test_parse_resource_request(resource: str, expected: tuple) -> None:
+    assert ResourceManager().parse_resource_request(resource) == expected
+
+
+@pytest.mark.parametrize("resource", ["", "A100", "0xH200"])
+def test_parse_resource_request_rejects_invalid(resource: str) -> None:
+    with pytest.raises(ValueError):
+        ResourceManager().parse_resource_request(resource)
+
+
+@pytest.mark.parametrize(
+    ("job_id", "expected"),
+    [
+        ("job-12345678-1234-1234-1234-123456789abc", True),
+        ("job-ABCDEF12-3456-7890-abcd-EF1234567890", True),
+        ("job-12345678-1234-1234-1234-123456789ab", False),
+        ("job-12345678-1234-1234-1234-123456789abcd", False),
+        ("job-12345678-1234-1234-1234-123456789abg", False),
+        ("job-12345678-1234-1234-12341-23456789abc", False),
+        ("job-1234567-81234-1234-1234-123456789abc", False),
+        ("job-12345678--234-1234-1234-123456789abc", False),
+    ],
+)
+def test_is_valid_job_id(job_id: str, expected: bool) -> None:
+    assert _is_valid_job_id(job_id) is expected
+
+
+def test_test_job_ids_are_accepted_by_the_api_validator() -> None:
+    job_ids = [TEST_JOB_ID, TEST_JOB_ID_2, TEST_JOB_ID_3] + [make_job_id() for _ in range(50)]
+
+    assert len(set(job_ids)) == len(job_ids)
+    for job_id in job_ids:
+        assert JOB_ID_RE.fullmatch(job_id)
+        assert _is_valid_job_id(job_id)
+
+
+def test_spec_and_group_lookup_by_gpu_type() -> None:
+    manager = ResourceManager(
+        [
+            {"name": "H200 A", "id": "lcg-a", "gpu_type": "H200", "location": "Room 1"},
+            {"name": "H100 B", "id": "lcg-b", "gpu_type": "H100", "location": "Room 2"},
+            {"name": "H200 C", "id": "lcg-c", "gpu_type": "H200", "location": "Room 3"},
+        ]
+    )
+
+    assert [g.compute_group_id for g in manager.find_compute_groups("H200")] == ["lcg-a", "lcg-c"]
+    assert [s.gpu_count for s in manager.find_matching_specs("H200", 2)] == [4, 8]
+    # H100 requests fall back to the H200 specs
+    assert [s.gpu_count for s in manager.find_matching_specs("H100", 1)] == [1, 4, 8]
+    assert manager.find_matching_specs("H200", 16) == []
+    assert manager.get_recommended_config("4xH200", prefer_location="3") == (
+        "45ab2351-fc8a-4d50-a30b-b39a5306c906",
+        "lcg-c",
+    )
+
+
+def test_lookups_return_copies() -> None:
+    manager = ResourceManager(
+        [{"name": "H200 A", "id": "lcg-a", "gpu_type": "H200", "location": "Room 1"}]
+    )
+
+    manager.find_compute_groups("H200").clear()
+    manager.find_matching_specs("H200", 1).clear()
+
+    assert [g.compute_group_id for g in manager.find_compute_groups("H200")] == ["lcg-a"]
+    assert [s.gpu_count for s in manager.find_matching_specs("H200", 1)] == [1, 4, 8]
+
+
+@pytest.mark.parametrize(
+    ("prefer_location", "expected"),
+    [("room 3", "lcg-c"), ("site-2", "lcg-b"), ("1", "lcg-b")],
+)
+def test_prefer_location_matches_text_then_digits(prefer_location: str, expected: str) -> None:
+    manager = ResourceManager(
+        [
+            {"name": "H200 A", "id": "lcg-a", "gpu_type": "H200", "location": "Room 7"},
+            {"name": "H200 B", "id": "lcg-b", "gpu_type": "H200", "location": "Room 12"},
+            {"name": "H200 C", "id": "lcg-c", "gpu_type": "H200", "location": "Room 3"},
+        ]
+    )
+
+    assert manager.get_recommended_config("H200", prefer_location=prefer_location)[1] == expected
+
+
+def test_recommended_config_is_memoized(monkeypatch: pytest.MonkeyPatch) -> None:
+    manager = ResourceManager(
+        [{"name": "H200 A", "id": "lcg-a", "gpu_type": "H200", "location": "Room 1"}]
+    )
+    parses = []
+    parse = manager.parse_resource_request
+    monkeypatch.setattr(manager, "parse_resource_request", lambda r: parses.append(r) or parse(r))
+
+    first = manager.get_recommended_config("4xH200", "1")
+
+    assert manager.get_recommended_config("4xH200", "1") == first
+    assert parses == ["4xH200"]
+
+
+def test_compute_group_with_unknown_gpu_type_is_rejected() -> None:
+    with pytest.raises(ValueError, match="not a valid GPUType"):
+        ResourceManager([{"name": "A100", "id": "lcg-x", "gpu_type": "A100"}])
+
+
+class _FakeResponse:
+    def __init__(self, status_code: int, payload=None, headers=None) -> None:
+        self.status_code = status_code
+        self.content = b"" if payload is None else json.dumps(payload).encode()
+        self.headers = headers or {}
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"{self.status_code} error", response=self)
+
+
+def test_request_retry_is_configured_on_session() -> None:
+    api = InspireAPI(InspireConfig(max_retries=2, retry_delay=0.5))
+
+    retry = api.session.get_adapter("https://example.test").max_retries
+
+    assert retry.total == 2
+    assert retry.backoff_factor == 0.5
+    assert 500 not in retry.status_forcelist
+    assert 429 in retry.status_forcelist
+
+
+def test_context_manager_closes_session(monkeypatch: pytest.MonkeyPatch) -> None:
+    closed = []
+
+    with InspireAPI(InspireConfig()) as api:
+        monkeypatch.setattr(api.session, "close", lambda: closed.append(True))
+
+    assert closed == [True]
+
+
+def test_request_returns_api_error_body_and_raises_plain_5xx(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    api = InspireAPI(InspireConfig(max_retries=0))
+    responses = [_FakeResponse(500, {"code": 100002, "message": "bad id"}), _FakeResponse(500)]
+    monkeypatch.setattr(api.session, "request", lambda *_args, **_kwargs: responses.pop(0))
+
+    assert api._make_request_with_retry("GET", "https://example.test/x").status_code == 500
+    with pytest.raises(requests.exceptions.HTTPError):
+        api._make_request_with_retry("GET", "https://example.test/x")
+
+
+def test_request_connection_error_becomes_api_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    api = InspireAPI(InspireConfig(max_retries=1))
+
+    def fail(*_args, **_kwargs):
+        raise requests.exceptions.ConnectionError("refused")
+
+    monkeypatch.setattr(api.session, "request", fail)
+
+    with pytest.raises(InspireAPIError, match="Connection error after 1 retries"):
+        api._make_request_with_retry("POST", "https://example.test/x", json={})
+
+
+def test_authenticate_sets_token_on_session_headers(monkeypatch: pytest.MonkeyPatch) -> None:
+    api = InspireAPI(InspireConfig())
+    calls = []
+
+    def fake_request(method, url, **kwargs):
+        calls.append(kwargs)
+        return _FakeResponse(200, {"code": 0, "data": {"access_token": "tok"}})
+
+    monkeypatch.setattr(api.session, "request", fake_request)
+
+    assert api.authenticate("user", "secret")
+    assert api.session.headers["Authorization"] == "Bearer tok"
+    assert "headers" not in calls[0]
+    assert json.loads(calls[0]["data"]) == {"username": "user", "password": "secret"}
+
+
+def test_http2_flag_falls_back_without_httpx(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(inspire_api_control, "_USE_HTTP2", True)
+    monkeypatch.setitem(sys.modules, "httpx", None)
+
+    api = InspireAPI(InspireConfig())
+
+    assert api.client is None
+    assert api.headers is api.session.headers
+
+
+def test_summarize_response_error_truncates_body() -> None:
+    api = InspireAPI(InspireConfig())
+    response = requests.Response()
+    response.status_code = 502
+    response.reason = "Bad Gateway"
+    response.url = "https://example.test/x"
+    response.headers["Content-Type"] = "text/html"
+    response._content = b"x" * (InspireAPI.ERROR_BODY_PREVIEW_LIMIT + 10)
+
+    summary = api._summarize_response_error(response)
+
+    assert "Status: 502 Bad Gateway" in summary
+    assert '"Content-Type":"text/html"' in summary
+    assert "x" * InspireAPI.ERROR_BODY_PREVIEW_LIMIT + "\n... (truncated" in summary
+
+
+def test_invalid_json_error_previews_truncated_body(monkeypatch: pytest.MonkeyPatch) -> None:
+    api = InspireAPI(InspireConfig())
+    response = requests.Response()
+    response.status_code = 200
+    response.encoding = "latin-1"
+    response._content = b"\xe9" + b"<" * (InspireAPI.ERROR_BODY_PREVIEW_LIMIT + 10)
+    monkeypatch.setattr(api.session, "request", lambda *_args, **_kwargs: response)
+
+    with pytest.raises(InspireAPIError) as excinfo:
+        api._make_request("GET", "/x")
+
+    preview = str(excinfo.value).split("Body preview: ", 1)[1]
+    assert preview == "\u00e9" + "<" * (InspireAPI.ERROR_BODY_PREVIEW_LIMIT - 1) + "..."
+
+
+def test_create_training_jobs_batch_reports_per_item(monkeypatch: pytest.MonkeyPatch) -> None:
+    api = InspireAPI(
+        InspireConfig(compute_groups=[{"name": "H200 A", "id": "lcg-a", "gpu_type": "H200"}])
+    )
+    api.token = "tok"
+    sent = []
+
+    def fake_request(method, url, **kwargs):
+        payload = json.loads(kwargs["data"])
+        sent.append(payload)
+        return _FakeResponse(200, {"code": 0, "data": {"job_id": f"job-{payload['name']}"}})
+
+    monkeypatch.setattr(api.session, "request", fake_request)
+
+    records = api.create_training_jobs_batch(
+        [
+            {"custom_id": "a", "name": "one", "command": "run", "resource": "H200"},
+            {"name": "two", "command": "run", "resource": "A100"},
+            {
+                "custom_id": "c",
+                "name": "three",
+                "command": "run",
+                "logic_compute_group_id": "lcg-x",
+                "project_id": "p",
+                "workspace_id": "w",
+                "framework": "pytorch",
+                "spec_id": "s",
+                "instance_count": 2,
+            },
+        ]
+    )
+
+    assert [r["custom_id"] for r in records] == ["a", "1", "c"]
+    assert [r["status"] for r in records] == ["ok", "error", "ok"]
+    assert "Resource matching failed" in records[1]["error"]
+    assert records[2]["result"]["data"]["job_id"] == "job-three"
+    assert [p["name"] for p in sent] == ["one", "three"]
+    assert sent[1]["framework_config"][0]["instance_count"] == 2
+
+
+def test_get_job_details_collects_partial_failures(monkeypatch: pytest.MonkeyPatch) -> None:
+    api = InspireAPI(InspireConfig())
+    api.token = "tok"
+    good = "job-12345678-1234-1234-1234-123456789abc"
+
+    def fake_request(method, url, **kwargs):
+        return _FakeResponse(
+            200, {"code": 0, "data": {"job_id": json.loads(kwargs["data"])["job_id"]}}
+        )
+
+    monkeypatch.setattr(api.session, "request", fake_request)
+
+    records = api.get_job_details([good, "job-bad"])
+
+    assert [r["job_id"] for r in records] == [good, "job-bad"]
+    assert records[0] == {
+        "job_id": good,
+        "status": "ok",
+        "result": {"code": 0, "data": {"job_id": good}},
+    }
+    assert records[1]["status"] == "error"
+    assert "truncated" in records[1]["error"]
+
+
+def test_list_cluster_nodes_caches_and_revalidates_with_etag(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    api = InspireAPI(InspireConfig())
+    api.token = "tok"
+    body = {"code": 0, "data": {"nodes": [{"name": "n1"}]}}
+    responses = [_FakeResponse(200, body, {"ETag": '"v1"'}), _FakeResponse(304)]
+    sent_headers = []
+
+    def fake_request(method, url, **kwargs):
+        sent_headers.append(kwargs.get("headers"))
+        return responses.pop(0)
+
+    monkeypatch.setattr(api.session, "request", fake_request)
+
+    assert api.list_cluster_nodes() == body
+    assert api.list_cluster_nodes() == body  # fresh: no request
+    assert len(sent_headers) == 1
+
+    api._node_list_cache[(1, 10, None)] = ('"v1"', 0.0, body)
+    assert api.list_cluster_nodes() == body
+    assert sent_headers == [None, {"If-None-Match": '"v1"'}]
+
+
+def test_list_cluster_nodes_stream_without_ijson(monkeypatch: pytest.MonkeyPatch) -> None:
+    api = InspireAPI(InspireConfig())
+    api.token = "tok"
+    monkeypatch.setitem(sys.modules, "ijson", None)
+    body = {"code": 0, "data": {"nodes": [{"name": "n1"}, {"name": "n2"}]}}
+    monkeypatch.setattr(api.session, "request", lambda *_args, **_kwargs: _FakeResponse(200, body))
+
+    assert list(api.list_cluster_nodes_stream()) == body["data"]["nodes"]
+
+
+def test_streamed_nodes_are_built_from_ijson_events() -> None:
+    ijson = pytest.importorskip("ijson")
+    raw = io.BytesIO(
+        b'{"code": 0, "data": {"nodes": [{"name": "n1", "gpu": 0.5}, {"name": "n2"}]}}'
+    )
+
+    assert list(InspireAPI._iter_streamed_nodes(ijson, raw)) == [
+        {"name": "n1", "gpu": 0.5},
+        {"name": "n2"},
+    ]
+
+    with pytest.raises(InspireAPIError, match="bad"):
+        list(InspireAPI._iter_streamed_nodes(ijson, io.BytesIO(b'{"code": 5, "message": "bad"}')))
+
+
+def test_stop_training_job_maps_parameter_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    api = InspireAPI(InspireConfig())
+    api.token = "tok"
+    job_id = "job-12345678-1234-1234-1234-123456789abc"
+    responses = [
+        _FakeResponse(200, {"code": 0}),
+        _FakeResponse(200, {"code": 100002, "message": "bad"}),
+        _FakeResponse(200, {"code": 7, "message": "busy"}),
+    ]
+    monkeypatch.setattr(api.session, "request", lambda *_args, **_kwargs: responses.pop(0))
+
+    assert api.stop_training_job(job_id) is True
+    with pytest.raises(JobNotFoundError, match=f"Failed to stop job '{job_id}': bad"):
+        api.stop_training_job(job_id)
+    with pytest.raises(InspireAPIError, match="Failed to stop training job: busy"):
+        api.stop_training_job(job_id)
+
+
+def test_create_training_jobs_batch_concurrent_and_capped(monkeypatch: pytest.MonkeyPatch) -> None:
+    api = InspireAPI(InspireConfig())
+    api.token = "tok"
+    monkeypatch.setattr(
+        api.session,
+        "request",
+        lambda *_args, **kwargs: _FakeResponse(
+            200, {"code": 0, "data": {"job_id": json.loads(kwargs["data"])["name"]}}
+        ),
+    )
+    job = {
+        "command": "run",
+        "logic_compute_group_id": "g",
+        "project_id": "p",
+        "workspace_id": "w",
+        "framework": "pytorch",
+        "spec_id": "s",
+    }
+
+    records = api.create_training_jobs_batch(
+        [{**job, "name": f"j{i}"} for i in range(6)], max_workers=4
+    )
+
+    assert [r["result"]["data"]["job_id"] for r in records] == [f"j{i}" for i in range(6)]
+    monkeypatch.setattr(InspireAPI, "BATCH_MAX_JOBS", 2)
+    with pytest.raises(ValidationError, match="at most 2"):
+        api.create_training_jobs_batch([job] * 3)
+
+
+def test_cli_show_resources_and_usage_errors(capsys: pytest.CaptureFixture[str]) -> None:
+    assert inspire_api_control.main(["--show-resources"]) == 0
+    assert "Available Resource Configurations" in capsys.readouterr().out
+
+    assert inspire_api_control.main(["create", "--name", "x"]) == 2
+    assert "unless --batch-file is given" in capsys.readouterr().err
+
+
+def test_cli_detail_many_prints_jsonl(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("INSPIRE_USERNAME", "user")
+    monkeypatch.setenv("INSPIRE_PASSWORD", "secret")
+    monkeypatch.setattr(InspireAPI, "authenticate", lambda self, username, password: True)
+    monkeypatch.setattr(
+        InspireAPI,
+        "get_job_details",
+        lambda self, job_ids: [
+            {"job_id": job_id, "status": "ok", "result": {}} for job_id in job_ids
+        ],
+    )
+
+    result = CliRunner().invoke(inspire_api_control.cli, ["detail-many", "--job-ids", "a, b"])
+
+    assert result.exit_code == 0
+    assert [json.loads(line)["job_id"] for line in result.output.splitlines()] == ["a", "b"]
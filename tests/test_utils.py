@@ -1,4 +1,4 @@
-"""Tests for utility modules: job_cache, config, tunnel."""
+"""Tests for utility modules: job_cache, config, logs, tunnel."""
 
 import json
 import os
@@ -10,6 +10,9 @@ import pytest
 
 from inspire.cli.utils.job_cache import JobCache
 from inspire.cli.utils.config import Config, ConfigError, _parse_remote_timeout, _parse_denylist, build_env_exports
+from inspire.cli.utils.logs import LogReader
+from inspire import compute_groups
+from inspire.compute_groups import ComputeGroupDefinition, compute_group_name_map
 from inspire.cli.utils.tunnel import (
     BridgeProfile,
     TunnelConfig,
@@ -380,6 +383,12 @@ class TestConfigHelpers:
 class TestBridgeProfile:
     """Tests for BridgeProfile dataclass."""
 
+    def test_uses_slots(self) -> None:
+        """Test that profiles and configs carry no per-instance __dict__."""
+        assert BridgeProfile.__slots__ == ("name", "proxy_url", "ssh_user", "ssh_port")
+        assert not hasattr(BridgeProfile(name="b", proxy_url="https://x"), "__dict__")
+        assert not hasattr(TunnelConfig(), "__dict__")
+
     def test_to_dict(self) -> None:
         """Test converting profile to dict."""
         profile = BridgeProfile(
@@ -525,6 +534,46 @@ class TestTunnelConfigPersistence:
         assert bridge.ssh_user == "testuser"
         assert bridge.ssh_port == 12345
 
+    def test_migrates_legacy_tunnel_conf(self, tmp_path: Path) -> None:
+        """Test migrating PROXY_URL/SSH_USER from the legacy tunnel.conf."""
+        (tmp_path / "tunnel.conf").write_text(
+            "# PROXY_URL=https://commented.example.com\n"
+            "PROXY_URL=\"https://legacy.example.com/proxy/31337/\"\r\n"
+            "  SSH_USER = 'alice'\n"
+            "OTHER=ignored\n"
+        )
+
+        loaded = load_tunnel_config(tmp_path)
+
+        bridge = loaded.bridges["default"]
+        assert bridge.proxy_url == "https://legacy.example.com/proxy/31337/"
+        assert bridge.ssh_user == "alice"
+        assert (tmp_path / "bridges.json").exists()
+
+    def test_load_returns_independent_copies(self, tmp_path: Path) -> None:
+        """Test that mutating a loaded config does not leak into later loads."""
+        config = TunnelConfig(config_dir=tmp_path)
+        config.add_bridge(BridgeProfile(name="b1", proxy_url="https://a.example.com"))
+        save_tunnel_config(config)
+
+        first = load_tunnel_config(tmp_path)
+        first.remove_bridge("b1")
+
+        assert "b1" in load_tunnel_config(tmp_path).bridges
+
+    def test_load_picks_up_external_changes(self, tmp_path: Path) -> None:
+        """Test that edits to bridges.json invalidate the cached config."""
+        config = TunnelConfig(config_dir=tmp_path)
+        config.add_bridge(BridgeProfile(name="b1", proxy_url="https://a.example.com"))
+        save_tunnel_config(config)
+        assert set(load_tunnel_config(tmp_path).bridges) == {"b1"}
+
+        data = json.loads(config.config_file.read_text())
+        data["bridges"].append({"name": "b2", "proxy_url": "https://b.example.com"})
+        config.config_file.write_text(json.dumps(data))
+
+        assert set(load_tunnel_config(tmp_path).bridges) == {"b1", "b2"}
+
 
 class TestProxyCommand:
     """Tests for SSH proxy command building."""
@@ -555,3 +604,462 @@ class TestProxyCommand:
 
         # Should include stderr redirect
         assert "2>/dev/null" in cmd
+
+    def test_url_to_ws_schemes(self) -> None:
+        """Test http(s) to ws(s) rewriting and passthrough of other schemes."""
+        from inspire.cli.utils.tunnel import _url_to_ws
+
+        assert _url_to_ws("https://host/p?t=1") == "wss://host/p?t=1"
+        assert _url_to_ws("http://host/p") == "ws://host/p"
+        assert _url_to_ws("wss://host/p") == "wss://host/p"
+
+
+class TestRtunnelDownload:
+    """Tests for rtunnel binary download."""
+
+    def test_extracts_binary_from_streamed_archive(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the rtunnel binary is extracted from a tar.gz download."""
+        import io
+        import tarfile
+
+        from inspire.cli.utils.tunnel import _ensure_rtunnel_binary
+
+        archive = tmp_path / "rtunnel.tar.gz"
+        payload = b"#!/bin/sh\necho rtunnel\n"
+        with tarfile.open(archive, "w:gz") as tar:
+            info = tarfile.TarInfo("README")
+            info.size = 2
+            tar.addfile(info, io.BytesIO(b"hi"))
+            info = tarfile.TarInfo("rtunnel-linux-amd64")
+            info.size = len(payload)
+            tar.addfile(info, io.BytesIO(payload))
+
+        monkeypatch.setenv("HOME", str(tmp_path / "home"))
+        monkeypatch.setenv("INSPIRE_RTUNNEL_DOWNLOAD_URL", archive.as_uri())
+        config = TunnelConfig(config_dir=tmp_path / "inspire")
+
+        path = _ensure_rtunnel_binary(config)
+
+        assert path.read_bytes() == payload
+        assert os.access(path, os.X_OK)
+
+    def test_truncated_archive_leaves_no_binary(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a cut-off download does not leave a partial executable behind."""
+        import io
+        import tarfile
+
+        from inspire.cli.utils.tunnel import TunnelError, _ensure_rtunnel_binary
+
+        buf = io.BytesIO()
+        payload = b"\x7fELF" + bytes(range(256)) * 64
+        with tarfile.open(fileobj=buf, mode="w:gz") as tar:
+            info = tarfile.TarInfo("rtunnel")
+            info.size = len(payload)
+            tar.addfile(info, io.BytesIO(payload))
+        archive = tmp_path / "rtunnel.tar.gz"
+        archive.write_bytes(buf.getvalue()[: len(buf.getvalue()) // 2])
+
+        monkeypatch.setenv("HOME", str(tmp_path / "home"))
+        monkeypatch.setenv("INSPIRE_RTUNNEL_DOWNLOAD_URL", archive.as_uri())
+        config = TunnelConfig(config_dir=tmp_path / "inspire")
+
+        with pytest.raises(TunnelError):
+            _ensure_rtunnel_binary(config)
+
+        assert not config.rtunnel_bin.exists()
+        assert list(config.rtunnel_bin.parent.iterdir()) == []
+
+    def test_revalidates_existing_binary_with_etag(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a 304 for the cached ETag reuses the binary on disk."""
+        import urllib.error
+        import urllib.request
+
+        from inspire.cli.utils.tunnel import _ensure_rtunnel_binary
+
+        url = "https://example.com/rtunnel.tar.gz"
+        monkeypatch.setenv("HOME", str(tmp_path / "home"))
+        monkeypatch.setenv("INSPIRE_RTUNNEL_DOWNLOAD_URL", url)
+        config = TunnelConfig(config_dir=tmp_path / "inspire")
+        config.config_dir.mkdir()
+        (config.config_dir / ".rtunnel.etag").write_text(f'{url}\n"v1"\n3\n')
+        config.rtunnel_bin.parent.mkdir(parents=True)
+        config.rtunnel_bin.write_bytes(b"old")
+        config.rtunnel_bin.chmod(0o644)
+
+        sent_headers = {}
+
+        def fake_urlopen(request):
+            sent_headers.update(request.header_items())
+            raise urllib.error.HTTPError(url, 304, "Not Modified", None, None)
+
+        monkeypatch.setattr(urllib.request, "urlopen", fake_urlopen)
+
+        path = _ensure_rtunnel_binary(config)
+
+        assert sent_headers.get("If-none-match") == '"v1"'
+        assert path.read_bytes() == b"old"
+        assert os.access(path, os.X_OK)
+
+    def test_size_mismatch_skips_conditional_request(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a binary not matching the recorded size is downloaded unconditionally."""
+        import urllib.error
+        import urllib.request
+
+        from inspire.cli.utils.tunnel import TunnelError, _ensure_rtunnel_binary
+
+        url = "https://example.com/rtunnel.tar.gz"
+        monkeypatch.setenv("HOME", str(tmp_path / "home"))
+        monkeypatch.setenv("INSPIRE_RTUNNEL_DOWNLOAD_URL", url)
+        config = TunnelConfig(config_dir=tmp_path / "inspire")
+        config.config_dir.mkdir()
+        (config.config_dir / ".rtunnel.etag").write_text(f'{url}\n"v1"\n4096\n')
+        config.rtunnel_bin.parent.mkdir(parents=True)
+        config.rtunnel_bin.write_bytes(b"partial")
+
+        sent_headers = {}
+
+        def fake_urlopen(request):
+            sent_headers.update(request.header_items())
+            raise urllib.error.HTTPError(url, 503, "Unavailable", None, None)
+
+        monkeypatch.setattr(urllib.request, "urlopen", fake_urlopen)
+
+        with pytest.raises(TunnelError):
+            _ensure_rtunnel_binary(config)
+
+        assert "If-none-match" not in sent_headers
+        assert not os.access(config.rtunnel_bin, os.X_OK)
+
+
+class TestInstallSshConfig:
+    """Tests for ~/.ssh/config installation."""
+
+    def test_appends_then_replaces_host_block(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test appending a new Host block and replacing it on reinstall."""
+        from inspire.cli.utils.tunnel import install_ssh_config
+
+        monkeypatch.setenv("HOME", str(tmp_path))
+        ssh_config_path = tmp_path / ".ssh" / "config"
+        ssh_config_path.parent.mkdir()
+        ssh_config_path.write_text("Host other\n    User me\n")
+
+        result = install_ssh_config("Host mybridge\n    Port 1", "mybridge")
+        assert result == {"success": True, "updated": False, "error": None}
+
+        result = install_ssh_config("Host mybridge\n    Port 2", "mybridge")
+        assert result["updated"] is True
+
+        content = ssh_config_path.read_text()
+        assert content.startswith("Host other\n    User me\n")
+        assert "Port 2" in content
+        assert "Port 1" not in content
+
+    def test_preserves_symlinked_config(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a symlinked ~/.ssh/config is updated through the link."""
+        from inspire.cli.utils.tunnel import install_ssh_config
+
+        monkeypatch.setenv("HOME", str(tmp_path))
+        real_config = tmp_path / "dotfiles" / "ssh_config"
+        real_config.parent.mkdir()
+        real_config.write_text("Host other\n")
+        real_config.chmod(0o644)
+        (tmp_path / ".ssh").mkdir()
+        (tmp_path / ".ssh" / "config").symlink_to(real_config)
+
+        install_ssh_config("Host mybridge\n    Port 1", "mybridge")
+
+        assert (tmp_path / ".ssh" / "config").is_symlink()
+        assert "Host mybridge" in real_config.read_text()
+        assert real_config.stat().st_mode & 0o777 == 0o644
+        assert list(real_config.parent.iterdir()) == [real_config]
+
+
+class TestSshCommandArgs:
+    """Tests for SSH argv construction."""
+
+    def test_uses_control_master_per_bridge(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that each bridge gets its own multiplexing socket."""
+        import inspire.cli.utils.tunnel as tunnel_module
+
+        monkeypatch.setattr(tunnel_module, "_ensure_rtunnel_binary", lambda config: config.rtunnel_bin)
+        config = TunnelConfig(config_dir=tmp_path)
+        config.add_bridge(BridgeProfile(name="b1", proxy_url="https://a.example.com"))
+        config.add_bridge(BridgeProfile(name="b2", proxy_url="https://b.example.com"))
+
+        args1 = get_ssh_command_args(bridge_name="b1", config=config, remote_command="hostname")
+        args2 = get_ssh_command_args(bridge_name="b2", config=config)
+
+        assert "ControlMaster=auto" in args1
+        path1 = next(a for a in args1 if a.startswith("ControlPath="))
+        path2 = next(a for a in args2 if a.startswith("ControlPath="))
+        assert path1 != path2
+        assert path1.startswith(f"ControlPath={tmp_path / 'ssh'}")
+        assert args1[-1] == "hostname"
+
+
+class TestCheckAllBridges:
+    """Tests for concurrent bridge health checks."""
+
+    def test_reports_each_bridge(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that every bridge is probed and reported by name."""
+        import inspire.cli.utils.tunnel as tunnel_module
+
+        probed = []
+
+        def fake_test(bridge, config, timeout=10, *, rtunnel_bin=None):
+            probed.append((bridge.name, rtunnel_bin))
+            return bridge.name != "down"
+
+        monkeypatch.setattr(tunnel_module, "_ensure_rtunnel_binary", lambda config: Path("/rt"))
+        monkeypatch.setattr(tunnel_module, "_test_ssh_connection", fake_test)
+        config = TunnelConfig(config_dir=tmp_path)
+        for name in ("up", "down", "also-up"):
+            config.add_bridge(BridgeProfile(name=name, proxy_url=f"https://{name}.example.com"))
+
+        result = tunnel_module.check_all_bridges(config)
+
+        assert result == {"up": True, "down": False, "also-up": True}
+        assert sorted(probed) == [("also-up", Path("/rt")), ("down", Path("/rt")), ("up", Path("/rt"))]
+
+    def test_empty_config(self, tmp_path: Path) -> None:
+        """Test that no bridges yields an empty result without probing."""
+        from inspire.cli.utils.tunnel import check_all_bridges
+
+        assert check_all_bridges(TunnelConfig(config_dir=tmp_path)) == {}
+
+
+class TestIsTunnelAvailable:
+    """Tests for cached tunnel availability checks."""
+
+    def test_caches_success_only(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that successes are reused within the TTL and failures are not."""
+        import inspire.cli.utils.tunnel as tunnel_module
+
+        results = [False, True, False]
+        calls = []
+
+        def fake_test(bridge, config, timeout=10, *, rtunnel_bin=None):
+            calls.append(bridge.name)
+            return results.pop(0)
+
+        monkeypatch.setattr(tunnel_module, "_test_ssh_connection", fake_test)
+        monkeypatch.setenv("INSPIRE_TUNNEL_HEALTH_TTL", "60")
+        config = TunnelConfig(config_dir=tmp_path)
+        config.add_bridge(BridgeProfile(name="b1", proxy_url="https://a.example.com"))
+
+        assert tunnel_module.is_tunnel_available(config=config, retries=0) is False
+        assert tunnel_module.is_tunnel_available(config=config, retries=0) is True
+        assert tunnel_module.is_tunnel_available(config=config, retries=0) is True
+        assert calls == ["b1", "b1"]
+
+        save_tunnel_config(config)
+        assert tunnel_module.is_tunnel_available(config=config, retries=0) is False
+        assert calls == ["b1", "b1", "b1"]
+
+
+class TestRunSshCommandTail:
+    """Tests for tail-only remote command capture."""
+
+    def test_returns_last_line_and_stderr(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that only the final stdout line is returned."""
+        import inspire.cli.utils.tunnel as tunnel_module
+
+        script = "seq 1 20000; echo abc123; echo warn >&2; exit 3"
+        monkeypatch.setattr(
+            tunnel_module, "_remote_command_argv", lambda *args: ["sh", "-c", script]
+        )
+
+        returncode, last_line, stderr = tunnel_module.run_ssh_command_tail(
+            "ignored", config=TunnelConfig(config_dir=tmp_path)
+        )
+
+        assert returncode == 3
+        assert last_line == "abc123"
+        assert stderr == "warn\n"
+
+
+# ===========================================================================
+# LogReader tests
+# ===========================================================================
+
+
+class TestLogReader:
+    """Tests for LogReader class."""
+
+    def test_read_tail_returns_last_lines(self, tmp_path: Path) -> None:
+        """Test reading the last N lines of a log file."""
+        log_path = tmp_path / "training_master_1.log"
+        log_path.write_text("".join(f"line {i}\n" for i in range(500)))
+
+        reader = LogReader(str(tmp_path))
+
+        assert reader.read_tail(log_path, lines=3) == ["line 497", "line 498", "line 499"]
+
+    def test_read_tail_handles_crlf_and_no_trailing_newline(self, tmp_path: Path) -> None:
+        """Test CRLF line endings and a final line without newline."""
+        log_path = tmp_path / "training_master_1.log"
+        log_path.write_bytes(b"first\r\nsecond\r\nthird")
+
+        reader = LogReader(str(tmp_path))
+
+        assert reader.read_tail(log_path, lines=5) == ["first", "second", "third"]
+
+    def test_read_tail_splits_carriage_return_progress(self, tmp_path: Path) -> None:
+        """Test that bare CR progress-bar updates are split into separate lines."""
+        log_path = tmp_path / "training_master_1.log"
+        log_path.write_bytes(b" 10%|#\r 50%|#####\r100%|##########\nloss 0.1\n")
+
+        reader = LogReader(str(tmp_path))
+
+        assert reader.read_tail(log_path, lines=2) == ["100%|##########", "loss 0.1"]
+
+    def test_read_tail_empty_file(self, tmp_path: Path) -> None:
+        """Test reading the tail of an empty file."""
+        log_path = tmp_path / "training_master_1.log"
+        log_path.write_bytes(b"")
+
+        assert LogReader(str(tmp_path)).read_tail(log_path) == []
+
+    def test_read_tail_non_positive_lines(self, tmp_path: Path) -> None:
+        """Test that asking for zero or fewer lines returns nothing."""
+        log_path = tmp_path / "train.log"
+        log_path.write_text("first\nsecond\n")
+        reader = LogReader(str(tmp_path))
+
+        assert reader.read_tail(log_path, lines=0) == []
+        assert reader.read_tail(log_path, lines=-1) == []
+
+    def test_find_logs_matches_default_pattern(self, tmp_path: Path) -> None:
+        """Test recursive discovery with the default prefix*suffix pattern."""
+        nested = tmp_path / "job-abc" / "logs"
+        nested.mkdir(parents=True)
+        (nested / "training_master_1.log").write_text("x")
+        (tmp_path / "training_master_2.log").write_text("x")
+        (tmp_path / "training_master_.txt").write_text("x")
+        hidden = tmp_path / ".cache"
+        hidden.mkdir()
+        (hidden / "training_master_3.log").write_text("x")
+
+        names = sorted(p.name for p in LogReader(str(tmp_path)).find_logs())
+
+        assert names == ["training_master_1.log", "training_master_2.log"]
+
+    def test_find_logs_generic_pattern(self, tmp_path: Path) -> None:
+        """Test discovery with a pattern that needs the fnmatch fallback."""
+        (tmp_path / "worker_0.log").write_text("x")
+        (tmp_path / "worker_a.log").write_text("x")
+        (tmp_path / ".worker_1.log").write_text("x")
+
+        reader = LogReader(str(tmp_path), pattern="worker_[0-9].log")
+
+        assert [p.name for p in reader.find_logs()] == ["worker_0.log"]
+
+    def test_find_logs_survives_symlink_loop(self, tmp_path: Path) -> None:
+        """Test that a directory symlink pointing back at an ancestor is walked once."""
+        sub = tmp_path / "sub"
+        sub.mkdir()
+        (sub / "train.log").write_text("x")
+        (sub / "loop").symlink_to(tmp_path, target_is_directory=True)
+
+        reader = LogReader(str(tmp_path), pattern="*.log")
+
+        assert [p.name for p in reader.find_logs()] == ["train.log"]
+
+
+class TestGroupMetaCache:
+    """Tests for the compute group name/GPU type disk cache."""
+
+    def test_resolve_group_name_falls_back_to_cached_meta(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that unnamed groups resolve to names saved in the disk cache."""
+        cache_file = tmp_path / "group_meta.json"
+        monkeypatch.setattr(compute_groups, "GROUP_META_CACHE_FILE", cache_file)
+        monkeypatch.setattr(compute_groups, "_group_meta", None)
+        groups = (
+            ComputeGroupDefinition(name="H100", compute_group_id="lcg-a", gpu_type="H100"),
+            ComputeGroupDefinition(name="", compute_group_id="lcg-b", gpu_type=""),
+        )
+        names = compute_group_name_map(groups)
+        assert compute_groups.resolve_group_name("lcg-b", names) == ""
+
+        compute_groups.save_group_meta({"lcg-b": {"group_name": "H200 pool", "gpu_type": "H200"}})
+        assert json.loads(cache_file.read_text())["lcg-b"]["gpu_type"] == "H200"
+
+        # Names saved after the map was built are still picked up
+        assert compute_groups.resolve_group_name("lcg-a", names) == "H100"
+        assert compute_groups.resolve_group_name("lcg-b", names) == "H200 pool"
+        assert compute_groups.resolve_group_name("lcg-c", names) == ""
+
+        monkeypatch.setattr(compute_groups, "_group_meta", None)
+        assert compute_groups.resolve_group_name("lcg-b", names) == "H200 pool"
+
+    def test_save_keeps_cached_fields_over_empty_values(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that empty or "Unknown" values do not overwrite cached metadata."""
+        monkeypatch.setattr(compute_groups, "GROUP_META_CACHE_FILE", tmp_path / "group_meta.json")
+        monkeypatch.setattr(compute_groups, "_group_meta", None)
+
+        compute_groups.save_group_meta({"lcg-a": {"group_name": "H200 pool", "gpu_type": ""}})
+        compute_groups.save_group_meta({"lcg-a": {"group_name": "", "gpu_type": "H200"}})
+        compute_groups.save_group_meta({"lcg-a": {"group_name": "Unknown", "gpu_type": "Unknown"}})
+
+        assert compute_groups.get_group_meta("lcg-a") == {
+            "group_name": "H200 pool",
+            "gpu_type": "H200",
+        }
+
+    def test_node_availability_records_group_meta(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that fetching node availability caches each group's name and GPU type."""
+        from inspire.cli.utils import resources
+
+        monkeypatch.setattr(compute_groups, "GROUP_META_CACHE_FILE", tmp_path / "group_meta.json")
+        monkeypatch.setattr(compute_groups, "_group_meta", None)
+        monkeypatch.setattr(resources, "_availability_cache", None)
+        monkeypatch.setattr(resources, "get_web_session", lambda **_kwargs: object())
+        node = {
+            "logic_compute_group_id": "lcg-a",
+            "logic_compute_group_name": "H200 pool",
+            "gpu_count": 8,
+            "gpu_info": {"gpu_type_display": "NVIDIA H200"},
+            "status": "READY",
+        }
+        monkeypatch.setattr(
+            resources, "fetch_workspace_availability", lambda *_args, **_kwargs: [node]
+        )
+
+        resources.fetch_resource_availability()
+
+        assert compute_groups.get_group_meta("lcg-a") == {
+            "group_name": "H200 pool",
+            "gpu_type": "NVIDIA H200",
+        }
+
+    def test_name_map_is_cached_and_read_only(self) -> None:
+        """Test that the name map is memoized and cannot be mutated."""
+        groups = (ComputeGroupDefinition(name="H100", compute_group_id="lcg-a", gpu_type="H100"),)
+
+        names = compute_group_name_map(groups)
+
+        assert compute_group_name_map(groups) is names
+        with pytest.raises(TypeError):
+            names["lcg-b"] = "other"  # type: ignore[index]
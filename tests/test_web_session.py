@@ -1,4 +1,5 @@
 import json
+import sys
 import pytest
 
 from inspire.cli.utils import web_session as ws
@@ -22,7 +23,7 @@ class DummyHTTP:
         self.response = response
         self.calls = []
 
-    def get(self, url, headers=None, timeout=None):  # noqa: ANN001
+    def get(self, url, headers=None, timeout=None, **_kwargs):  # noqa: ANN001
         self.calls.append(("GET", url, headers, timeout))
         return self.response
 
@@ -34,6 +35,16 @@ class DummyHTTP:
         pass
 
 
+class SequenceHTTP(DummyHTTP):
+    def __init__(self, responses: list) -> None:
+        super().__init__(None)
+        self.responses = list(responses)
+
+    def get(self, url, headers=None, timeout=None, **_kwargs):  # noqa: ANN001
+        self.calls.append(("GET", url, headers, timeout))
+        return self.responses.pop(0)
+
+
 class DummyBrowserClient:
     def __init__(self, payload):
         self.payload = payload
@@ -83,13 +94,14 @@ def test_request_json_falls_back_to_browser_client(monkeypatch: pytest.MonkeyPat
     browser = DummyBrowserClient({"ok": True})
 
     monkeypatch.setattr(ws, "build_requests_session", lambda _session, _url: http)
+    monkeypatch.setattr(ws, "_HTTP_SESSIONS", {})
     monkeypatch.setattr(ws, "_get_browser_client", lambda _session: browser)
-    monkeypatch.setattr(ws, "_BROWSER_API_FORCE_BROWSER", False)
+    monkeypatch.setattr(ws, "_BROWSER_ONLY_PREFIXES", set())
 
     result = ws.request_json(session, "GET", "https://example.test")
 
     assert result == {"ok": True}
-    assert ws._BROWSER_API_FORCE_BROWSER is True
+    assert ws._needs_browser("https://example.test")
     assert http.calls
     assert browser.calls
 
@@ -106,17 +118,75 @@ def test_request_json_non_json_triggers_fallback(monkeypatch: pytest.MonkeyPatch
     browser = DummyBrowserClient({"ok": True})
 
     monkeypatch.setattr(ws, "build_requests_session", lambda _session, _url: http)
+    monkeypatch.setattr(ws, "_HTTP_SESSIONS", {})
     monkeypatch.setattr(ws, "_get_browser_client", lambda _session: browser)
-    monkeypatch.setattr(ws, "_BROWSER_API_FORCE_BROWSER", False)
+    monkeypatch.setattr(ws, "_BROWSER_ONLY_PREFIXES", set())
 
     result = ws.request_json(session, "GET", "https://example.test")
 
     assert result == {"ok": True}
-    assert ws._BROWSER_API_FORCE_BROWSER is True
+    assert ws._needs_browser("https://example.test")
     assert http.calls
     assert browser.calls
 
 
+def test_request_json_renews_sso_cookies_without_browser(monkeypatch: pytest.MonkeyPatch):
+    session = WebSession(
+        storage_state={"cookies": [{"name": "session", "value": "abc"}]},
+        cookies={"session": "abc"},
+        workspace_id="ws-test",
+        created_at=0,
+    )
+
+    page = DummyResponse(200)
+    page.url = "https://example.test/jobs"
+    http = SequenceHTTP([DummyResponse(401), page, DummyResponse(200, payload={"ok": True})])
+
+    def no_browser(_session):
+        raise AssertionError("browser fallback should not be used")
+
+    monkeypatch.setattr(ws, "build_requests_session", lambda _session, _url: http)
+    monkeypatch.setattr(ws, "_HTTP_SESSIONS", {})
+    monkeypatch.setattr(ws, "_get_browser_client", no_browser)
+    monkeypatch.setattr(ws, "_BROWSER_ONLY_PREFIXES", set())
+
+    result = ws.request_json(
+        session,
+        "GET",
+        "https://example.test/api/v1/x",
+        headers={"Referer": "https://example.test/jobs"},
+    )
+
+    assert result == {"ok": True}
+    assert not ws._BROWSER_ONLY_PREFIXES
+    assert [call[1] for call in http.calls] == [
+        "https://example.test/api/v1/x",
+        "https://example.test/jobs",
+        "https://example.test/api/v1/x",
+    ]
+
+
+def test_requests_only_mode_leaves_renewal_to_serial_retry(monkeypatch: pytest.MonkeyPatch):
+    session = WebSession(storage_state={"cookies": []}, created_at=0)
+    http = DummyHTTP(DummyResponse(401))
+
+    def fail(*_args, **_kwargs):
+        raise AssertionError("prefetch workers must not renew or invalidate the shared session")
+
+    monkeypatch.setattr(ws, "build_requests_session", lambda _session, _url: http)
+    monkeypatch.setattr(ws, "_HTTP_SESSIONS", {})
+    monkeypatch.setattr(ws._ReAuthClient, "refresh", fail)
+    monkeypatch.setattr(ws, "_invalidate_http_session", fail)
+    monkeypatch.setattr(ws, "_BROWSER_ONLY_PREFIXES", set())
+    monkeypatch.setattr(ws._THREAD_STATE, "requests_only", True, raising=False)
+
+    with pytest.raises(ws.SessionExpiredError):
+        ws.request_json(session, "GET", "https://example.test/api/v1/x")
+
+    assert len(http.calls) == 1
+    assert not ws._BROWSER_ONLY_PREFIXES
+
+
 def test_browser_client_reset_on_expired(monkeypatch: pytest.MonkeyPatch):
     session = WebSession(
         storage_state={"cookies": [{"name": "session", "value": "abc"}]},
@@ -140,7 +210,7 @@ def test_browser_client_reset_on_expired(monkeypatch: pytest.MonkeyPatch):
 
     monkeypatch.setattr(ws, "_get_browser_client", lambda _session: ExpiringBrowserClient())
     monkeypatch.setattr(ws, "_close_browser_client", fake_close)
-    monkeypatch.setattr(ws, "_BROWSER_API_FORCE_BROWSER", True)
+    monkeypatch.setattr(ws, "_BROWSER_ONLY_PREFIXES", {"https://example.test"})
     monkeypatch.setattr(ws, "get_web_session", fake_get_web_session)
 
     with pytest.raises(ws.SessionExpiredError):
@@ -164,3 +234,263 @@ def test_browser_request_context_posts_json_bytes():
     assert json.loads(data) == {"a": 1}
     header_keys = {key.lower() for key in (headers or {})}
     assert "content-type" in header_keys
+
+
+def test_headless_browser_is_launched_only_on_demand(monkeypatch: pytest.MonkeyPatch):
+    launches = []
+
+    class FakeChromium:
+        def launch(self, **kwargs):
+            launches.append(kwargs)
+            return object()
+
+    class FakeDriver:
+        chromium = FakeChromium()
+
+    driver = FakeDriver()
+    monkeypatch.setattr(ws, "_PLAYWRIGHT", driver)
+    monkeypatch.setattr(ws, "_HEADLESS_BROWSER", None)
+    monkeypatch.setattr(ws, "get_playwright_proxy", lambda: None)
+
+    assert ws._get_playwright() is driver
+    assert launches == []
+
+    browser = ws._get_headless_browser()
+
+    assert ws._get_headless_browser() is browser
+    assert launches == [{"headless": True, "proxy": None}]
+
+
+def test_request_json_reuses_pooled_http_session(monkeypatch: pytest.MonkeyPatch):
+    session = WebSession(
+        storage_state={"cookies": [{"name": "session", "value": "abc"}]},
+        cookies={"session": "abc"},
+        workspace_id="ws-test",
+        created_at=0,
+    )
+
+    built = []
+
+    def fake_build(_session, _url):
+        http = DummyHTTP(DummyResponse(200, payload={"ok": True}))
+        built.append(http)
+        return http
+
+    monkeypatch.setattr(ws, "build_requests_session", fake_build)
+    monkeypatch.setattr(ws, "_HTTP_SESSIONS", {})
+    monkeypatch.setattr(ws, "_BROWSER_ONLY_PREFIXES", set())
+
+    assert ws.request_json(session, "GET", "https://example.test/a") == {"ok": True}
+    assert ws.request_json(session, "GET", "https://example.test/b") == {"ok": True}
+
+    assert len(built) == 1
+    assert [call[1] for call in built[0].calls] == [
+        "https://example.test/a",
+        "https://example.test/b",
+    ]
+
+
+def test_request_json_cache_ttl_reuses_recent_response(monkeypatch: pytest.MonkeyPatch):
+    session = WebSession(
+        storage_state={"cookies": [{"name": "session", "value": "abc"}]},
+        cookies={"session": "abc"},
+        workspace_id="ws-test",
+        created_at=0,
+    )
+
+    http = DummyHTTP(DummyResponse(200, payload={"ok": True}))
+
+    monkeypatch.setattr(ws, "build_requests_session", lambda _session, _url: http)
+    monkeypatch.setattr(ws, "_HTTP_SESSIONS", {})
+    monkeypatch.setattr(ws, "_RESPONSE_CACHE", ws.OrderedDict())
+    monkeypatch.setattr(ws, "_BROWSER_ONLY_PREFIXES", set())
+
+    url = "https://example.test/a"
+    assert ws.request_json(session, "GET", url, cache_ttl=10) == {"ok": True}
+    assert ws.request_json(session, "GET", url, cache_ttl=10) == {"ok": True}
+    assert len(http.calls) == 1
+
+    ws.request_json(session, "GET", url)
+    assert len(http.calls) == 2
+
+    ws.clear_response_cache()
+    ws.request_json(session, "GET", url, cache_ttl=10)
+    assert len(http.calls) == 3
+
+
+def _node_specs(name: str, busy_priorities: list[int]) -> dict:
+    return {
+        "data": {
+            "node_dimensions": [
+                {
+                    "gpu_count": 8,
+                    "tasks_associated": [],
+                    "logic_compute_group_name": name,
+                    "gpu_info": {"gpu_type_display": "H200"},
+                },
+                {
+                    "gpu_count": 8,
+                    "tasks_associated": [{"priority": p} for p in busy_priorities],
+                },
+            ]
+        }
+    }
+
+
+def test_fetch_gpu_availability_keeps_order_and_skips_failures(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture
+):
+    session = WebSession(storage_state={"cookies": []}, created_at=0)
+    calls = []
+
+    def fake_fetch(_session, group_id, _base_url):
+        calls.append(group_id)
+        if group_id == "lcg-bad":
+            raise ValueError("API returned 500")
+        return _node_specs(f"name-{group_id}", [1, 9])
+
+    saved = {}
+    monkeypatch.setattr(ws, "fetch_node_specs", fake_fetch)
+    monkeypatch.setattr(ws, "save_group_meta", saved.update)
+    monkeypatch.setattr(ws, "_BROWSER_ONLY_PREFIXES", set())
+
+    results = ws.fetch_gpu_availability(session, ["lcg-a", "lcg-bad", "lcg-b"])
+
+    assert [r.group_id for r in results] == ["lcg-a", "lcg-b"]
+    assert results[0].group_name == "name-lcg-a"
+    assert results[0].gpu_type == "H200"
+    assert (results[0].total_gpus, results[0].free_gpus, results[0].low_priority_gpus) == (16, 8, 1)
+    # The failed group is retried once serially before being skipped
+    assert calls.count("lcg-bad") == 2
+    assert "Failed to fetch lcg-bad" in capsys.readouterr().out
+    assert saved["lcg-b"] == {"group_name": "name-lcg-b", "gpu_type": "H200"}
+
+
+def test_session_fingerprint_is_cached_until_save(
+    monkeypatch: pytest.MonkeyPatch, tmp_path
+):
+    session = WebSession(
+        storage_state={"cookies": [{"name": "session", "value": "abc"}]},
+        created_at=0,
+    )
+    first = session.fingerprint()
+
+    session.storage_state["cookies"][0]["value"] = "changed"
+    assert session.fingerprint() == first
+
+    monkeypatch.setattr(ws, "SESSION_CACHE_FILE", tmp_path / "web_session.json")
+    session.save()
+    assert session.fingerprint() != first
+    assert "_fingerprint" not in session.to_dict()
+
+
+def test_session_save_writes_private_file(monkeypatch: pytest.MonkeyPatch, tmp_path):
+    cache_file = tmp_path / "web_session.json"
+    monkeypatch.setattr(ws, "SESSION_CACHE_FILE", cache_file)
+    # A leftover world-readable temp file must not lend its mode to the cache
+    stale = cache_file.with_suffix(".tmp")
+    stale.write_text("{}")
+    stale.chmod(0o644)
+
+    session = WebSession(storage_state={"cookies": []}, workspace_id="ws-test", created_at=1.0)
+    session.save()
+
+    assert cache_file.stat().st_mode & 0o777 == 0o600
+    assert not stale.exists()
+    assert WebSession.load(allow_expired=True).workspace_id == "ws-test"
+
+
+def test_cookie_jar_defaults_domain_and_path():
+    session = WebSession(
+        storage_state={
+            "cookies": [
+                {"name": "sso", "value": "1", "domain": ".example.test", "path": "/auth"},
+                {"name": "app", "value": "2"},
+                {"name": "", "value": "ignored"},
+            ]
+        },
+        created_at=0,
+    )
+
+    jar = ws._cookie_jar_from_session(session, "https://qz.example.test/jobs")
+
+    assert sorted((c.name, c.value, c.domain, c.path) for c in jar) == [
+        ("app", "2", "qz.example.test", "/"),
+        ("sso", "1", ".example.test", "/auth"),
+    ]
+
+
+def test_session_load_reuses_parse_until_file_changes(monkeypatch: pytest.MonkeyPatch, tmp_path):
+    cache_file = tmp_path / "web_session.json"
+    monkeypatch.setattr(ws, "SESSION_CACHE_FILE", cache_file)
+    monkeypatch.setattr(ws, "_LAST_LOAD", None)
+    WebSession(storage_state={"cookies": []}, workspace_id="ws-a", created_at=1.0).save()
+
+    parses = []
+    real_loads = ws._json_loads
+    monkeypatch.setattr(ws, "_json_loads", lambda data: parses.append(1) or real_loads(data))
+
+    first = WebSession.load(allow_expired=True)
+    first.workspace_id = "mutated"
+    second = WebSession.load(allow_expired=True)
+    assert WebSession.load() is None  # expired, served from the same parse
+    assert len(parses) == 1
+    assert second.workspace_id == "ws-a"
+
+    WebSession(storage_state={"cookies": []}, workspace_id="ws-b", created_at=2.0).save()
+    assert WebSession.load(allow_expired=True).workspace_id == "ws-b"
+    assert len(parses) == 2
+
+
+def test_fetch_workspace_availability_stream_without_ijson(monkeypatch: pytest.MonkeyPatch):
+    session = WebSession(
+        storage_state={"cookies": [{"name": "session", "value": "abc"}]},
+        workspace_id="ws-test",
+        created_at=0,
+    )
+    calls = []
+
+    def fake_request_json(_session, method, url, **kwargs):
+        calls.append((method, url, kwargs["body"]))
+        return {"data": {"nodes": [{"name": "n1"}, {"name": "n2"}]}}
+
+    monkeypatch.setitem(sys.modules, "ijson", None)
+    monkeypatch.setattr(ws, "request_json", fake_request_json)
+
+    nodes = ws.fetch_workspace_availability(session, base_url="https://example.test", stream=True)
+
+    assert not calls  # nothing is fetched until the iterator is consumed
+    assert [n["name"] for n in nodes] == ["n1", "n2"]
+    assert calls[0][:2] == ("POST", "https://example.test/api/v1/cluster_nodes/list")
+
+
+def test_browser_fallback_is_scoped_to_api_section(monkeypatch: pytest.MonkeyPatch):
+    session = WebSession(
+        storage_state={"cookies": [{"name": "session", "value": "abc"}]},
+        cookies={"session": "abc"},
+        workspace_id="ws-test",
+        created_at=0,
+    )
+
+    class RoutedHTTP(DummyHTTP):
+        def get(self, url, headers=None, timeout=None, **_kwargs):  # noqa: ANN001
+            self.calls.append(("GET", url, headers, timeout))
+            if "/api/v1/notebook/" in url:
+                return DummyResponse(401)
+            return DummyResponse(200, payload={"via": "http"})
+
+    http = RoutedHTTP(None)
+    browser = DummyBrowserClient({"via": "browser"})
+
+    monkeypatch.setattr(ws, "build_requests_session", lambda _session, _url: http)
+    monkeypatch.setattr(ws, "_HTTP_SESSIONS", {})
+    monkeypatch.setattr(ws, "_get_browser_client", lambda _session: browser)
+    monkeypatch.setattr(ws, "_BROWSER_ONLY_PREFIXES", set())
+
+    base = "https://example.test/api/v1"
+    assert ws.request_json(session, "GET", f"{base}/notebook/list") == {"via": "browser"}
+    assert ws._BROWSER_ONLY_PREFIXES == {f"{base}/notebook"}
+
+    assert ws.request_json(session, "GET", f"{base}/notebook/detail") == {"via": "browser"}
+    assert ws.request_json(session, "GET", f"{base}/train_job/list") == {"via": "http"}
+    assert [call[1] for call in browser.calls] == [f"{base}/notebook/list", f"{base}/notebook/detail"]